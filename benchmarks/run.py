@@ -0,0 +1,403 @@
+# benchmarks/run.py
+"""Headless benchmark suite.
+
+Run from the project root:
+
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --baseline bench.json   # flag regressions
+
+Everything runs against a throwaway database in a temp directory and with
+SDL's dummy video driver, so no window opens and the real save is untouched.
+"""
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# name -> (function taking the context, default repeat count)
+BENCHMARKS = {}
+
+
+def benchmark(name, repeat=20):
+    def register(func):
+        BENCHMARKS[name] = (func, repeat)
+        return func
+    return register
+
+
+class Context:
+    """Shared fixtures: a populated temp database plus a pygame screen and font"""
+
+    def __init__(self, workdir):
+        import pygame
+        from database.database import FootballDB
+        from controllers.league_table import LeagueTable
+        from controllers.fixtures import FixtureList
+        from views.text_cache import load_font
+
+        self.workdir = workdir
+        self.db = FootballDB(os.path.join(workdir, 'bench.db'))
+        self.db.generate_all_teams_squads()
+        self.league_table = LeagueTable(self.db)
+        for division_id in range(1, 5):
+            self.league_table.initialize_league_table(division_id)
+        FixtureList(self.db).generate_season(1)
+        with self.db.connect_readonly() as conn:
+            self.team_ids = [row[0] for row in conn.execute("SELECT id FROM teams ORDER BY id")]
+
+        pygame.display.init()
+        pygame.font.init()
+        self.screen = pygame.display.set_mode((1024, 768))
+        self.font = load_font(os.path.join('assets', 'fonts', 'C64_Pro-STYLE.ttf'), 12)
+
+
+@benchmark('initialize_database', repeat=5)
+def bench_initialize_database(ctx):
+    from database.database import FootballDB
+    db = FootballDB(os.path.join(ctx.workdir, 'init.db'))
+    return lambda: db.initialize_database()
+
+
+@benchmark('create_database_from_template', repeat=10)
+def bench_create_database_from_template(ctx):
+    from database.database import FootballDB
+    path = os.path.join(ctx.workdir, 'template_copy.db')
+
+    def run():
+        if os.path.exists(path):
+            os.remove(path)
+        FootballDB(path).close()
+    return run
+
+
+@benchmark('startup_first_frame', repeat=5)
+def bench_startup_first_frame(ctx):
+    """Wall time from launching main.py to its first drawn frame, interpreter start included"""
+    import subprocess
+    command = [sys.executable, os.path.join(ROOT, 'main.py'), '--first-frame']
+
+    def run():
+        subprocess.run(command, cwd=ROOT, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return run
+
+
+@benchmark('import_players_ndjson_10k', repeat=5)
+def bench_import_players_ndjson(ctx):
+    """Stream 10,000 players from an NDJSON file into a separate database"""
+    import json
+    from database.database import FootballDB
+    from database.importer import DatabaseImporter
+
+    path = os.path.join(ctx.workdir, 'players.ndjson')
+    with open(path, 'w') as file:
+        for i in range(10000):
+            file.write(json.dumps({
+                'first_name': f"First{i}", 'last_name': f"Last{i}", 'team_id': ctx.team_ids[i % len(ctx.team_ids)],
+                'age': 17 + i % 20, 'position': ('GK', 'DEF', 'MID', 'ATT')[i % 4],
+                'attacking': 1 + i % 99, 'defending': 1 + i * 7 % 99, 'goalkeeping': 1 + i * 13 % 99,
+                'stamina': 1 + i * 17 % 99, 'speed': 1 + i * 19 % 99,
+            }) + "\n")
+    importer = DatabaseImporter(FootballDB(os.path.join(ctx.workdir, 'import.db')))
+
+    def run():
+        importer.clear(['players'])
+        importer.import_file(path)
+    return run
+
+
+@benchmark('transfer_search', repeat=50)
+def bench_transfer_search(ctx):
+    from controllers.transfer_market import TransferMarket
+    market = TransferMarket(ctx.db)
+    return lambda: market.search(position='MID', min_rating=60, max_age=30, max_value=20000000)
+
+
+@benchmark('ai_transfer_window', repeat=5)
+def bench_ai_transfer_window(ctx):
+    """One AI window, each run on a fresh copy of the benchmark database"""
+    from database.database import FootballDB
+    from controllers.transfer_market import TransferMarket
+
+    db = FootballDB(os.path.join(ctx.workdir, 'market.db'))
+    market = TransferMarket(db)
+
+    def run():
+        ctx.db.connect().backup(db.connect())
+        market.ai_window()
+    return run
+
+
+@benchmark('player_search_pages', repeat=20)
+def bench_player_search_pages(ctx):
+    """Page through 20 pages by value with a cold cache, then once more from the cache"""
+    from controllers.player_search import PlayerSearch
+    search = PlayerSearch(ctx.db)
+
+    def run():
+        search.cache.clear()
+        for _ in range(2):
+            after = None
+            for _ in range(20):
+                page = search.page('value', after=after)
+                after = search.page_key(page[-1], 'value')
+    return run
+
+
+@benchmark('load_name_pool', repeat=50)
+def bench_load_name_pool(ctx):
+    """Name pool from its compiled cache, as a fresh process would load it"""
+    from database import name_pool
+
+    def run():
+        name_pool._pools.clear()
+        name_pool.load_name_pool()
+    return run
+
+
+@benchmark('generate_all_teams_squads', repeat=5)
+def bench_generate_all_teams_squads(ctx):
+    return lambda: ctx.db.generate_all_teams_squads()
+
+
+@benchmark('get_team_players_all_teams')
+def bench_get_team_players(ctx):
+    def run():
+        for team_id in ctx.team_ids:
+            ctx.db.get_team_players(team_id)
+    return run
+
+
+@benchmark('auto_select_team_all_teams', repeat=5)
+def bench_auto_select_team(ctx):
+    from controllers.team_selection import TeamSelection
+    selection = TeamSelection(ctx.db)
+
+    def run():
+        for team_id in ctx.team_ids:
+            selection.auto_select_team(team_id)
+    return run
+
+
+@benchmark('auto_select_teams_bulk', repeat=5)
+def bench_auto_select_teams_bulk(ctx):
+    """Every club's XI picked and saved in one transaction"""
+    from controllers.team_selection import TeamSelection
+    selection = TeamSelection(ctx.db)
+    return lambda: selection.auto_select_teams(ctx.team_ids)
+
+
+@benchmark('generate_season_fixtures', repeat=10)
+def bench_generate_season_fixtures(ctx):
+    from controllers.fixtures import FixtureList
+    fixture_list = FixtureList(ctx.db)
+    return lambda: fixture_list.generate_season(1)
+
+
+@benchmark('get_league_table_cold')
+def bench_league_table_cold(ctx):
+    from controllers.league_table import LeagueTable
+
+    def run():
+        league_table = LeagueTable(ctx.db)
+        for division_id in range(1, 5):
+            league_table.get_league_table(division_id)
+    return run
+
+
+@benchmark('get_league_table_cached', repeat=200)
+def bench_league_table_cached(ctx):
+    def run():
+        for division_id in range(1, 5):
+            ctx.league_table.get_league_table(division_id)
+    return run
+
+
+def view_factories(ctx):
+    """name -> callable building a view of that class"""
+    from views.menu_view import MenuView
+    from views.division_select_view import DivisionSelectView
+    from views.team_select_view import TeamSelectView
+    from views.game_menu_view import GameMenuView
+    from views.team_submenu_view import TeamSubmenuView
+    from views.team_view import TeamView
+    from views.player_view import PlayerView
+    from views.player_selection_view import PlayerSelectionView
+    from views.league_table_view import LeagueTableView
+    from views.fixtures_view import FixturesView
+
+    team_id = ctx.team_ids[0]
+    return {
+        'MenuView': lambda: MenuView(ctx.screen, ctx.font),
+        'DivisionSelectView': lambda: DivisionSelectView(ctx.screen, ctx.font, ctx.db),
+        'TeamSelectView': lambda: TeamSelectView(ctx.screen, ctx.font, 1, ctx.db),
+        'GameMenuView': lambda: GameMenuView(ctx.screen, ctx.font, team_id),
+        'TeamSubmenuView': lambda: TeamSubmenuView(ctx.screen, ctx.font, team_id),
+        'TeamView': lambda: TeamView(ctx.screen, ctx.font, team_id, ctx.db),
+        'PlayerView': lambda: PlayerView(ctx.screen, ctx.font, ctx.db.get_team_players(team_id)[0]),
+        'PlayerSelectionView': lambda: PlayerSelectionView(ctx.screen, ctx.font, team_id, ctx.db),
+        'LeagueTableView': lambda: LeagueTableView(ctx.screen, ctx.font, 1, ctx.db, ctx.league_table),
+        'FixturesView': lambda: FixturesView(ctx.screen, ctx.font, team_id, ctx.db),
+    }
+
+
+VIEW_NAMES = ('MenuView', 'DivisionSelectView', 'TeamSelectView', 'GameMenuView', 'TeamSubmenuView',
+              'TeamView', 'PlayerView', 'PlayerSelectionView', 'LeagueTableView', 'FixturesView')
+
+
+def register_view_benchmarks():
+    for view_name in VIEW_NAMES:
+        def bench_draw(ctx, view_name=view_name):
+            view = view_factories(ctx)[view_name]()
+            return view.draw
+        benchmark(f'draw_{view_name}', repeat=200)(bench_draw)
+
+
+register_view_benchmarks()
+
+
+@benchmark('navigate_team_menus', repeat=200)
+def bench_navigate_team_menus(ctx):
+    """Back and forth between the team submenu and the squad through the view router"""
+    from views.view_router import ViewRouter
+    from views.team_submenu_view import TeamSubmenuView
+    from views.team_view import TeamView
+
+    team_id = ctx.team_ids[0]
+    router = ViewRouter(ctx.db, {
+        'TeamSubmenuView': lambda key: TeamSubmenuView(ctx.screen, ctx.font, key),
+        'TeamView': lambda key: TeamView(ctx.screen, ctx.font, key, ctx.db),
+    }, static=('TeamSubmenuView',))
+
+    def run():
+        for _ in range(10):
+            router.show('TeamView', team_id)
+            router.show('TeamSubmenuView', team_id)
+    return run
+
+
+@benchmark('page_large_team_list', repeat=50)
+def bench_page_large_team_list(ctx):
+    """Page and type-to-jump through 500 teams, drawing the visible rows each step"""
+    import pygame
+    from views.team_select_view import TeamSelectView
+    from views.virtual_list import VirtualList
+
+    view = TeamSelectView(ctx.screen, ctx.font, 1, ctx.db)
+    teams = [{'id': i, 'name': f"{team['name']} {i}"} for i, team in enumerate(view.teams * 25)][:500]
+    teams.sort(key=lambda team: team['name'])
+    view.teams = teams
+    view.list = VirtualList(teams, view.visible_teams, ctx.font, lambda team: [team['name']])
+    keys = [pygame.K_PAGEDOWN] * 20 + [pygame.K_HOME, pygame.K_m, pygame.K_m, pygame.K_END, pygame.K_PAGEUP]
+
+    def run():
+        for key in keys:
+            view.handle_input(key)
+            view.draw()
+    return run
+
+
+def measure(run, repeat):
+    """Time repeat calls of run, then one more under tracemalloc for peak memory"""
+    run()  # Warm up caches and prepared statements
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    samples.sort()
+    return {
+        'repeat': repeat,
+        'mean_ms': statistics.fmean(samples),
+        'p95_ms': samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        'min_ms': samples[0],
+        'peak_kb': peak / 1024,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Return (name, baseline mean, current mean) for every regression past threshold"""
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get('results', {}).get(name)
+        if previous and result['mean_ms'] > previous['mean_ms'] * (1 + threshold):
+            regressions.append((name, previous['mean_ms'], result['mean_ms']))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the headless benchmark suite")
+    parser.add_argument('--only', nargs='*', help="benchmark names (or prefixes) to run")
+    parser.add_argument('--repeat', type=int, help="override every benchmark's repeat count")
+    parser.add_argument('--output', help="write results as JSON to this file")
+    parser.add_argument('--baseline', help="JSON results to compare against")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="mean slowdown vs baseline that counts as a regression (default 0.25)")
+    parser.add_argument('--list', action='store_true', help="list benchmark names and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+
+    # Report paths are relative to where the suite was started, not the project root
+    output = os.path.abspath(args.output) if args.output else None
+    baseline_path = os.path.abspath(args.baseline) if args.baseline else None
+    os.chdir(ROOT)  # Fonts and player names are loaded relative to the project root
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+
+    names = [name for name in BENCHMARKS
+             if not args.only or any(name.startswith(prefix) for prefix in args.only)]
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir, open(os.devnull, 'w') as quiet:
+        # Keep the game's debug prints out of the report
+        with contextlib.redirect_stdout(quiet):
+            ctx = Context(workdir)
+        for name in names:
+            func, repeat = BENCHMARKS[name]
+            with contextlib.redirect_stdout(quiet):
+                results[name] = measure(func(ctx), args.repeat or repeat)
+            r = results[name]
+            print(f"{name:36} mean {r['mean_ms']:9.3f} ms  p95 {r['p95_ms']:9.3f} ms  "
+                  f"peak {r['peak_kb']:9.1f} KB")
+        ctx.db.close()
+
+    report = {
+        'python': sys.version.split()[0],
+        'platform': sys.platform,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }
+    if output:
+        with open(output, 'w') as file:
+            json.dump(report, file, indent=2)
+        print(f"Wrote {output}")
+
+    if baseline_path:
+        with open(baseline_path) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.threshold)
+        for name, before, after in regressions:
+            print(f"REGRESSION {name}: {before:.3f} ms -> {after:.3f} ms ({after / before - 1:+.0%})")
+        if regressions:
+            return 1
+        print("No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
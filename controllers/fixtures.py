@@ -0,0 +1,215 @@
+import logging
+import random
+import time
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from controllers.instrumentation import instrument_methods
+
+FIRST_SEASON_YEAR = 2024
+SEASON_START = (8, 1)   # Month and day; the first matchday is the next Saturday
+MIDWEEK_EVERY = 5       # Every fifth matchday is played on the Tuesday before
+
+
+def round_robin(team_ids: List[int]) -> List[List[Tuple[int, int]]]:
+    """Build a double round-robin schedule with the circle method.
+
+    Returns one list of (home_id, away_id) pairs per matchday. Odd-sized
+    divisions get a bye each round. Venues alternate round by round, and the
+    second half of the season repeats the first with home and away swapped.
+    """
+    teams = list(team_ids)
+    if len(teams) % 2:
+        teams.append(None)  # Bye
+    rounds = len(teams) - 1
+    half = len(teams) // 2
+    first_half = []
+    for round_index in range(rounds):
+        matchday = []
+        for i in range(half):
+            home, away = teams[i], teams[-1 - i]
+            if home is None or away is None:
+                continue
+            # Flip every pairing on odd rounds so no side stays home or away for long
+            if round_index % 2:
+                home, away = away, home
+            matchday.append((home, away))
+        first_half.append(matchday)
+        # Rotate every team except the first
+        teams.insert(1, teams.pop())
+    second_half = [[(away, home) for home, away in matchday] for matchday in first_half]
+    return first_half + second_half
+
+
+def matchday_dates(season: int, matchdays: int) -> List[str]:
+    """ISO dates for matchdays 1..matchdays: weekly Saturdays plus midweek rounds"""
+    start = date(FIRST_SEASON_YEAR + season - 1, *SEASON_START)
+    day = start + timedelta(days=(5 - start.weekday()) % 7)  # First Saturday
+    dates = []
+    for matchday in range(1, matchdays + 1):
+        if matchday > 1:
+            if matchday % MIDWEEK_EVERY == 0:
+                day += timedelta(days=3)    # Saturday -> Tuesday
+            elif (matchday - 1) % MIDWEEK_EVERY == 0:
+                day += timedelta(days=4)    # Tuesday -> Saturday
+            else:
+                day += timedelta(days=7)
+        dates.append(day.isoformat())
+    return dates
+
+
+@instrument_methods()
+class FixtureList:
+    """Every division's fixtures for a season, stored in the fixtures table.
+
+    A whole season is scheduled with the circle method and written with one
+    executemany. Scores stay NULL until a fixture is played.
+    """
+    INSERT_SQL = """
+        INSERT INTO fixtures (season, division_id, matchday, match_date, home_team_id, away_team_id)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+    RECORD_RESULT_SQL = "UPDATE fixtures SET home_goals = ?, away_goals = ? WHERE id = ?"
+    FIXTURE_SQL = """
+        SELECT f.id, f.season, f.division_id, f.matchday, f.match_date,
+               f.home_team_id, h.name as home_team,
+               f.away_team_id, a.name as away_team,
+               f.home_goals, f.away_goals
+        FROM fixtures f
+        JOIN teams h ON f.home_team_id = h.id
+        JOIN teams a ON f.away_team_id = a.id
+    """
+    MATCHDAY_SQL = FIXTURE_SQL + """
+        WHERE f.season = ? AND f.matchday = ?
+        ORDER BY f.division_id, f.id
+    """
+    # Each side of the UNION walks its own team index in matchday order
+    NEXT_FIXTURE_SQL = FIXTURE_SQL + """
+        WHERE f.id = (
+            SELECT id FROM (
+                SELECT id, matchday FROM fixtures
+                WHERE home_team_id = ? AND season = ? AND home_goals IS NULL
+                UNION ALL
+                SELECT id, matchday FROM fixtures
+                WHERE away_team_id = ? AND season = ? AND home_goals IS NULL
+            )
+            ORDER BY matchday
+            LIMIT 1
+        )
+    """
+    TEAM_FIXTURES_SQL = FIXTURE_SQL + """
+        WHERE f.id IN (
+            SELECT id FROM fixtures WHERE home_team_id = ? AND season = ?
+            UNION ALL
+            SELECT id FROM fixtures WHERE away_team_id = ? AND season = ?
+        )
+        ORDER BY f.matchday
+    """
+
+    def __init__(self, db):
+        self.db = db
+
+    def current_season(self) -> int:
+        """Latest season with fixtures, 1 before any have been generated"""
+        with self.db.connect_readonly() as conn:
+            row = conn.execute("SELECT MAX(season) FROM fixtures").fetchone()
+        return row[0] or 1
+
+    def has_season(self, season: int) -> bool:
+        with self.db.connect_readonly() as conn:
+            return conn.execute("SELECT 1 FROM fixtures WHERE season = ? LIMIT 1", (season,)).fetchone() is not None
+
+    def ensure_season(self, season: int = None) -> int:
+        """Generate the season's fixtures if it has none yet; returns the season"""
+        season = season or self.current_season()
+        if not self.has_season(season):
+            self.generate_season(season)
+        return season
+
+    def generate_season(self, season: int = 1, seed=None) -> int:
+        """Schedule every division for a season in one transaction.
+
+        Replaces any fixtures the season already had. seed shuffles the
+        team order so each season's schedule differs; returns the number
+        of fixtures written.
+        """
+        start = time.perf_counter()
+        with self.db.connect_readonly() as conn:
+            rows = self.schedule_rows(season, self.teams_by_division(conn), seed)
+
+        with self.db.connect() as conn:
+            conn.execute("DELETE FROM fixtures WHERE season = ?", (season,))
+            conn.executemany(self.INSERT_SQL, rows)
+        elapsed = (time.perf_counter() - start) * 1000
+        logging.info(f"Generated {len(rows)} fixtures for season {season} in {elapsed:.1f} ms")
+        return len(rows)
+
+    @staticmethod
+    def teams_by_division(conn) -> Dict[int, List[int]]:
+        """division_id -> team ids, read through the given connection or cursor"""
+        teams_by_division = {}
+        for division_id, team_id in conn.execute("SELECT division_id, id FROM teams ORDER BY division_id, id"):
+            teams_by_division.setdefault(division_id, []).append(team_id)
+        return teams_by_division
+
+    @staticmethod
+    def schedule_rows(season: int, teams_by_division: Dict[int, List[int]], seed=None) -> List[tuple]:
+        """INSERT_SQL parameter tuples for a whole season, without touching the database"""
+        rng = random.Random(seed)
+        rows = []
+        for division_id, team_ids in teams_by_division.items():
+            team_ids = list(team_ids)
+            rng.shuffle(team_ids)
+            schedule = round_robin(team_ids)
+            dates = matchday_dates(season, len(schedule))
+            for matchday, (pairs, match_date) in enumerate(zip(schedule, dates), start=1):
+                rows.extend((season, division_id, matchday, match_date, home, away) for home, away in pairs)
+        return rows
+
+    def fixtures_on_matchday(self, matchday: int, season: int = None,
+                             division_id: int = None) -> List[Dict]:
+        """All fixtures on a matchday, optionally for one division only"""
+        season = season or self.current_season()
+        with self.db.connect_readonly() as conn:
+            rows = conn.execute(self.MATCHDAY_SQL, (season, matchday)).fetchall()
+        return [dict(row) for row in rows if division_id is None or row['division_id'] == division_id]
+
+    def next_fixture(self, team_id: int, season: int = None) -> Optional[Dict]:
+        """The team's first unplayed fixture, or None once its season is over"""
+        season = season or self.current_season()
+        with self.db.connect_readonly() as conn:
+            row = conn.execute(self.NEXT_FIXTURE_SQL, (team_id, season, team_id, season)).fetchone()
+        return dict(row) if row else None
+
+    def team_fixtures(self, team_id: int, season: int = None) -> List[Dict]:
+        """Every fixture of the team's season in matchday order"""
+        season = season or self.current_season()
+        with self.db.connect_readonly() as conn:
+            rows = conn.execute(self.TEAM_FIXTURES_SQL, (team_id, season, team_id, season)).fetchall()
+        return [dict(row) for row in rows]
+
+    def unplayed(self, season: int = None) -> List[Tuple[int, int, int, int, int]]:
+        """(fixture_id, division_id, matchday, home_id, away_id) for every unplayed fixture"""
+        season = season or self.current_season()
+        with self.db.connect_readonly() as conn:
+            rows = conn.execute("""
+                SELECT id, division_id, matchday, home_team_id, away_team_id
+                FROM fixtures
+                WHERE season = ? AND home_goals IS NULL
+                ORDER BY division_id, matchday, id
+            """, (season,)).fetchall()
+        return [tuple(row) for row in rows]
+
+    def record_results(self, results: List[Tuple[int, int, int]], cursor=None):
+        """Store (fixture_id, home_goals, away_goals) scores in one transaction.
+
+        Pass a cursor to write inside the caller's transaction instead.
+        """
+        if not results:
+            return
+        rows = [(home_goals, away_goals, fixture_id) for fixture_id, home_goals, away_goals in results]
+        if cursor is not None:
+            cursor.executemany(self.RECORD_RESULT_SQL, rows)
+        else:
+            with self.db.connect() as conn:
+                conn.executemany(self.RECORD_RESULT_SQL, rows)
@@ -0,0 +1,141 @@
+import functools
+import os
+import re
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+
+class Instrumentation:
+    """Opt-in call counts, cumulative time and row counts per hot spot.
+
+    Disabled by default; every hook checks `enabled` first so the cost when
+    off is one attribute lookup. Turn it on with enable(), the
+    FM_INSTRUMENT=1 environment variable or `main.py --instrument`.
+    """
+
+    def __init__(self):
+        self.enabled = os.environ.get('FM_INSTRUMENT') == '1'
+        self.stats = {}  # name -> [calls, total seconds, rows]
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        self.stats.clear()
+
+    def record(self, name: str, elapsed: float, rows: int = 0):
+        entry = self.stats.get(name)
+        if entry is None:
+            entry = self.stats[name] = [0, 0.0, 0]
+        entry[0] += 1
+        entry[1] += elapsed
+        entry[2] += rows
+
+    @contextmanager
+    def timed(self, name: str):
+        """Time a block: `with instrumentation.timed('frame.draw'): ...`"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def hot_spots(self, limit: int = 10, prefix: str = None) -> List[Tuple[str, int, float, int]]:
+        """Return the top (name, calls, total seconds, rows) entries by total time"""
+        entries = [(name, calls, total, rows) for name, (calls, total, rows) in self.stats.items()
+                   if prefix is None or name.startswith(prefix)]
+        entries.sort(key=lambda entry: entry[2], reverse=True)
+        return entries[:limit]
+
+    def report(self, limit: int = 20) -> str:
+        lines = [f"{'name':60} {'calls':>8} {'total ms':>10} {'avg ms':>8} {'rows':>8}"]
+        for name, calls, total, rows in self.hot_spots(limit):
+            lines.append(f"{name[:60]:60} {calls:8} {total * 1000:10.1f} {total * 1000 / calls:8.3f} {rows:8}")
+        return "\n".join(lines)
+
+
+# Shared by the database, controllers and game loop
+instrumentation = Instrumentation()
+
+
+def _row_count(result) -> int:
+    return len(result) if isinstance(result, list) else 0
+
+
+def instrumented(name: str = None):
+    """Decorator recording calls, time and returned row counts for a function"""
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not instrumentation.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            instrumentation.record(label, time.perf_counter() - start, _row_count(result))
+            return result
+        return wrapper
+    return decorate
+
+
+def instrument_methods(exclude: Tuple[str, ...] = ()):
+    """Class decorator applying @instrumented to every public plain method"""
+    def decorate(cls):
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith('_') or attr in exclude or not callable(value):
+                continue
+            if isinstance(value, (staticmethod, classmethod, property, type)):
+                continue
+            setattr(cls, attr, instrumented(f"{cls.__name__}.{attr}")(value))
+        return cls
+    return decorate
+
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def _statement_name(sql: str) -> str:
+    return "sql: " + _WHITESPACE.sub(' ', sql).strip()[:80]
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Cursor that records time and affected rows for each statement"""
+
+    def execute(self, sql, parameters=()):
+        if not instrumentation.enabled:
+            return super().execute(sql, parameters)
+        start = time.perf_counter()
+        result = super().execute(sql, parameters)
+        instrumentation.record(_statement_name(sql), time.perf_counter() - start, max(self.rowcount, 0))
+        return result
+
+    def executemany(self, sql, seq_of_parameters):
+        if not instrumentation.enabled:
+            return super().executemany(sql, seq_of_parameters)
+        start = time.perf_counter()
+        result = super().executemany(sql, seq_of_parameters)
+        instrumentation.record(_statement_name(sql), time.perf_counter() - start, max(self.rowcount, 0))
+        return result
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """Connection whose cursors (including conn.execute shortcuts) are instrumented"""
+
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
@@ -0,0 +1,98 @@
+import itertools
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Optional
+
+import pygame
+
+# progress(fraction, message) callback handed to every job function
+Progress = Callable[[float, Optional[str]], None]
+
+
+class Job:
+    """One queued task and, once finished, its result or error"""
+    _ids = itertools.count(1)
+
+    def __init__(self, name: str, func: Callable[[Progress], Any], on_done: Callable[['Job'], None] = None):
+        self.id = next(self._ids)
+        self.name = name
+        self.func = func
+        self.on_done = on_done
+        self.result = None
+        self.error = None
+        self.fraction = 0.0
+        self.message = None
+        self.elapsed_ms = None
+
+
+class JobScheduler:
+    """Runs long tasks on a worker thread, away from the pygame loop.
+
+    Jobs run one at a time in submission order. Progress and completion
+    come back to the game loop as pygame events (PROGRESS_EVENT and
+    DONE_EVENT, both carrying job_id). handle_event() then runs the job's
+    on_done callback on the UI thread, so only the UI thread switches views.
+    The worker gets its own SQLite connections from FootballDB.
+    """
+    PROGRESS_EVENT = pygame.USEREVENT + 1
+    DONE_EVENT = pygame.USEREVENT + 2
+
+    def __init__(self, post: Callable[[pygame.event.Event], Any] = None):
+        self.post = post or pygame.event.post
+        self.queue = queue.Queue()
+        self.jobs = {}  # job_id -> Job, until its DONE_EVENT is handled
+        self.worker = None
+
+    def submit(self, name: str, func: Callable[[Progress], Any],
+               on_done: Callable[[Job], None] = None) -> Job:
+        """Queue func(progress) to run on the worker thread"""
+        job = Job(name, func, on_done)
+        self.jobs[job.id] = job
+        if self.worker is None or not self.worker.is_alive():
+            self.worker = threading.Thread(target=self._work, name="job-worker", daemon=True)
+            self.worker.start()
+        self.queue.put(job)
+        return job
+
+    @property
+    def busy(self) -> bool:
+        return bool(self.jobs)
+
+    def _work(self):
+        while True:
+            job = self.queue.get()
+            if job is None:
+                break
+            self._run(job)
+
+    def _run(self, job: Job):
+        def progress(fraction: float, message: str = None):
+            job.fraction = fraction
+            job.message = message
+            self.post(pygame.event.Event(self.PROGRESS_EVENT, job_id=job.id,
+                                         fraction=fraction, message=message))
+
+        start = time.perf_counter()
+        try:
+            job.result = job.func(progress)
+        except Exception as e:
+            logging.exception(f"Job {job.name} failed")
+            job.error = str(e) or type(e).__name__
+        job.elapsed_ms = (time.perf_counter() - start) * 1000
+        logging.info(f"Job {job.name} finished in {job.elapsed_ms:.1f} ms")
+        self.post(pygame.event.Event(self.DONE_EVENT, job_id=job.id))
+
+    def handle_event(self, event) -> Optional[Job]:
+        """Call from the game loop for DONE_EVENTs; runs on_done and returns the job"""
+        job = self.jobs.pop(getattr(event, 'job_id', None), None)
+        if job is not None and job.on_done:
+            job.on_done(job)
+        return job
+
+    def shutdown(self, timeout: float = None):
+        """Finish queued jobs and stop the worker"""
+        if self.worker is not None and self.worker.is_alive():
+            self.queue.put(None)
+            self.worker.join(timeout)
@@ -1,36 +1,107 @@
-from typing import List, Dict
+import bisect
+from typing import List, Dict, Tuple
+from controllers.instrumentation import instrument_methods
 
+# Places promoted from / relegated out of each division, by division level
+PROMOTION_PLACES = {2: 3, 3: 3, 4: 4}
+RELEGATION_PLACES = {1: 3, 2: 3, 3: 4}
+
+
+def movement_places(level: int, levels) -> Tuple[int, int]:
+    """(promoted, relegated) places for a division level, given every level in play.
+
+    Nobody goes up from the top level or down from the bottom one.
+    """
+    promoted = PROMOTION_PLACES.get(level, 0) if level - 1 in levels else 0
+    relegated = RELEGATION_PLACES.get(level, 0) if level + 1 in levels else 0
+    return promoted, relegated
+
+@instrument_methods(exclude=('version',))
 class LeagueTable:
+    """League standings, kept in memory per division once loaded.
+
+    Results are applied as deltas and only the affected rows are re-ranked.
+    Changed rows are marked dirty and written back in one batch by flush().
+    versions[division_id] increases on every change so views know when
+    their cached rows are stale.
+    """
+    TABLE_SQL = """
+        SELECT 
+            lt.team_id,
+            t.name as club,
+            lt.played,
+            lt.won,
+            lt.drawn,
+            lt.lost,
+            lt.goals_for as gf,
+            lt.goals_against as ga,
+            (lt.goals_for - lt.goals_against) as gd,
+            lt.points as pts
+        FROM league_tables lt
+        JOIN teams t ON lt.team_id = t.id
+        WHERE lt.division_id = ?
+        ORDER BY lt.points DESC, 
+                 (lt.goals_for - lt.goals_against) DESC, 
+                 lt.goals_for DESC,
+                 t.name ASC
+    """
+
+    # In-memory row keys, in the order of result_deltas, and their columns
+    STAT_KEYS = ('played', 'won', 'drawn', 'lost', 'gf', 'ga', 'pts')
+    STAT_COLUMNS = ('played', 'won', 'drawn', 'lost', 'goals_for', 'goals_against', 'points')
+
     def __init__(self, db):
         self.db = db
+        self.standings = {}   # division_id -> rows sorted by table position
+        self.rows_by_team = {}  # team_id -> row
+        self.dirty = set()    # team_ids with unsaved changes
+        self.versions = {}
 
-    def get_league_table(self, division_id: int) -> List[Dict]:
-        with self.db.connect() as conn:
+    @staticmethod
+    def sort_key(row: Dict):
+        return (-row['pts'], -row['gd'], -row['gf'], row['club'], row['team_id'])
+
+    def version(self, division_id: int) -> int:
+        return self.versions.get(division_id, 0)
+
+    def _touch(self, division_id: int):
+        self.versions[division_id] = self.version(division_id) + 1
+
+    def load_division(self, division_id: int) -> List[Dict]:
+        """(Re)load a division's standings from the database"""
+        with self.db.connect_readonly() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT 
-                    t.name as club,
-                    lt.played,
-                    lt.won,
-                    lt.drawn,
-                    lt.lost,
-                    lt.goals_for as gf,
-                    lt.goals_against as ga,
-                    (lt.goals_for - lt.goals_against) as gd,
-                    lt.points as pts
-                FROM league_tables lt
-                JOIN teams t ON lt.team_id = t.id
-                WHERE lt.division_id = ?
-                ORDER BY lt.points DESC, 
-                         (lt.goals_for - lt.goals_against) DESC, 
-                         lt.goals_for DESC,
-                         t.name ASC
-            """, (division_id,))
-            
-            return [dict(row) for row in cursor.fetchall()]
+            cursor.execute(self.TABLE_SQL, (division_id,))
+            rows = [dict(row) for row in cursor.fetchall()]
+        rows.sort(key=self.sort_key)  # Break exact ties the same way apply_result does
+        for row in self.standings.get(division_id, []):
+            self.rows_by_team.pop(row['team_id'], None)
+        for row in rows:
+            row['division_id'] = division_id
+            self.rows_by_team[row['team_id']] = row
+        self.standings[division_id] = rows
+        self._touch(division_id)
+        return rows
+
+    def invalidate(self, division_id: int = None):
+        """Drop cached standings so the next read comes from the database"""
+        divisions = list(self.standings) if division_id is None else [division_id]
+        for division in divisions:
+            for row in self.standings.pop(division, []):
+                self.rows_by_team.pop(row['team_id'], None)
+                self.dirty.discard(row['team_id'])
+            self._touch(division)
 
-    def initialize_league_table(self, division_id: int):
-        """Initialize or reset league table for a division"""
+    def get_league_table(self, division_id: int) -> List[Dict]:
+        """Return the division's rows in table order, querying only on first use"""
+        rows = self.standings.get(division_id)
+        if rows is None:
+            rows = self.load_division(division_id)
+        return list(rows)
+
+    def initialize_league_table(self, division_id: int, season: int = 1):
+        """Initialize or reset league table for a division and season"""
+        self.flush()
         with self.db.connect() as conn:
             cursor = conn.cursor()
             # First, clear existing entries
@@ -41,10 +112,73 @@ class LeagueTable:
             teams = cursor.fetchall()
             
             # Initialize each team's record
-            for team in teams:
-                cursor.execute("""
-                    INSERT INTO league_tables 
-                    (team_id, division_id, played, won, drawn, lost, 
-                     goals_for, goals_against, points, season)
-                    VALUES (?, ?, 0, 0, 0, 0, 0, 0, 0, 1)
-                """, (team[0], division_id))
+            cursor.executemany("""
+                INSERT INTO league_tables 
+                (team_id, division_id, played, won, drawn, lost, 
+                 goals_for, goals_against, points, season)
+                VALUES (?, ?, 0, 0, 0, 0, 0, 0, 0, ?)
+            """, [(team[0], division_id, season) for team in teams])
+        self.invalidate(division_id)
+
+    @staticmethod
+    def result_deltas(home_goals: int, away_goals: int) -> Tuple[tuple, tuple]:
+        """Return (played, won, drawn, lost, gf, ga, points) deltas for home and away"""
+        if home_goals > away_goals:
+            return (1, 1, 0, 0, home_goals, away_goals, 3), (1, 0, 0, 1, away_goals, home_goals, 0)
+        if home_goals < away_goals:
+            return (1, 0, 0, 1, home_goals, away_goals, 0), (1, 1, 0, 0, away_goals, home_goals, 3)
+        return (1, 0, 1, 0, home_goals, away_goals, 1), (1, 0, 1, 0, away_goals, home_goals, 1)
+
+    def apply_result(self, division_id: int, home_id: int, away_id: int,
+                     home_goals: int, away_goals: int):
+        """Apply one result in memory and re-rank only the two rows it touched"""
+        rows = self.standings.get(division_id)
+        if rows is None:
+            rows = self.load_division(division_id)
+        for team_id, deltas in zip((home_id, away_id), self.result_deltas(home_goals, away_goals)):
+            row = self.rows_by_team.get(team_id)
+            if row is None:
+                continue
+            # Take the row out, update it, and put it back in its new place
+            del rows[bisect.bisect_left(rows, self.sort_key(row), key=self.sort_key)]
+            for key, delta in zip(self.STAT_KEYS, deltas):
+                row[key] += delta
+            row['gd'] = row['gf'] - row['ga']
+            bisect.insort(rows, row, key=self.sort_key)
+            self.dirty.add(team_id)
+        self._touch(division_id)
+
+    def apply_results(self, results: List[Tuple[int, int, int, int, int]]):
+        """Apply (division_id, home_id, away_id, home_goals, away_goals) results in memory"""
+        for result in results:
+            self.apply_result(*result)
+
+    def flush(self, cursor=None):
+        """Write every dirty row back in a single transaction.
+
+        Pass a cursor to write inside the caller's transaction instead; if
+        that transaction rolls back, the caller must invalidate() the cache.
+        """
+        if not self.dirty:
+            return
+        rows = []
+        for team_id in self.dirty:
+            row = self.rows_by_team[team_id]
+            rows.append(tuple(row[key] for key in self.STAT_KEYS) + (team_id, row['division_id']))
+        assignments = ", ".join(f"{column} = ?" for column in self.STAT_COLUMNS)
+        sql = f"""
+            UPDATE league_tables
+            SET {assignments}
+            WHERE team_id = ? AND division_id = ?
+        """
+        if cursor is not None:
+            cursor.executemany(sql, rows)
+        else:
+            with self.db.connect() as conn:
+                conn.executemany(sql, rows)
+        self.dirty.clear()
+
+    def record_results(self, results: List[Tuple[int, int, int, int, int]], cursor=None):
+        """Apply results and persist the changed rows (through cursor, if given)"""
+        self.apply_results(results)
+        self.flush(cursor)
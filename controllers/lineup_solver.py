@@ -0,0 +1,102 @@
+from typing import Dict, List, Sequence, Tuple
+
+from controllers.player_rating import POSITIONS, slot_ratings
+
+# Players per position for each supported formation (always 1 GK + 10 outfield)
+FORMATIONS = {
+    '4-4-2': {'GK': 1, 'DEF': 4, 'MID': 4, 'ATT': 2},
+    '4-3-3': {'GK': 1, 'DEF': 4, 'MID': 3, 'ATT': 3},
+    '4-5-1': {'GK': 1, 'DEF': 4, 'MID': 5, 'ATT': 1},
+    '4-2-4': {'GK': 1, 'DEF': 4, 'MID': 2, 'ATT': 4},
+    '3-5-2': {'GK': 1, 'DEF': 3, 'MID': 5, 'ATT': 2},
+    '3-4-3': {'GK': 1, 'DEF': 3, 'MID': 4, 'ATT': 3},
+    '5-3-2': {'GK': 1, 'DEF': 5, 'MID': 3, 'ATT': 2},
+    '5-4-1': {'GK': 1, 'DEF': 5, 'MID': 4, 'ATT': 1},
+}
+DEFAULT_FORMATION = '4-4-2'
+
+
+def formation_slots(formation: str) -> List[str]:
+    """Expand a formation name into one position per slot, GK first"""
+    counts = FORMATIONS[formation]
+    return [position for position in POSITIONS for _ in range(counts.get(position, 0))]
+
+
+def solve_assignment(cost: Sequence[Sequence[float]]) -> List[int]:
+    """Minimum-cost assignment of every row to a distinct column.
+
+    Hungarian algorithm (shortest augmenting paths with potentials), O(n^2 m)
+    for n rows and m >= n columns. Returns the chosen column for each row.
+    """
+    n = len(cost)
+    m = len(cost[0]) if n else 0
+    if n > m:
+        raise ValueError(f"Need at least as many columns as rows ({n} rows, {m} columns)")
+    inf = float('inf')
+    u = [0.0] * (n + 1)         # Row potentials
+    v = [0.0] * (m + 1)         # Column potentials
+    match = [0] * (m + 1)       # match[column] = row (1-based, 0 = free)
+    way = [0] * (m + 1)
+    for row in range(1, n + 1):
+        match[0] = row
+        column = 0
+        min_slack = [inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[column] = True
+            current_row = match[column]
+            row_cost = cost[current_row - 1]
+            delta = inf
+            next_column = 0
+            u_row = u[current_row]
+            for j in range(1, m + 1):
+                if not used[j]:
+                    slack = row_cost[j - 1] - u_row - v[j]
+                    if slack < min_slack[j]:
+                        min_slack[j] = slack
+                        way[j] = column
+                    if min_slack[j] < delta:
+                        delta = min_slack[j]
+                        next_column = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[match[j]] += delta
+                    v[j] -= delta
+                else:
+                    min_slack[j] -= delta
+            column = next_column
+            if match[column] == 0:
+                break
+        # Flip the augmenting path
+        while column:
+            previous = way[column]
+            match[column] = match[previous]
+            column = previous
+    assignment = [0] * n
+    for j in range(1, m + 1):
+        if match[j]:
+            assignment[match[j] - 1] = j - 1
+    return assignment
+
+
+def best_lineup(players: Sequence, formation: str = DEFAULT_FORMATION) -> List[Tuple[str, object]]:
+    """Return the optimal (slot position, player) pairs for a formation.
+
+    Per-slot ratings come from the player rating engine, then the slot x player rating
+    matrix is solved so the total XI rating is maximal, allowing players
+    to fill other positions at a penalty.
+    """
+    slots = formation_slots(formation)
+    if len(players) < len(slots):
+        return []
+    ratings = [slot_ratings(player) for player in players]
+    # Minimizing negative ratings maximizes the XI's total rating
+    cost = [[-rating[slot] for rating in ratings] for slot in slots]
+    return [(slot, players[column]) for slot, column in zip(slots, solve_assignment(cost))]
+
+
+def best_lineups(store, team_ids: Sequence[int], formations: Dict[int, str] = None) -> Dict[int, List[Tuple[str, object]]]:
+    """Solve lineups for many clubs straight from a PlayerStore, without writing anything"""
+    formations = formations or {}
+    return {team_id: best_lineup(store.team_players(team_id), formations.get(team_id, DEFAULT_FORMATION))
+            for team_id in team_ids}
@@ -0,0 +1,183 @@
+import json
+import logging
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from controllers.fixtures import FixtureList
+from controllers.instrumentation import instrument_methods
+from controllers.league_table import LeagueTable
+from controllers.player_rating import player_rating
+
+
+@instrument_methods()
+class MatchEngine:
+    """Headless match simulation from each team's selected XI.
+
+    Expected goals come from the ratio of one side's attack to the other's
+    defence, and scores are drawn from a Poisson distribution. Whole
+    matchdays or seasons of unplayed fixtures are simulated in one
+    vectorized pass, then written to league_tables and fixtures.
+    """
+    BASE_GOALS = 1.3          # Expected goals for evenly matched sides
+    HOME_ADVANTAGE = 1.15     # Multiplier on the home side's expected goals
+    STRENGTH_EXPONENT = 2.0   # How strongly rating gaps turn into goal gaps
+
+    # Used when a team hasn't picked an XI
+    DEFAULT_FORMATION = {
+        'GK': 1,
+        'DEF': 4,
+        'MID': 4,
+        'ATT': 2
+    }
+
+    # How much each position contributes to attack and defence
+    ATTACK_WEIGHTS = {'GK': 0.0, 'DEF': 0.3, 'MID': 0.7, 'ATT': 1.0}
+    DEFENCE_WEIGHTS = {'GK': 1.5, 'DEF': 1.0, 'MID': 0.5, 'ATT': 0.1}
+
+    INSERT_LINEUP_SQL = "INSERT OR REPLACE INTO lineups (team_id, fixture_id, player_ids) VALUES (?, ?, ?)"
+
+    def __init__(self, db, seed=None, league_table=None):
+        self.db = db
+        self.rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+        self.league_table = league_table or LeagueTable(db)
+        self.fixtures = FixtureList(db)
+
+    def pick_xi(self, squad: List[Dict]) -> List[Dict]:
+        """Return the selected XI, or the best players for DEFAULT_FORMATION"""
+        selected = [p for p in squad if p['is_selected']]
+        if len(selected) == 11:
+            return selected
+        xi = []
+        for position, count in self.DEFAULT_FORMATION.items():
+            candidates = [p for p in squad if p['position'] == position]
+            candidates.sort(key=player_rating, reverse=True)
+            xi.extend(candidates[:count])
+        return xi
+
+    def team_strength(self, xi: List[Dict]) -> Tuple[float, float]:
+        """Return (attack, defence) as weighted mean ratings of an XI"""
+        attack = defence = attack_weight = defence_weight = 0.0
+        for player in xi:
+            rating = player_rating(player)
+            weight = self.ATTACK_WEIGHTS.get(player['position'], 0.0)
+            attack += rating * weight
+            attack_weight += weight
+            weight = self.DEFENCE_WEIGHTS.get(player['position'], 0.0)
+            defence += rating * weight
+            defence_weight += weight
+        return (attack / attack_weight if attack_weight else 1.0,
+                defence / defence_weight if defence_weight else 1.0)
+
+    def load_team_xis(self) -> Dict[int, List]:
+        """The XI every team fields (see pick_xi), from a single players query"""
+        squads = {}
+        self.db.refresh_ratings()
+        with self.db.connect_readonly() as conn:
+            cursor = conn.execute("""
+                SELECT id, team_id, position, rating, is_selected
+                FROM players
+                WHERE team_id IS NOT NULL
+            """)
+            for row in cursor:
+                squads.setdefault(row['team_id'], []).append(row)
+        return {team_id: self.pick_xi(squad) for team_id, squad in squads.items()}
+
+    def load_team_strengths(self, xis: Dict[int, List] = None) -> Dict[int, Tuple[float, float]]:
+        """Compute (attack, defence) for every team from its XI"""
+        xis = xis if xis is not None else self.load_team_xis()
+        return {team_id: self.team_strength(xi) for team_id, xi in xis.items()}
+
+    def expected_goals(self, attack, defence, home: bool):
+        """Expected goals for a side; works on floats or NumPy arrays"""
+        base = self.BASE_GOALS * (self.HOME_ADVANTAGE if home else 1.0)
+        return base * (np.asarray(attack) / np.asarray(defence)) ** self.STRENGTH_EXPONENT
+
+    def play_match(self, home_id: int, away_id: int, strengths=None) -> Tuple[int, int]:
+        """Simulate a single match and return (home_goals, away_goals)"""
+        results = self.simulate_fixtures([(None, home_id, away_id)], strengths)
+        return results[0][3], results[0][4]
+
+    def simulate_fixtures(self, fixtures: List[Tuple[int, int, int]],
+                          strengths=None) -> List[Tuple[int, int, int, int, int]]:
+        """Simulate (division_id, home_id, away_id) fixtures in one vectorized pass.
+
+        Returns (division_id, home_id, away_id, home_goals, away_goals) tuples.
+        Nothing is written to the database.
+        """
+        if not fixtures:
+            return []
+        strengths = strengths or self.load_team_strengths()
+        neutral = (1.0, 1.0)
+        home_attack, home_defence = np.array([strengths.get(f[1], neutral) for f in fixtures]).T
+        away_attack, away_defence = np.array([strengths.get(f[2], neutral) for f in fixtures]).T
+        home_goals = self.rng.poisson(self.expected_goals(home_attack, away_defence, home=True))
+        away_goals = self.rng.poisson(self.expected_goals(away_attack, home_defence, home=False))
+        return [
+            (division_id, home_id, away_id, int(hg), int(ag))
+            for (division_id, home_id, away_id), hg, ag in zip(fixtures, home_goals, away_goals)
+        ]
+
+    def remaining_fixtures(self, season: int = None) -> Dict[int, List[Tuple[int, int]]]:
+        """Unplayed (home_id, away_id) fixtures per division, in matchday order"""
+        remaining = {}
+        for fixture_id, division_id, matchday, home, away in self.fixtures.unplayed(season):
+            remaining.setdefault(division_id, []).append((home, away))
+        return remaining
+
+    def play_fixtures(self, pending: List[Tuple[int, int, int, int, int]]) -> List[Tuple[int, int, int, int, int]]:
+        """Simulate FixtureList.unplayed() tuples, then record tables, scores and line-ups in one transaction"""
+        xis = self.load_team_xis()
+        results = self.simulate_fixtures([(division_id, home, away)
+                                          for fixture_id, division_id, matchday, home, away in pending],
+                                         self.load_team_strengths(xis))
+        # Standings, scores and line-ups commit together, so a failure part way
+        # can't leave points counted for fixtures that are still unplayed
+        conn = self.db.connect()
+        try:
+            with conn:
+                cursor = conn.cursor()
+                self.league_table.record_results(results, cursor)
+                self.fixtures.record_results([(fixture[0], result[3], result[4])
+                                              for fixture, result in zip(pending, results)], cursor)
+                self.record_lineups(pending, xis, cursor)
+        except Exception:
+            self.league_table.invalidate()  # Drop the results applied in memory
+            raise
+        return results
+
+    def record_lineups(self, pending: List[Tuple[int, int, int, int, int]], xis: Dict[int, List], cursor=None):
+        """Keep the XI each side fielded in every played fixture"""
+        player_ids = {team_id: json.dumps([player['id'] for player in xi]) for team_id, xi in xis.items()}
+        rows = [(team_id, fixture[0], player_ids.get(team_id, '[]'))
+                for fixture in pending
+                for team_id in (fixture[3], fixture[4])]
+        if cursor is not None:
+            cursor.executemany(self.INSERT_LINEUP_SQL, rows)
+        else:
+            with self.db.connect() as conn:
+                conn.executemany(self.INSERT_LINEUP_SQL, rows)
+
+    def simulate_matchday(self, matchday: int = None) -> List[Tuple[int, int, int, int, int]]:
+        """Simulate one matchday across every division and record the results.
+
+        If matchday is None each division plays its next unplayed matchday.
+        """
+        pending = self.fixtures.unplayed(self.fixtures.ensure_season())
+        if matchday is None:
+            next_matchday = {}
+            for fixture in pending:  # Ordered by division, then matchday
+                next_matchday.setdefault(fixture[1], fixture[2])
+            pending = [fixture for fixture in pending if fixture[2] == next_matchday[fixture[1]]]
+        else:
+            pending = [fixture for fixture in pending if fixture[2] == matchday]
+        return self.play_fixtures(pending)
+
+    def simulate_season(self) -> List[Tuple[int, int, int, int, int]]:
+        """Simulate every remaining match in all divisions in one pass and one transaction"""
+        start = time.perf_counter()
+        results = self.play_fixtures(self.fixtures.unplayed(self.fixtures.ensure_season()))
+        elapsed = (time.perf_counter() - start) * 1000
+        logging.info(f"Simulated {len(results)} matches in {elapsed:.1f} ms")
+        return results
@@ -1,31 +1,37 @@
 import random
-import csv
-import os
+import numpy as np
+from controllers.instrumentation import instrument_methods
+from database.name_pool import load_name_pool
 
+@instrument_methods()
 class PlayerCreator:
-    def __init__(self):
-        self.first_names, self.last_names = self.load_player_names()
-
-    def load_player_names(self):
-        first_names = []
-        last_names = []
-        file_path = os.path.join('database', 'playernames.csv')
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                reader = csv.reader(file)
-                for row in reader:
-                    if len(row) == 2:
-                        first_names.append(row[0].strip())
-                        last_names.append(row[1].strip())
-        except UnicodeDecodeError:
-            # Fallback to latin-1 if UTF-8 fails
-            with open(file_path, 'r', encoding='latin-1') as file:
-                reader = csv.reader(file)
-                for row in reader:
-                    if len(row) == 2:
-                        first_names.append(row[0].strip())
-                        last_names.append(row[1].strip())
-        return first_names, last_names
+    # Base stats with position-specific adjustments
+    BASE_STATS = {
+        'GK':  {'attacking': (20, 40), 'defending': (30, 50), 'goalkeeping': (50, 85)},
+        'DEF': {'attacking': (20, 55), 'defending': (50, 85), 'goalkeeping': (15, 35)},
+        'MID': {'attacking': (40, 75), 'defending': (40, 75), 'goalkeeping': (15, 35)},
+        'ATT': {'attacking': (50, 85), 'defending': (20, 55), 'goalkeeping': (15, 35)}
+    }
+
+    # Number of players generated for each position in a squad
+    SQUAD_POSITIONS = {
+        'GK': 3,
+        'DEF': 6,
+        'MID': 6,
+        'ATT': 5
+    }
+
+    # Columns produced by generate_batch, in INSERT order
+    BATCH_COLUMNS = (
+        'first_name', 'last_name', 'team_id', 'age', 'position',
+        'attacking', 'defending', 'goalkeeping', 'stamina', 'speed',
+        'morale', 'value', 'wages', 'contract_years'
+    )
+
+    def __init__(self, name_weights=None):
+        # Shared, cached name pool; name_weights maps nationality -> relative weight
+        self.names = load_name_pool()
+        self.name_weights = name_weights
 
     def get_stat_range(self, base_range, reputation):
         """Adjust stat range based on team reputation"""
@@ -38,15 +44,7 @@ class PlayerCreator:
         return (int(new_min), int(new_max))
 
     def generate_player(self, team_id, position, reputation):
-        # Base stats with position-specific adjustments
-        base_stats = {
-            'GK':  {'attacking': (20, 40), 'defending': (30, 50), 'goalkeeping': (50, 85)},
-            'DEF': {'attacking': (20, 55), 'defending': (50, 85), 'goalkeeping': (15, 35)},
-            'MID': {'attacking': (40, 75), 'defending': (40, 75), 'goalkeeping': (15, 35)},
-            'ATT': {'attacking': (50, 85), 'defending': (20, 55), 'goalkeeping': (15, 35)}
-        }
-
-        stats = base_stats[position]
+        stats = self.BASE_STATS[position]
         
         # Adjust stats based on reputation
         adjusted_stats = {
@@ -61,6 +59,8 @@ class PlayerCreator:
             int(base_value * 0.7),
             int(base_value * max_value_multiplier)
         )
+        # Below reputation ~42 the multiplier drops under 0.7; keep the range non-empty
+        value_range = (value_range[0], max(value_range))
 
         # Calculate wages range (roughly 2% of value per year)
         wages_range = (
@@ -68,6 +68,9 @@ class PlayerCreator:
             int(value_range[1] * 0.02 / 52)
         )
 
+        # Fitness floor of 50, even for clubs whose reputation+10 is below it
+        fitness_range = (max(50, reputation - 20), max(50, min(99, reputation + 10)))
+
         # Generate player age with bias based on reputation
         # Higher reputation teams tend to have more prime-age players
         if reputation > 85:
@@ -77,17 +80,18 @@ class PlayerCreator:
         else:
             age = random.randint(17, 35)
 
+        first_name, last_name = self.names.choice(weights=self.name_weights)
         return {
-            'first_name': random.choice(self.first_names),
-            'last_name': random.choice(self.last_names),
+            'first_name': first_name,
+            'last_name': last_name,
             'team_id': team_id,
             'age': age,
             'position': position,
             'attacking': random.randint(*adjusted_stats['attacking']),
             'defending': random.randint(*adjusted_stats['defending']),
             'goalkeeping': random.randint(*adjusted_stats['goalkeeping']),
-            'stamina': random.randint(max(50, reputation-20), min(99, reputation+10)),
-            'speed': random.randint(max(50, reputation-20), min(99, reputation+10)),
+            'stamina': random.randint(*fitness_range),
+            'speed': random.randint(*fitness_range),
             'morale': random.randint(60, 100),
             'value': random.randint(*value_range),
             'wages': random.randint(*wages_range),
@@ -97,15 +101,94 @@ class PlayerCreator:
     def generate_squad(self, team_id, reputation):
         squad = []
         # Generate specific number of players for each position
-        positions = {
-            'GK': 3,
-            'DEF': 6,
-            'MID': 6,
-            'ATT': 5
-        }
-        
-        for position, count in positions.items():
+        for position, count in self.SQUAD_POSITIONS.items():
             for _ in range(count):
                 squad.append(self.generate_player(team_id, position, reputation))
                 
         return squad
+
+    def squad_specs(self, teams):
+        """Build generate_batch specs for full squads from (team_id, reputation) pairs"""
+        return [
+            (team_id, position, reputation, count)
+            for team_id, reputation in teams
+            for position, count in self.SQUAD_POSITIONS.items()
+        ]
+
+    def generate_batch(self, specs, seed=None):
+        """Generate many players at once as columnar NumPy arrays.
+
+        specs is an iterable of (team_id, position, reputation, count) tuples.
+        Every stat is drawn from the same inclusive range generate_player uses,
+        but for all players in one vectorized pass. seed may be an int or a
+        numpy Generator so batches can be reproduced.
+
+        Returns a dict mapping each name in BATCH_COLUMNS to an array with one
+        entry per generated player.
+        """
+        rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+        specs = [spec for spec in specs if spec[3] > 0]
+        if not specs:
+            return {column: np.empty(0, dtype=object if column in ('first_name', 'last_name', 'position')
+                                     else np.int64) for column in self.BATCH_COLUMNS}
+
+        counts = np.array([spec[3] for spec in specs], dtype=np.int64)
+        team_id = np.repeat(np.array([spec[0] for spec in specs], dtype=np.int64), counts)
+        reputation = np.repeat(np.array([spec[2] for spec in specs], dtype=np.float64), counts)
+        position = np.repeat(np.array([spec[1] for spec in specs], dtype=object), counts)
+        size = len(team_id)
+
+        def draw(low, high):
+            # Inclusive bounds, matching random.randint
+            return rng.integers(low, np.asarray(high) + 1, size=size)
+
+        # Same reputation adjustment as get_stat_range, applied per player
+        rep_adjust = ((reputation - 70) / 20) * 15
+        columns = {}
+        for stat in ('attacking', 'defending', 'goalkeeping'):
+            base_min = np.empty(size)
+            base_max = np.empty(size)
+            for pos, stats in self.BASE_STATS.items():
+                mask = position == pos
+                base_min[mask], base_max[mask] = stats[stat]
+            low = np.clip(base_min + rep_adjust, 1, 99).astype(np.int64)
+            high = np.clip(base_max + rep_adjust, 1, 99).astype(np.int64)
+            columns[stat] = draw(low, high)
+
+        # Value and wage ranges scale exponentially with reputation
+        base_value = reputation * 50000
+        value_low = (base_value * 0.7).astype(np.int64)
+        # Below reputation ~42 the multiplier drops under 0.7; keep every range non-empty
+        value_high = np.maximum((base_value * (reputation / 50) ** 2).astype(np.int64), value_low)
+        wages_low = (value_low * 0.02 / 52).astype(np.int64)
+        wages_high = (value_high * 0.02 / 52).astype(np.int64)
+
+        # Higher reputation teams tend to have more prime-age players
+        age_low = np.select([reputation > 85, reputation > 75], [23, 20], 17)
+        age_high = np.select([reputation > 85, reputation > 75], [32, 33], 35)
+
+        fitness_low = np.maximum(50, reputation - 20).astype(np.int64)
+        fitness_high = np.maximum(fitness_low, np.minimum(99, reputation + 10)).astype(np.int64)
+
+        first_names, last_names, _ = self.names.draw(size, rng, self.name_weights)
+
+        columns.update({
+            'first_name': first_names,
+            'last_name': last_names,
+            'team_id': team_id,
+            'age': draw(age_low, age_high),
+            'position': position,
+            'stamina': draw(fitness_low, fitness_high),
+            'speed': draw(fitness_low, fitness_high),
+            'morale': draw(60, 100),
+            'value': draw(value_low, value_high),
+            'wages': draw(wages_low, wages_high),
+            'contract_years': draw(1, 5),
+        })
+        return {column: columns[column] for column in self.BATCH_COLUMNS}
+
+    @staticmethod
+    def batch_rows(batch):
+        """Yield one tuple of plain Python values per player in a generate_batch result"""
+        columns = [batch[column].tolist() for column in PlayerCreator.BATCH_COLUMNS]
+        return zip(*columns)
@@ -0,0 +1,104 @@
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+POSITIONS = ('GK', 'DEF', 'MID', 'ATT')
+ATTRIBUTES = ('attacking', 'defending', 'goalkeeping', 'stamina', 'speed')
+
+# Weight of each attribute (in ATTRIBUTES order) in a position's rating
+POSITION_WEIGHTS = {
+    'GK':  (0.0, 0.0, 1.0, 0.0, 0.0),
+    'DEF': (0.0, 0.7, 0.0, 0.2, 0.1),
+    'MID': (0.4, 0.4, 0.0, 0.1, 0.1),
+    'ATT': (0.7, 0.0, 0.0, 0.1, 0.2),
+}
+
+# Rating multiplier for playing out of position: FAMILIARITY[natural][slot]
+FAMILIARITY = {
+    'GK':  {'GK': 1.0, 'DEF': 0.3, 'MID': 0.3, 'ATT': 0.3},
+    'DEF': {'GK': 0.2, 'DEF': 1.0, 'MID': 0.85, 'ATT': 0.7},
+    'MID': {'GK': 0.2, 'DEF': 0.85, 'MID': 1.0, 'ATT': 0.85},
+    'ATT': {'GK': 0.2, 'DEF': 0.7, 'MID': 0.85, 'ATT': 1.0},
+}
+
+# Persisted columns: the natural-position rating plus one per slot position
+SLOT_COLUMNS = {'GK': 'rating_gk', 'DEF': 'rating_def', 'MID': 'rating_mid', 'ATT': 'rating_att'}
+RATING_COLUMNS = ('rating',) + tuple(SLOT_COLUMNS[position] for position in POSITIONS)
+
+_POSITION_INDEX = {position: i for i, position in enumerate(POSITIONS)}
+_WEIGHT_MATRIX = np.array([POSITION_WEIGHTS[position] for position in POSITIONS]).T
+_FAMILIARITY_MATRIX = np.array([[FAMILIARITY[natural][slot] for slot in POSITIONS]
+                                for natural in POSITIONS])
+
+
+def rate(attributes, positions: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Rate many players in one vectorized pass.
+
+    attributes is an (n, 5) array-like in ATTRIBUTES order and positions the
+    natural position of each player. Returns (rating, slots): the rating in
+    the natural position and an (n, 4) array of ratings in every POSITIONS
+    slot, out-of-position penalty included. Unknown positions rate 0.
+    """
+    attributes = np.asarray(attributes, dtype=np.float64).reshape(-1, len(ATTRIBUTES))
+    raw = attributes @ _WEIGHT_MATRIX
+    natural = np.array([_POSITION_INDEX.get(position, -1) for position in positions], dtype=np.int64)
+    known = natural >= 0
+    familiarity = np.zeros_like(raw)
+    familiarity[known] = _FAMILIARITY_MATRIX[natural[known]]
+    slots = raw * familiarity
+    rating = np.where(known, raw[np.arange(len(raw)), np.maximum(natural, 0)], 0.0)
+    return rating, slots
+
+
+def rating_rows(records: Sequence) -> List[tuple]:
+    """Turn (id, position, *ATTRIBUTES) records into UPDATE parameter tuples.
+
+    Each tuple is the RATING_COLUMNS values followed by the player id.
+    """
+    if not records:
+        return []
+    ids = [record[0] for record in records]
+    positions = [record[1] for record in records]
+    attributes = [[value or 0 for value in record[2:]] for record in records]
+    rating, slots = rate(attributes, positions)
+    return [values + (player_id,) for values, player_id
+            in zip(map(tuple, np.column_stack((rating, slots)).tolist()), ids)]
+
+
+def _stored(player, column: str):
+    """Stored value of column, or None for rows without it (dict, sqlite3.Row or PlayerRow)"""
+    try:
+        return player[column]
+    except (KeyError, IndexError):
+        return None
+
+
+def position_rating(player, position: str) -> float:
+    """Rate one player's attributes as if playing in the given position (no penalty)"""
+    weights = POSITION_WEIGHTS.get(position)
+    if weights is None:
+        return 0
+    return sum(player[attribute] * weight for attribute, weight in zip(ATTRIBUTES, weights) if weight)
+
+
+def player_rating(player) -> float:
+    """Rating in the player's natural position, from the stored column when present"""
+    rating = _stored(player, 'rating')
+    if rating is not None:
+        return rating
+    return position_rating(player, player['position'])
+
+
+def slot_ratings(player) -> Dict[str, float]:
+    """Rating in every slot position, out-of-position penalty included"""
+    stored = _stored(player, SLOT_COLUMNS['GK'])
+    if stored is not None:
+        return {position: player[column] for position, column in SLOT_COLUMNS.items()}
+    familiarity = FAMILIARITY.get(player['position'], {})
+    return {position: position_rating(player, position) * familiarity.get(position, 0.0)
+            for position in POSITIONS}
+
+
+def display_rating(player) -> int:
+    """Whole-number rating shown in squad lists"""
+    return int(round(player_rating(player)))
@@ -0,0 +1,132 @@
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from controllers.instrumentation import instrument_methods
+
+
+@instrument_methods()
+class PlayerSearch:
+    """Sorted, filtered pages of every player in the game.
+
+    Pages use keyset pagination: the next page continues after the
+    (sort value, id) of the last row shown rather than counting past an
+    OFFSET, so page 500 costs the same as page 1. Sorts on rating, value,
+    age and name walk an index (migration 8) and read only the page's rows;
+    the other attributes go through SQLite's top-N sorter. Pages and counts
+    are kept in an LRU cache per filter combination, which is dropped
+    whenever the database's data version moves on.
+    """
+    PAGE_SIZE = 15
+    CACHE_SIZE = 256
+
+    COLUMNS = """
+        SELECT p.*, t.name AS team, t.division_id
+        FROM players p
+        LEFT JOIN teams t ON p.team_id = t.id
+    """
+    COUNT_SQL = """
+        SELECT COUNT(*)
+        FROM players p
+        LEFT JOIN teams t ON p.team_id = t.id
+    """
+    # Sort name -> players column; the id breaks ties so every row has a unique key
+    SORTS = {
+        'rating': 'rating',
+        'value': 'value',
+        'age': 'age',
+        'name': 'last_name',
+        'attacking': 'attacking',
+        'defending': 'defending',
+        'goalkeeping': 'goalkeeping',
+        'stamina': 'stamina',
+        'speed': 'speed',
+        'morale': 'morale',
+        'wages': 'wages',
+    }
+    FILTERS = {
+        'position': "p.position = ?",
+        'team_id': "p.team_id = ?",
+        'division_id': "t.division_id = ?",
+        'min_age': "p.age >= ?",
+        'max_age': "p.age <= ?",
+        'min_rating': "p.rating >= ?",
+        'max_rating': "p.rating <= ?",
+        'name': "p.last_name >= ? AND p.last_name < ?",  # Prefix match that can use the name index
+        'free_agents': "p.team_id IS NULL",
+    }
+
+    def __init__(self, db):
+        self.db = db
+        self.cache = OrderedDict()  # (kind, filters, ...) -> rows or count
+        self.version = None  # Data version the cached results belong to
+        self.hits = 0
+        self.misses = 0
+
+    def where(self, filters: Dict) -> Tuple[List[str], List]:
+        """SQL conditions and parameters for a filter combination"""
+        unknown = set(filters) - set(self.FILTERS)
+        if unknown:
+            raise ValueError(f"Unknown search filters: {', '.join(sorted(unknown))}")
+        clauses, params = [], []
+        for name, value in sorted(filters.items()):
+            if value is None or value is False:
+                continue
+            clauses.append(self.FILTERS[name])
+            if name == 'name':
+                params += [value, value + '\uffff']
+            elif name != 'free_agents':
+                params.append(value)
+        return clauses, params
+
+    def cached(self, key, compute):
+        """Return the cached result for key, computing it on a miss"""
+        self.db.refresh_ratings()  # Sorting and filtering on rating needs it filled in
+        version = self.db.data_version()
+        if version != self.version:
+            self.cache.clear()
+            self.version = version
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return self.cache[key]
+        self.misses += 1
+        result = self.cache[key] = compute()
+        if len(self.cache) > self.CACHE_SIZE:
+            self.cache.popitem(last=False)
+        return result
+
+    def page(self, sort: str = 'rating', descending: bool = True, after: Optional[Tuple] = None,
+             limit: int = PAGE_SIZE, **filters) -> List[Dict]:
+        """Up to limit players in sort order, starting after the page_key after.
+
+        Filters are the keyword arguments named in FILTERS.
+        """
+        if sort not in self.SORTS:
+            raise ValueError(f"Unknown sort: {sort}")
+        column = f"p.{self.SORTS[sort]}"
+        clauses, params = self.where(filters)
+        if after is not None:
+            clauses.append(f"({column}, p.id) {'<' if descending else '>'} (?, ?)")
+            params += list(after)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        direction = "DESC" if descending else "ASC"
+        sql = f"{self.COLUMNS} {where} ORDER BY {column} {direction}, p.id {direction} LIMIT ?"
+
+        def fetch():
+            with self.db.connect_readonly() as conn:
+                return [dict(row) for row in conn.execute(sql, params + [limit])]
+        return self.cached(('page', tuple(sorted(filters.items())), sort, descending, after, limit), fetch)
+
+    def page_key(self, player: Dict, sort: str = 'rating') -> Tuple:
+        """Keyset position of a row: pass the last row's key as after to get the next page"""
+        return player[self.SORTS[sort]], player['id']
+
+    def count(self, **filters) -> int:
+        """Number of players matching the filters"""
+        clauses, params = self.where(filters)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        def fetch():
+            with self.db.connect_readonly() as conn:
+                return conn.execute(f"{self.COUNT_SQL} {where}", params).fetchone()[0]
+        return self.cached(('count', tuple(sorted(filters.items()))), fetch)
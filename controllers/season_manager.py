@@ -0,0 +1,219 @@
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+import numpy as np
+
+from controllers.fixtures import FixtureList
+from controllers.instrumentation import instrument_methods
+from controllers.league_table import LeagueTable, movement_places
+from controllers.match_engine import MatchEngine
+from controllers.player_creation import PlayerCreator
+
+
+@instrument_methods()
+class SeasonManager:
+    """End-of-season rollover: archive, promotion/relegation, ageing, regens.
+
+    Every step is a set-based statement or a batched executemany on one
+    cursor inside a single transaction, so players are updated inside
+    SQLite instead of being loaded into Python, and a failed rollover
+    leaves the finished season untouched.
+    """
+    RETIREMENT_AGE = 36   # Players this old after ageing retire
+    RELEASE_AGE = 32      # Expired contracts are renewed below this age, otherwise released
+    REGEN_AGES = (16, 19)
+
+    ARCHIVE_SQL = """
+        INSERT INTO season_history
+            (season, division_id, position, team_id, played, won, drawn, lost,
+             goals_for, goals_against, points)
+        SELECT lt.season, lt.division_id,
+               ROW_NUMBER() OVER (
+                   PARTITION BY lt.division_id
+                   ORDER BY lt.points DESC, lt.goals_for - lt.goals_against DESC,
+                            lt.goals_for DESC, t.name ASC, t.id ASC
+               ),
+               lt.team_id, lt.played, lt.won, lt.drawn, lt.lost,
+               lt.goals_for, lt.goals_against, lt.points
+        FROM league_tables lt
+        JOIN teams t ON lt.team_id = t.id
+        WHERE lt.season = ?
+    """
+
+    # Attribute change per season by age, plus -1..+1 of noise
+    DEVELOPMENT = "CASE WHEN age < 24 THEN 2 WHEN age < 30 THEN 0 WHEN age < 33 THEN -1 ELSE -3 END"
+    DEVELOPED_ATTRIBUTES = ('attacking', 'defending', 'goalkeeping', 'stamina', 'speed')
+
+    def __init__(self, db, league_table=None, seed=None):
+        self.db = db
+        self.league_table = league_table or LeagueTable(db)
+        self.rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+        self.fixtures = FixtureList(db)
+
+    def current_season(self) -> int:
+        with self.db.connect_readonly() as conn:
+            row = conn.execute("SELECT MAX(season) FROM league_tables").fetchone()
+        return row[0] or 1
+
+    def movements(self, cursor, season: int) -> Dict[int, int]:
+        """team_id -> new division_id for every promoted or relegated team"""
+        levels = {row[0]: row[1] for row in cursor.execute("SELECT id, level FROM divisions")}
+        by_level = {level: division_id for division_id, level in levels.items()}
+        standings = {}
+        for division_id, team_id in cursor.execute("""
+            SELECT division_id, team_id FROM season_history
+            WHERE season = ?
+            ORDER BY division_id, position
+        """, (season,)):
+            standings.setdefault(division_id, []).append(team_id)
+
+        moves = {}
+        for division_id, teams in standings.items():
+            level = levels[division_id]
+            promoted, relegated = movement_places(level, by_level)
+            if relegated:
+                for team_id in teams[-relegated:]:
+                    moves[team_id] = by_level[level + 1]
+            if promoted:
+                for team_id in teams[:promoted]:
+                    moves[team_id] = by_level[level - 1]
+        return moves
+
+    def age_players(self, cursor):
+        """Age everyone a year, develop attributes and run down contracts"""
+        development = ",\n".join(
+            f"{attribute} = MIN(99, MAX(1, {attribute} + {self.DEVELOPMENT} + ABS(RANDOM()) % 3 - 1))"
+            for attribute in self.DEVELOPED_ATTRIBUTES)
+        cursor.execute(f"""
+            UPDATE players SET
+                {development},
+                age = age + 1,
+                contract_years = MAX(0, contract_years - 1)
+        """)
+
+    def expire_contracts(self, cursor) -> Dict[str, int]:
+        """Retire veterans, release older players out of contract and renew the rest"""
+        retired = cursor.execute("DELETE FROM players WHERE age >= ?", (self.RETIREMENT_AGE,)).rowcount
+        released = cursor.execute("""
+            UPDATE players SET team_id = NULL, is_selected = 0, contract_years = 0
+            WHERE team_id IS NOT NULL AND contract_years <= 0 AND age >= ?
+        """, (self.RELEASE_AGE,)).rowcount
+        renewed = cursor.execute("""
+            UPDATE players SET contract_years = 1 + ABS(RANDOM()) % 3
+            WHERE team_id IS NOT NULL AND contract_years <= 0
+        """).rowcount
+        return {'retired': retired, 'released': released, 'renewed': renewed}
+
+    def generate_regens(self, cursor) -> int:
+        """Top every squad back up to PlayerCreator.SQUAD_POSITIONS with youngsters"""
+        creator = PlayerCreator()
+        counts = {(team_id, position): count for team_id, position, count in cursor.execute("""
+            SELECT team_id, position, COUNT(*) FROM players
+            WHERE team_id IS NOT NULL
+            GROUP BY team_id, position
+        """)}
+        specs = []
+        for team_id, reputation in cursor.execute("SELECT id, reputation FROM teams ORDER BY id").fetchall():
+            for position, needed in creator.SQUAD_POSITIONS.items():
+                missing = needed - counts.get((team_id, position), 0)
+                if missing > 0:
+                    specs.append((team_id, position, reputation, missing))
+        batch = creator.generate_batch(specs, seed=self.rng)
+        low, high = self.REGEN_AGES
+        batch['age'] = self.rng.integers(low, high + 1, size=len(batch['age']))
+        rows = [row + (0,) for row in creator.batch_rows(batch)]
+        cursor.executemany(self.db.INSERT_PLAYER_SQL, rows)
+        return len(rows)
+
+    def rollover(self) -> Dict:
+        """Close the finished season and set up the next one in one transaction.
+
+        Returns a report with the new season, promotions/relegations, player
+        movements and timings. Raises ValueError while fixtures are unplayed.
+        """
+        start = time.perf_counter()
+        season = self.current_season()
+        if self.fixtures.unplayed(season):
+            raise ValueError(f"Season {season} still has unplayed fixtures")
+        self.league_table.flush()
+
+        conn = self.db.connect()
+        with conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM season_history WHERE season = ?", (season,))
+            cursor.execute(self.ARCHIVE_SQL, (season,))
+            moves = self.movements(cursor, season)
+            cursor.executemany("UPDATE teams SET division_id = ? WHERE id = ?",
+                               [(division_id, team_id) for team_id, division_id in moves.items()])
+            self.age_players(cursor)
+            contracts = self.expire_contracts(cursor)
+            regens = self.generate_regens(cursor)
+
+            # Fresh tables and fixtures for the new season
+            cursor.execute("DELETE FROM league_tables")
+            cursor.execute("""
+                INSERT INTO league_tables
+                (team_id, division_id, played, won, drawn, lost, goals_for, goals_against, points, season)
+                SELECT id, division_id, 0, 0, 0, 0, 0, 0, 0, ? FROM teams
+            """, (season + 1,))
+            fixtures = FixtureList.schedule_rows(season + 1, FixtureList.teams_by_division(cursor),
+                                                 seed=int(self.rng.integers(2 ** 31)))
+            cursor.execute("DELETE FROM fixtures WHERE season = ?", (season + 1,))
+            cursor.executemany(FixtureList.INSERT_SQL, fixtures)
+
+        # Caches above the database start over; ratings changed with ageing
+        self.league_table.invalidate()
+        self.db.invalidate_player_store()
+        self.db.refresh_ratings()
+
+        report = dict(season=season + 1, moved=len(moves), regens=regens, fixtures=len(fixtures),
+                      ms=(time.perf_counter() - start) * 1000, **contracts)
+        logging.info(f"Rolled over to season {season + 1}: {report}")
+        return report
+
+    def play_seasons(self, seasons: int, engine: MatchEngine = None) -> List[Dict]:
+        """Simulate and roll over several whole seasons back to back"""
+        engine = engine or MatchEngine(self.db, seed=self.rng, league_table=self.league_table)
+        reports = []
+        for _ in range(seasons):
+            engine.simulate_season()
+            reports.append(self.rollover())
+        return reports
+
+
+def main(argv=None):
+    """Soak test: play many seasons headless against a throwaway database"""
+    parser = argparse.ArgumentParser(description="Simulate seasons back to back")
+    parser.add_argument('--seasons', type=int, default=20)
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--db', help="database to play (default: a new temporary one)")
+    args = parser.parse_args(argv)
+
+    from database.database import FootballDB
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db = FootballDB(args.db or os.path.join(workdir, 'soak.db'))
+        if not args.db:
+            db.generate_all_teams_squads()
+        league_table = LeagueTable(db)
+        if not args.db:
+            for division_id in range(1, 5):
+                league_table.initialize_league_table(division_id)
+        start = time.perf_counter()
+        reports = SeasonManager(db, league_table, seed=args.seed).play_seasons(args.seasons)
+        elapsed = time.perf_counter() - start
+        with db.connect_readonly() as conn:
+            players = conn.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+        db.close()
+    print(f"Played {len(reports)} seasons in {elapsed:.2f} s "
+          f"({elapsed / max(len(reports), 1) * 1000:.0f} ms per season), {players} players")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
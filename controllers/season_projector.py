@@ -0,0 +1,161 @@
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+import numpy as np
+
+from controllers.league_table import movement_places
+from controllers.match_engine import MatchEngine
+
+# Simulations vectorized together inside a worker; bounds worker memory
+CHUNK_SIMULATIONS = 1000
+
+
+def _simulate_division(state: Dict[str, np.ndarray], simulations: int, seed) -> np.ndarray:
+    """Simulate the rest of one division's season many times.
+
+    Runs in a worker process, so it only takes plain NumPy arrays. Returns a
+    (teams x positions) histogram of finishing positions.
+    """
+    rng = np.random.default_rng(seed)
+    teams = len(state['points'])
+    home = state['home']
+    away = state['away']
+    histogram = np.zeros(teams * teams, dtype=np.int64)
+    positions = np.arange(teams)
+
+    # One-hot fixture -> team matrices turn per-match numbers into per-team totals
+    home_matrix = np.zeros((len(home), teams))
+    home_matrix[np.arange(len(home)), home] = 1
+    away_matrix = np.zeros((len(away), teams))
+    away_matrix[np.arange(len(away)), away] = 1
+
+    done = 0
+    while done < simulations:
+        size = min(CHUNK_SIMULATIONS, simulations - done)
+        home_goals = rng.poisson(state['home_xg'], size=(size, len(home)))
+        away_goals = rng.poisson(state['away_xg'], size=(size, len(away)))
+        draws = home_goals == away_goals
+        home_points = 3 * (home_goals > away_goals) + draws
+        away_points = 3 * (away_goals > home_goals) + draws
+
+        points = state['points'] + home_points @ home_matrix + away_points @ away_matrix
+        goals_for = state['goals_for'] + home_goals @ home_matrix + away_goals @ away_matrix
+        goals_against = state['goals_against'] + away_goals @ home_matrix + home_goals @ away_matrix
+
+        # Same ordering as the league table: points, goal difference, goals for, name
+        key = (points.astype(np.int64) * 1000 + (goals_for - goals_against).astype(np.int64) + 500) * 1000
+        key = (key + goals_for.astype(np.int64)) * 1000 + state['name_order']
+        order = np.argsort(-key, axis=1)
+        histogram += np.bincount((order * teams + positions).ravel(), minlength=teams * teams)
+        done += size
+    return histogram.reshape(teams, teams)
+
+
+class SeasonProjector:
+    """Monte Carlo title/promotion/relegation odds from the current tables.
+
+    The remaining fixtures of every division are simulated many times across
+    a process pool. Each worker gets compact NumPy arrays and its own seeded
+    RNG, and the finishing-position histograms are summed per team.
+    """
+
+    def __init__(self, db, simulations: int = 10000, workers: int = None, seed=None):
+        self.db = db
+        self.simulations = simulations
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed
+        self.engine = MatchEngine(db)
+
+    def division_states(self) -> Dict[int, Dict[str, np.ndarray]]:
+        """Snapshot every division's table and remaining fixtures as arrays.
+
+        Only reads: a season without fixtures yet projects from the table as it stands.
+        """
+        strengths = self.engine.load_team_strengths()
+        fixtures = self.engine.remaining_fixtures(self.engine.fixtures.current_season())
+        states = {}
+        with self.db.connect_readonly() as conn:
+            levels = {row[0]: row[1] for row in conn.execute("SELECT id, level FROM divisions")}
+            divisions = [row[0] for row in conn.execute(
+                "SELECT DISTINCT division_id FROM league_tables ORDER BY division_id")]
+            for division_id in divisions:
+                rows = conn.execute("""
+                    SELECT lt.team_id, lt.points, lt.goals_for, lt.goals_against
+                    FROM league_tables lt
+                    JOIN teams t ON lt.team_id = t.id
+                    WHERE lt.division_id = ?
+                    ORDER BY t.name DESC
+                """, (division_id,)).fetchall()
+                team_ids = [row['team_id'] for row in rows]
+                index = {team_id: i for i, team_id in enumerate(team_ids)}
+                remaining = fixtures.get(division_id, [])
+                neutral = (1.0, 1.0)
+                home_strength = np.array([strengths.get(h, neutral) for h, a in remaining]).reshape(-1, 2)
+                away_strength = np.array([strengths.get(a, neutral) for h, a in remaining]).reshape(-1, 2)
+                states[division_id] = {
+                    'level': levels[division_id],
+                    'team_ids': np.array(team_ids, dtype=np.int64),
+                    # Rows are sorted by name descending, so a higher index wins name ties
+                    'name_order': np.arange(len(team_ids), dtype=np.int64),
+                    'points': np.array([row['points'] for row in rows], dtype=np.float64),
+                    'goals_for': np.array([row['goals_for'] for row in rows], dtype=np.float64),
+                    'goals_against': np.array([row['goals_against'] for row in rows], dtype=np.float64),
+                    'home': np.array([index[h] for h, a in remaining], dtype=np.int64),
+                    'away': np.array([index[a] for h, a in remaining], dtype=np.int64),
+                    'home_xg': self.engine.expected_goals(home_strength[:, 0], away_strength[:, 1], home=True),
+                    'away_xg': self.engine.expected_goals(away_strength[:, 0], home_strength[:, 1], home=False),
+                }
+        return states
+
+    def _split(self, simulations: int) -> List[int]:
+        """Split simulations into roughly equal per-worker chunks"""
+        parts = max(1, min(self.workers, simulations))
+        return [simulations // parts + (1 if i < simulations % parts else 0) for i in range(parts)]
+
+    def project(self) -> Dict[int, Dict]:
+        """Run the simulations and return odds per team_id.
+
+        Each entry has 'division_id', 'positions' (probability of finishing in
+        each place, 1st first) and 'title', 'promotion' and 'relegation'
+        probabilities.
+        """
+        start = time.perf_counter()
+        states = self.division_states()
+        chunks = self._split(self.simulations)
+        seeds = iter(np.random.SeedSequence(self.seed).spawn(len(states) * len(chunks)))
+        jobs = [(division_id, state, size, next(seeds))
+                for division_id, state in states.items() for size in chunks]
+
+        histograms = {division_id: 0 for division_id in states}
+        if self.workers > 1 and len(jobs) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = [(division_id, pool.submit(_simulate_division, state, size, seed))
+                           for division_id, state, size, seed in jobs]
+                for division_id, future in futures:
+                    histograms[division_id] = histograms[division_id] + future.result()
+        else:
+            for division_id, state, size, seed in jobs:
+                histograms[division_id] = histograms[division_id] + _simulate_division(state, size, seed)
+
+        odds = {}
+        levels = {state['level'] for state in states.values()}
+        for division_id, state in states.items():
+            probabilities = histograms[division_id] / self.simulations
+            # By level, as SeasonManager.movements moves teams
+            promoted, relegated = movement_places(state['level'], levels)
+            for i, team_id in enumerate(state['team_ids'].tolist()):
+                positions = probabilities[i]
+                odds[team_id] = {
+                    'division_id': division_id,
+                    'positions': positions.tolist(),
+                    'title': float(positions[0]),
+                    'promotion': float(positions[:promoted].sum()),
+                    'relegation': float(positions[len(positions) - relegated:].sum()) if relegated else 0.0,
+                }
+        elapsed = time.perf_counter() - start
+        logging.info(f"Projected {self.simulations} seasons for {len(odds)} teams "
+                     f"on {self.workers} workers in {elapsed:.2f} s")
+        return odds
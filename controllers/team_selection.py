@@ -1,16 +1,34 @@
 from database.database import FootballDB
+from controllers import lineup_solver, player_rating
+from controllers.instrumentation import instrument_methods
 
+@instrument_methods()
 class TeamSelection:
-    def __init__(self):
+    def __init__(self, db=None):
         self.selected_players = {}
-        self.db = FootballDB()
-        
+        self.slots = {}  # player_id -> position slot the player fills in the XI
+        self.formation = None
+        self.db = db or FootballDB.shared()
+
+    @property
+    def lineup(self):
+        """(slot position, player) pairs for the current selection"""
+        return [(self.slots[player_id], player) for player_id, player in self.selected_players.items()]
+
+    def set_lineup(self, lineup):
+        self.selected_players = {player['id']: player for slot, player in lineup}
+        self.slots = {player['id']: slot for slot, player in lineup}
+
     def load_selection(self, team_id: int):
         """Load existing selection from database"""
-        players = self.db.get_team_players(team_id)
-        self.selected_players = {
-            p['id']: p for p in players if p['is_selected']
-        }
+        players = self.db.player_store().team_players(team_id)
+        selected = [p for p in players if p['is_selected']]
+        if len(selected) == 11:
+            # Slots aren't stored, so solve them again for the saved XI; an
+            # outfielder auto-picked in goal is still the XI's keeper
+            self.set_lineup(lineup_solver.best_lineup(selected, self.formation or lineup_solver.DEFAULT_FORMATION))
+        else:
+            self.set_lineup([(p['position'], p) for p in selected])
         
     def save_selection(self, team_id: int):
         """Save current selection to database"""
@@ -21,12 +39,9 @@ class TeamSelection:
         if len(self.selected_players) >= 11:
             return False
             
-        # If it's a goalkeeper
+        # If it's a goalkeeper, only while nobody is in goal
         if player['position'] == 'GK':
-            # Count current goalkeepers
-            gk_count = sum(1 for p in self.selected_players.values() 
-                          if p['position'] == 'GK')
-            return gk_count == 0
+            return 'GK' not in self.slots.values()
             
         # For other positions, just check total count
         return True
@@ -37,95 +52,83 @@ class TeamSelection:
         # If player is already selected, always allow deselection
         if player_id in self.selected_players:
             del self.selected_players[player_id]
+            del self.slots[player_id]
             return True
             
-        # Check if we can select this player
+        # Check if we can select this player; picked by hand, they play in their own position
         if self.can_select_player(player):
             self.selected_players[player_id] = player  # Store the whole player object
+            self.slots[player_id] = player['position']
             return True
             
         return False
         
     def is_valid_selection(self) -> bool:
-        if len(self.selected_players) != 11:
+        """11 players with exactly one in goal (see is_valid_lineup)"""
+        return self.is_valid_lineup(self.lineup)
+
+    @staticmethod
+    def is_valid_lineup(lineup) -> bool:
+        """Check an XI by the slots it fills, not natural positions.
+
+        The lineup solver may put an outfielder in goal when a squad has no
+        keeper, so only the slot positions are counted here.
+        """
+        if len(lineup) != 11 or len({player['id'] for slot, player in lineup}) != 11:
             return False
-            
-        # Check if we have exactly one goalkeeper
-        gk_count = sum(1 for p in self.selected_players.values() 
-                      if p['position'] == 'GK')
-        return gk_count == 1
-        
+        return sum(1 for slot, player in lineup if slot == 'GK') == 1
+
     def is_selected(self, player_id: int) -> bool:
         return player_id in self.selected_players
 
-    def get_player_rating(self, player) -> float:
-        """Calculate overall rating for a player based on position"""
-        if player['position'] == 'GK':
-            return player['goalkeeping']
-        elif player['position'] == 'DEF':
-            return (player['defending'] * 0.7 + 
-                   player['stamina'] * 0.2 + 
-                   player['speed'] * 0.1)
-        elif player['position'] == 'MID':
-            return (player['attacking'] * 0.4 + 
-                   player['defending'] * 0.4 + 
-                   player['stamina'] * 0.1 + 
-                   player['speed'] * 0.1)
-        elif player['position'] == 'ATT':
-            return (player['attacking'] * 0.7 + 
-                   player['speed'] * 0.2 + 
-                   player['stamina'] * 0.1)
-        return 0
+    @staticmethod
+    def get_player_rating(player) -> float:
+        """Overall rating for a player in their natural position"""
+        return player_rating.player_rating(player)
+
+    @staticmethod
+    def get_position_rating(player, position: str) -> float:
+        """Rate a player's attributes as if playing in the given position"""
+        return player_rating.position_rating(player, position)
+
+    def auto_select_team(self, team_id: int, formation: str = None):
+        """Automatically select the best XI for a formation (4-4-2 by default).
 
-    def auto_select_team(self, team_id: int):
-        """Automatically select best 11 players in a 4-4-2 formation"""
+        Players may be picked out of position at a rating penalty; the
+        lineup solver finds the assignment with the highest total rating.
+        """
         # Clear current selection
-        self.selected_players = {}
+        self.set_lineup([])
+        self.formation = formation or lineup_solver.DEFAULT_FORMATION
         
         # Get all players from the team
-        all_players = self.db.get_team_players(team_id)
+        all_players = self.db.player_store().team_players(team_id)
         if not all_players:
             return False
 
-        # Group players by position
-        players_by_position = {
-            'GK': [],
-            'DEF': [],
-            'MID': [],
-            'ATT': []
-        }
-
-        # Sort players into positions and calculate their ratings
-        for player in all_players:
-            pos = player['position']
-            if pos in players_by_position:
-                players_by_position[pos].append(player)
+        self.set_lineup(lineup_solver.best_lineup(all_players, self.formation))
 
-        # Sort each position group by rating
-        for pos in players_by_position:
-            players_by_position[pos].sort(
-                key=lambda p: self.get_player_rating(p),
-                reverse=True
-            )
-
-        # Select players according to 4-4-2 formation
-        formation = {
-            'GK': 1,
-            'DEF': 4,
-            'MID': 4,
-            'ATT': 2
-        }
-
-        # Select best players for each position
-        for pos, count in formation.items():
-            available_players = players_by_position[pos]
-            for i in range(min(count, len(available_players))):
-                player = available_players[i]
-                self.selected_players[player['id']] = player
-
-        # Check if we have a valid selection (11 players)
+        # Check if we have a valid selection (11 players, one in goal)
         if self.is_valid_selection():
             # Save the selection to database
             self.save_selection(team_id)
             return True
         return False
+
+    def auto_select_teams(self, team_ids=None, formation: str = None) -> int:
+        """Pick and save the best XI for many clubs (all of them by default) at once.
+
+        Line-ups come from the in-memory player store, and every selection is
+        written in one transaction that only touches changed rows. Clubs
+        without a valid XI keep their old selection. Returns the number of
+        clubs saved.
+        """
+        formation = formation or lineup_solver.DEFAULT_FORMATION
+        if team_ids is None:
+            with self.db.connect_readonly() as conn:
+                team_ids = [row[0] for row in conn.execute("SELECT id FROM teams ORDER BY id")]
+        lineups = lineup_solver.best_lineups(self.db.player_store(), team_ids, dict.fromkeys(team_ids, formation))
+        selections = {team_id: [player['id'] for slot, player in lineup]
+                      for team_id, lineup in lineups.items() if self.is_valid_lineup(lineup)}
+        self.db.save_team_selections(selections)
+        return len(selections)
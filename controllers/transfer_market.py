@@ -0,0 +1,283 @@
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from controllers.instrumentation import instrument_methods
+from controllers.lineup_solver import DEFAULT_FORMATION, FORMATIONS
+from controllers.player_rating import POSITIONS
+
+
+@instrument_methods()
+class TransferMarket:
+    """Player search, the manager's own purchases and the AI transfer window.
+
+    Searches are single indexed queries (idx_players_position_rating).
+    The AI window loads every player once into NumPy arrays; each round
+    then matches all clubs against all targets of a position in one
+    boolean matrix and settles competing bids highest first. Nothing is
+    scanned per club. Finished transfers are written in one transaction.
+    """
+    STARTERS = FORMATIONS[DEFAULT_FORMATION]  # Players per position a club wants to field
+    BUDGET_SHARE = 0.25     # Part of a club's finances it will spend in one window
+    MIN_UPGRADE = 3.0       # A target must beat the club's weakest starter by this much
+    MAX_TARGET_AGE = 32
+    BID_PREMIUM = 0.2       # Top-reputation clubs bid up to this much over the asking price
+    ROUNDS = 3              # Outbid clubs go again for their next choice
+    NEW_CONTRACT_YEARS = 3
+    MAX_SQUAD_SIZE = 25     # Generated squads hold 20 (PlayerCreator.SQUAD_POSITIONS); leaves room for 5 signings
+
+    SEARCH_COLUMNS = """
+        SELECT p.id, p.first_name, p.last_name, p.team_id, t.name AS team, t.division_id,
+               p.age, p.position, p.rating, p.value, p.wages, p.contract_years
+        FROM players p
+        LEFT JOIN teams t ON p.team_id = t.id
+    """
+    # One statement per filter combination; each starts from the position/rating index
+    SEARCH_FILTERS = {
+        'position': "p.position = ?",
+        'min_rating': "p.rating >= ?",
+        'max_rating': "p.rating <= ?",
+        'min_age': "p.age >= ?",
+        'max_age': "p.age <= ?",
+        'min_value': "p.value >= ?",
+        'max_value': "p.value <= ?",
+        'division_id': "t.division_id = ?",
+        'exclude_team_id': "p.team_id IS NOT ?",
+    }
+    INSERT_TRANSFER_SQL = """
+        INSERT INTO transfers (season, player_id, from_team_id, to_team_id, fee)
+        VALUES (?, ?, ?, ?, ?)
+    """
+
+    def __init__(self, db):
+        self.db = db
+
+    def current_season(self) -> int:
+        with self.db.connect_readonly() as conn:
+            row = conn.execute("SELECT MAX(season) FROM league_tables").fetchone()
+        return row[0] or 1
+
+    @staticmethod
+    def asking_price(value: int, team_id) -> int:
+        """Fee a club wants for a player; free agents cost nothing"""
+        return 0 if team_id is None else int(value)
+
+    def search(self, limit: int = 50, free_agents: bool = False, **filters) -> List[Dict]:
+        """Best-rated players matching the filters (see SEARCH_FILTERS).
+
+        free_agents=True restricts the search to players without a club.
+        """
+        unknown = set(filters) - set(self.SEARCH_FILTERS)
+        if unknown:
+            raise ValueError(f"Unknown search filters: {', '.join(sorted(unknown))}")
+        clauses = [self.SEARCH_FILTERS[name] for name, value in filters.items() if value is not None]
+        params = [value for value in filters.values() if value is not None]
+        if free_agents:
+            clauses.append("p.team_id IS NULL")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        self.db.refresh_ratings()
+        with self.db.connect_readonly() as conn:
+            cursor = conn.execute(f"{self.SEARCH_COLUMNS} {where} ORDER BY p.rating DESC LIMIT ?",
+                                  params + [limit])
+            return [dict(row) for row in cursor.fetchall()]
+
+    def buy(self, player_id: int, team_id: int) -> Dict:
+        """Sign a player for the manager's club at the asking price.
+
+        Raises ValueError if the club already has the player, its squad is
+        full, or it can't afford the fee.
+        """
+        conn = self.db.connect()
+        with conn:
+            player = conn.execute("SELECT id, team_id, value FROM players WHERE id = ?", (player_id,)).fetchone()
+            if player is None:
+                raise ValueError(f"Player {player_id} does not exist")
+            if player['team_id'] == team_id:
+                raise ValueError("That player already plays for you")
+            squad_size = conn.execute("SELECT COUNT(*) FROM players WHERE team_id = ?", (team_id,)).fetchone()[0]
+            if squad_size >= self.MAX_SQUAD_SIZE:
+                raise ValueError(f"Your squad is full ({self.MAX_SQUAD_SIZE} players)")
+            fee = self.asking_price(player['value'], player['team_id'])
+            finances = conn.execute("SELECT finances FROM teams WHERE id = ?", (team_id,)).fetchone()[0]
+            if fee > finances:
+                raise ValueError(f"Not enough money: the fee is {fee:,}, you have {finances:,}")
+            transfer = (self.current_season(), player_id, player['team_id'], team_id, fee)
+            self.write_transfers(conn.cursor(), [transfer])
+        self.db.invalidate_player_store()
+        logging.info(f"Team {team_id} signed player {player_id} for {fee}")
+        return {'player_id': player_id, 'from_team_id': player['team_id'], 'to_team_id': team_id, 'fee': fee}
+
+    def write_transfers(self, cursor, transfers: List[tuple]):
+        """Move players and money for (season, player, from, to, fee) rows"""
+        cursor.executemany(
+            "UPDATE players SET team_id = ?, is_selected = 0, contract_years = ? WHERE id = ?",
+            [(to_team, self.NEW_CONTRACT_YEARS, player_id) for _, player_id, _, to_team, _ in transfers])
+        money = {}
+        for _, _, from_team, to_team, fee in transfers:
+            money[to_team] = money.get(to_team, 0) - fee
+            if from_team is not None:
+                money[from_team] = money.get(from_team, 0) + fee
+        cursor.executemany("UPDATE teams SET finances = finances + ? WHERE id = ?",
+                           [(delta, team) for team, delta in money.items()])
+        cursor.executemany(self.INSERT_TRANSFER_SQL, transfers)
+
+    def load_market(self) -> Dict[str, np.ndarray]:
+        """Every player and club as NumPy columns for the AI window"""
+        self.db.refresh_ratings()
+        with self.db.connect_readonly() as conn:
+            players = conn.execute("SELECT id, team_id, position, rating, age, value FROM players").fetchall()
+            clubs = conn.execute("SELECT id, reputation, finances FROM teams ORDER BY id").fetchall()
+        position_index = {position: i for i, position in enumerate(POSITIONS)}
+        return {
+            'id': np.array([row[0] for row in players], dtype=np.int64),
+            'team': np.array([row[1] or 0 for row in players], dtype=np.int64),  # 0 = free agent
+            'position': np.array([position_index.get(row[2], -1) for row in players], dtype=np.int64),
+            'rating': np.array([row[3] or 0.0 for row in players], dtype=np.float64),
+            'age': np.array([row[4] or 0 for row in players], dtype=np.int64),
+            'value': np.array([row[5] or 0 for row in players], dtype=np.int64),
+            'club': np.array([row[0] for row in clubs], dtype=np.int64),
+            'reputation': np.array([row[1] or 50 for row in clubs], dtype=np.float64),
+            'finances': np.array([row[2] or 0 for row in clubs], dtype=np.float64),
+        }
+
+    def needs(self, market: Dict[str, np.ndarray], position: int) -> np.ndarray:
+        """Rating of each club's weakest starter at a position (0 when short of starters)"""
+        starters = self.STARTERS[POSITIONS[position]]
+        mask = (market['position'] == position) & np.isin(market['team'], market['club'])
+        team = market['team'][mask]
+        rating = market['rating'][mask]
+        order = np.lexsort((-rating, team))  # By club, best first
+        team, rating = team[order], rating[order]
+        first = np.searchsorted(team, team)  # Index of each club's best player
+        weakest = (np.arange(len(team)) - first) == starters - 1
+        need = np.zeros(len(market['club']))
+        need[np.searchsorted(market['club'], team[weakest])] = rating[weakest]
+        return need
+
+    def ai_window(self, exclude_team_ids: Iterable[int] = ()) -> Dict:
+        """Let every AI club bid for upgrades in a batched deadline-day pass.
+
+        Clubs in exclude_team_ids (the manager's) neither buy nor sell.
+        Returns a report with the bids placed, transfers made and timing.
+        """
+        start = time.perf_counter()
+        market = self.load_market()
+        clubs = market['club']
+        club_row = {club: i for i, club in enumerate(clubs.tolist())}
+        excluded = np.isin(clubs, list(exclude_team_ids))
+        budget = np.where(excluded, -1.0, market['finances'] * self.BUDGET_SHARE)
+        premium = 1 + self.BID_PREMIUM * market['reputation'] / 100
+        asking = np.where(market['team'] > 0, market['value'], 0).astype(np.float64)
+        available = (market['age'] <= self.MAX_TARGET_AGE) & (market['position'] >= 0)
+        available &= ~np.isin(market['team'], clubs[excluded])
+        # Squad sizes per (club, position), so nobody sells below their starters
+        squad = np.zeros((len(clubs), len(POSITIONS)), dtype=np.int64)
+        owned = np.isin(market['team'], clubs)
+        np.add.at(squad, (np.searchsorted(clubs, market['team'][owned]), market['position'][owned]), 1)
+
+        season = self.current_season()
+        transfers = []
+        bids_placed = 0
+        for _ in range(self.ROUNDS):
+            bid_players, bid_clubs, bid_amounts = [], [], []
+            for position in range(len(POSITIONS)):
+                need = self.needs(market, position)
+                targets = np.flatnonzero(available & (market['position'] == position))
+                if not len(targets):
+                    continue
+                targets = targets[np.argsort(-market['rating'][targets], kind='stable')]
+                price = asking[targets][None, :] * premium[:, None]
+                # clubs x targets: affordable, an upgrade, not already theirs; first hit is the best
+                wanted = ((price <= budget[:, None])
+                          & (market['rating'][targets][None, :] > need[:, None] + self.MIN_UPGRADE)
+                          & (market['team'][targets][None, :] != clubs[:, None]))
+                choice = wanted.argmax(axis=1)
+                bidding = np.flatnonzero(wanted[np.arange(len(clubs)), choice])
+                bid_players.append(targets[choice[bidding]])
+                bid_clubs.append(bidding)
+                bid_amounts.append(price[bidding, choice[bidding]])
+            if not bid_players or not sum(len(bids) for bids in bid_players):
+                break
+            players = np.concatenate(bid_players)
+            buyers = np.concatenate(bid_clubs)
+            amounts = np.concatenate(bid_amounts)
+            bids_placed += len(players)
+
+            # Highest bid for each player wins, if the buyer can still pay and the seller can spare him
+            order = np.argsort(-amounts, kind='stable')
+            players, buyers, amounts = players[order], buyers[order], amounts[order]
+            _, winners = np.unique(players, return_index=True)
+            moved = 0
+            for i in sorted(winners.tolist()):
+                player, buyer, fee = int(players[i]), int(buyers[i]), float(amounts[i])
+                position = int(market['position'][player])
+                seller_team = int(market['team'][player])
+                seller = club_row.get(seller_team)
+                if fee > budget[buyer]:
+                    continue
+                if seller is not None and squad[seller, position] <= self.STARTERS[POSITIONS[position]]:
+                    continue
+                budget[buyer] -= fee
+                squad[buyer, position] += 1
+                if seller is not None:
+                    squad[seller, position] -= 1
+                market['team'][player] = clubs[buyer]
+                available[player] = False
+                transfers.append((season, int(market['id'][player]), seller_team or None,
+                                  int(clubs[buyer]), int(round(fee))))
+                moved += 1
+            if not moved:
+                break
+
+        if transfers:
+            conn = self.db.connect()
+            with conn:
+                self.write_transfers(conn.cursor(), transfers)
+            self.db.invalidate_player_store()
+        report = {'players': len(market['id']), 'clubs': len(clubs), 'bids': bids_placed,
+                  'transfers': len(transfers), 'fees': sum(t[4] for t in transfers),
+                  'ms': (time.perf_counter() - start) * 1000}
+        logging.info(f"AI transfer window: {report}")
+        return report
+
+
+def main(argv=None):
+    """Time a deadline-day AI pass on a throwaway database with many players"""
+    parser = argparse.ArgumentParser(description="Run the AI transfer window on a large database")
+    parser.add_argument('--players', type=int, default=50000, help="roughly how many players to generate")
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args(argv)
+
+    from database.database import FootballDB
+    from controllers.league_table import LeagueTable
+    from controllers.player_creation import PlayerCreator
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db = FootballDB(os.path.join(workdir, 'market.db'))
+        for division_id in range(1, 5):
+            LeagueTable(db).initialize_league_table(division_id)
+        creator = PlayerCreator()
+        with db.connect_readonly() as conn:
+            teams = conn.execute("SELECT id, reputation FROM teams").fetchall()
+        per_team = max(1, args.players // len(teams) // len(POSITIONS))
+        batch = creator.generate_batch([(team_id, position, reputation, per_team)
+                                        for team_id, reputation in teams for position in POSITIONS],
+                                       seed=args.seed)
+        with db.connect() as conn:
+            conn.executemany(db.INSERT_PLAYER_SQL, [row + (0,) for row in creator.batch_rows(batch)])
+        db.refresh_ratings()
+        report = TransferMarket(db).ai_window()
+        db.close()
+    print(f"{report['players']} players, {report['clubs']} clubs: {report['bids']} bids, "
+          f"{report['transfers']} transfers in {report['ms']:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
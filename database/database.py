@@ -2,114 +2,234 @@
 import sqlite3
 import os
 import logging
+import shutil
 from typing import List, Dict, Any
 import random
 import csv
+import time
+import threading
+from urllib.request import pathname2url
 from controllers.player_creation import PlayerCreator  # Add this import
+from controllers import player_rating
+from controllers.instrumentation import instrumentation, instrument_methods, InstrumentedConnection
+from database import migrations
+from database.player_store import PlayerStore
 
+@instrument_methods(exclude=('connect', 'connect_readonly', 'close'))
 class FootballDB:
-    def __init__(self):
+    # Connection tuning applied to every read/write connection
+    PRAGMAS = (
+        "PRAGMA journal_mode=WAL",       # Readers don't block the writer and vice versa
+        "PRAGMA synchronous=NORMAL",     # Safe with WAL, far fewer fsyncs
+        "PRAGMA cache_size=-16000",      # 16 MB page cache
+        "PRAGMA mmap_size=67108864",     # 64 MB memory-mapped I/O
+        "PRAGMA temp_store=MEMORY",
+    )
+    STATEMENT_CACHE_SIZE = 256  # Prepared statements kept per connection
+    # Schema plus seeded divisions and teams, built once and copied for every new database
+    TEMPLATE_PATH = os.path.join('database', 'template.db')
+
+    _shared = None
+    _shared_lock = threading.Lock()
+    _logging_configured = False
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or os.path.join('database', 'football.db')
         # Create database directory if it doesn't exist
-        os.makedirs('database', exist_ok=True)
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
         os.makedirs('logs', exist_ok=True)
         
-        self.db_path = os.path.join('database', 'football.db')
         print(f"Database path: {os.path.abspath(self.db_path)}")  # Debug print
-        self.conn = None
+        # Connections are per thread so a background worker can write while the UI reads
+        self._local = threading.local()
+        self._player_store = None
         self.setup_logging()
         
-        # Only initialize if database doesn't exist
+        # Create a missing database from the seed template, otherwise upgrade its schema in place
         if not os.path.exists(self.db_path):
-            self.initialize_database()
+            self.create_from_template()
+        else:
+            self.migrate()
+
+    @classmethod
+    def shared(cls) -> 'FootballDB':
+        """Return the process-wide FootballDB, creating it on first use"""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
 
     def setup_logging(self):
+        if FootballDB._logging_configured:
+            return
         logging.basicConfig(
             filename=os.path.join('logs', 'database.log'),
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s'
         )
+        FootballDB._logging_configured = True
+
+    def _open(self, uri: str, readonly: bool = False) -> sqlite3.Connection:
+        # Per-statement timings cost a Python call per execute, so only when asked for
+        factory = InstrumentedConnection if instrumentation.enabled else sqlite3.Connection
+        conn = sqlite3.connect(uri, uri=True, cached_statements=self.STATEMENT_CACHE_SIZE, factory=factory)
+        conn.row_factory = sqlite3.Row
+        for pragma in self.PRAGMAS:
+            if readonly and 'journal_mode' in pragma:
+                continue  # Journal mode can only be changed by a writer
+            conn.execute(pragma)
+        return conn
+
+    @property
+    def conn(self):
+        return getattr(self._local, 'conn', None)
 
     def connect(self):
+        """Return this thread's read/write connection, opening it once"""
         try:
             if self.conn is None:
-                self.conn = sqlite3.connect(self.db_path)
-                self.conn.row_factory = sqlite3.Row
+                self._local.conn = self._open(f"file:{pathname2url(os.path.abspath(self.db_path))}")
             return self.conn
         except sqlite3.Error as e:
             logging.error(f"Database connection error: {e}")
             print(f"Database connection error: {e}")  # Debug print
             raise
 
-    def initialize_database(self):
+    def connect_readonly(self):
+        """Return this thread's read-only connection for UI queries.
+
+        In WAL mode this reads the last committed state without blocking
+        (or being blocked by) a writer on another connection.
+        """
+        try:
+            if getattr(self._local, 'readonly_conn', None) is None:
+                self.connect()  # Make sure the file exists and WAL is enabled
+                self._local.readonly_conn = self._open(
+                    f"file:{pathname2url(os.path.abspath(self.db_path))}?mode=ro", readonly=True)
+            return self._local.readonly_conn
+        except sqlite3.Error as e:
+            logging.error(f"Database connection error: {e}")
+            print(f"Database connection error: {e}")  # Debug print
+            raise
+
+    def player_store(self) -> PlayerStore:
+        """Return the in-memory columnar player store (loaded on first read)"""
+        if self._player_store is None:
+            self._player_store = PlayerStore(self)
+        return self._player_store
+
+    def invalidate_player_store(self):
+        """Call after bulk changes to the players table so the store reloads"""
+        if self._player_store is not None:
+            self._player_store.invalidate()
+
+    def data_version(self) -> tuple:
+        """Changes whenever committed data or the in-memory player store changes.
+
+        PRAGMA data_version on this thread's read-only connection moves on
+        every commit made by any other connection, which includes the job
+        worker and this thread's own writer.
+        """
+        committed = self.connect_readonly().execute("PRAGMA data_version").fetchone()[0]
+        return (committed, self._player_store.version if self._player_store is not None else 0)
+
+    STALE_RATINGS_SQL = f"""
+        SELECT id, position, {', '.join(player_rating.ATTRIBUTES)}
+        FROM players
+        WHERE rating IS NULL
+    """
+    UPDATE_RATINGS_SQL = f"""
+        UPDATE players SET {', '.join(f'{column} = ?' for column in player_rating.RATING_COLUMNS)}
+        WHERE id = ?
+    """
+
+    def _refresh_ratings(self, cursor) -> int:
+        # No commit here so squad generation can rate players in its own transaction
+        rows = player_rating.rating_rows(cursor.execute(self.STALE_RATINGS_SQL).fetchall())
+        if rows:
+            cursor.executemany(self.UPDATE_RATINGS_SQL, rows)
+        return len(rows)
+
+    def refresh_ratings(self) -> int:
+        """Recompute cached ratings for players whose attributes changed.
+
+        A trigger clears the rating columns when a rated attribute changes,
+        so only those rows are read and rated, in one vectorized pass.
+        Returns the number of players rated.
+        """
         with self.connect() as conn:
+            rated = self._refresh_ratings(conn.cursor())
+        if rated:
+            logging.info(f"Refreshed ratings for {rated} players")
+        return rated
+
+    def migrate(self) -> List[int]:
+        """Bring the schema up to date, returning the migration versions applied"""
+        applied = migrations.migrate(self.connect())
+        if applied:
+            logging.info(f"Applied database migrations: {applied}")
+        return applied
+
+    def close(self):
+        """Close this thread's connections"""
+        for name in ('conn', 'readonly_conn'):
+            conn = getattr(self._local, name, None)
+            if conn is not None:
+                conn.close()
+                setattr(self._local, name, None)
+
+    def create_from_template(self):
+        """Create the database by copying the seed template, building the template first if needed.
+
+        A file copy replaces the schema migrations and ~90 single-row team
+        inserts of initialize_database(). The copy is migrated afterwards in
+        case the template predates the newest migration.
+        """
+        start = time.perf_counter()
+        template = self.TEMPLATE_PATH
+        if os.path.abspath(template) == os.path.abspath(self.db_path):
+            self.initialize_database()
+            return
+        if not os.path.exists(template):
+            self.initialize_database()
+            self.write_template()
+        else:
+            shutil.copyfile(template, self.db_path)
+            self.migrate()
+        logging.info(f"Created {self.db_path} from the seed template in "
+                     f"{(time.perf_counter() - start) * 1000:.1f} ms")
+
+    def write_template(self):
+        """Snapshot the freshly seeded database as the seed template"""
+        temp_path = self.TEMPLATE_PATH + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.TEMPLATE_PATH) or '.', exist_ok=True)
+            target = sqlite3.connect(temp_path)
+            try:
+                self.connect().backup(target)
+                # A single self-contained file, so a plain copy of it is a valid database
+                target.execute("PRAGMA journal_mode=DELETE")
+            finally:
+                target.close()
+            os.replace(temp_path, self.TEMPLATE_PATH)
+        except (OSError, sqlite3.Error) as e:
+            # Only a cache: the next new database is seeded from scratch again
+            logging.error(f"Could not write the seed template: {e}")
+
+    def initialize_database(self):
+        """Recreate the schema from scratch and seed divisions and teams"""
+        conn = self.connect()
+        # First drop all existing tables
+        for table in ('lineups', 'transfers', 'season_history', 'fixtures', 'players', 'league_tables', 'teams', 'divisions', 'schema_version'):
+            conn.execute(f'DROP TABLE IF EXISTS {table}')
+        conn.commit()
+
+        # Now create tables and indexes by running every migration
+        migrations.migrate(conn)
+        self.invalidate_player_store()
+
+        with conn:
             cursor = conn.cursor()
-            
-            # First drop all existing tables
-            cursor.execute('DROP TABLE IF EXISTS players')
-            cursor.execute('DROP TABLE IF EXISTS league_tables')
-            cursor.execute('DROP TABLE IF EXISTS teams')
-            cursor.execute('DROP TABLE IF EXISTS divisions')
-            
-            # Now create tables in correct order
-            cursor.execute('''
-                CREATE TABLE divisions (
-                    id INTEGER PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    level INTEGER NOT NULL
-                )
-            ''')
-
-            cursor.execute('''
-                CREATE TABLE teams (
-                    id INTEGER PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    division_id INTEGER,
-                    reputation INTEGER,
-                    finances INTEGER,
-                    FOREIGN KEY (division_id) REFERENCES divisions(id)
-                )
-            ''')
-
-            cursor.execute('''
-                CREATE TABLE players (
-                    id INTEGER PRIMARY KEY,
-                    first_name TEXT NOT NULL,
-                    last_name TEXT NOT NULL,
-                    team_id INTEGER,
-                    age INTEGER,
-                    position TEXT,
-                    attacking INTEGER,
-                    defending INTEGER,
-                    goalkeeping INTEGER,
-                    stamina INTEGER,
-                    speed INTEGER,
-                    morale INTEGER,
-                    value INTEGER,
-                    wages INTEGER,
-                    contract_years INTEGER,
-                    is_selected INTEGER DEFAULT 0,
-                    FOREIGN KEY (team_id) REFERENCES teams(id)
-                )
-            ''')
-
-            # Create league_tables table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS league_tables (
-                    id INTEGER PRIMARY KEY,
-                    team_id INTEGER,
-                    division_id INTEGER,
-                    played INTEGER DEFAULT 0,
-                    won INTEGER DEFAULT 0,
-                    drawn INTEGER DEFAULT 0,
-                    lost INTEGER DEFAULT 0,
-                    goals_for INTEGER DEFAULT 0,
-                    goals_against INTEGER DEFAULT 0,
-                    points INTEGER DEFAULT 0,
-                    season INTEGER,
-                    FOREIGN KEY (team_id) REFERENCES teams(id),
-                    FOREIGN KEY (division_id) REFERENCES divisions(id)
-                )
-            ''')
 
             # Initialize divisions
             divisions = [
@@ -232,22 +352,55 @@ class FootballDB:
             ]
 
             cursor.execute("DELETE FROM teams")  # Clear existing teams
-            for team in teams_data:
-                cursor.execute("""
-                    INSERT INTO teams (name, division_id, reputation, finances)
-                    VALUES (?, ?, ?, ?)
-                """, team)
+            cursor.executemany("""
+                INSERT INTO teams (name, division_id, reputation, finances)
+                VALUES (?, ?, ?, ?)
+            """, teams_data)
 
     def get_team_details(self, team_id: int) -> Dict[str, Any]:
-        with self.connect() as conn:
+        with self.connect_readonly() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM teams WHERE id = ?", (team_id,))
             result = cursor.fetchone()
             return dict(result) if result else None
     
-    def generate_squad_for_team(self, team_id):
+    INSERT_PLAYER_SQL = """
+        INSERT INTO players (
+            first_name, last_name, team_id, age, position,
+            attacking, defending, goalkeeping, stamina, speed,
+            morale, value, wages, contract_years, is_selected
+        ) VALUES (
+            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+        )
+    """
+
+    TEAM_PLAYERS_SQL = """
+        SELECT * FROM players 
+        WHERE team_id = ?
+        ORDER BY position, last_name
+    """
+
+    TEAMS_IN_DIVISION_SQL = """
+        SELECT * FROM teams 
+        WHERE division_id = ?
+        ORDER BY name
+    """
+
+    @staticmethod
+    def player_row(player: Dict[str, Any]) -> tuple:
+        """Flatten a generated player dict into an INSERT_PLAYER_SQL parameter tuple"""
+        return (
+            player['first_name'], player['last_name'], player['team_id'],
+            player['age'], player['position'], player['attacking'],
+            player['defending'], player['goalkeeping'], player['stamina'],
+            player['speed'], player['morale'], player['value'],
+            player['wages'], player['contract_years'], 0  # Initialize is_selected as 0
+        )
+
+    def generate_squad_for_team(self, team_id, creator=None):
+        conn = None
         try:
-            creator = PlayerCreator()
+            creator = creator or PlayerCreator()
             conn = self.connect()
             cursor = conn.cursor()
             
@@ -260,77 +413,90 @@ class FootballDB:
             squad = creator.generate_squad(team_id, team_details['reputation'])
             
             # Insert all players into database
-            for player in squad:
-                cursor.execute("""
-                    INSERT INTO players (
-                        first_name, last_name, team_id, age, position,
-                        attacking, defending, goalkeeping, stamina, speed,
-                        morale, value, wages, contract_years, is_selected
-                    ) VALUES (
-                        ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-                    )
-                """, (
-                    player['first_name'], player['last_name'], player['team_id'],
-                    player['age'], player['position'], player['attacking'],
-                    player['defending'], player['goalkeeping'], player['stamina'],
-                    player['speed'], player['morale'], player['value'],
-                    player['wages'], player['contract_years'], 0  # Initialize is_selected as 0
-                ))
+            cursor.executemany(self.INSERT_PLAYER_SQL, [self.player_row(p) for p in squad])
+            self._refresh_ratings(cursor)
             conn.commit()
-            
-            # Debug: Verify players were inserted
-            cursor.execute("SELECT COUNT(*) FROM players WHERE team_id = ?", (team_id,))
-            count = cursor.fetchone()[0]
-            print(f"Added {count} players for team {team_id}")
+            self.invalidate_player_store()
+            print(f"Added {len(squad)} players for team {team_id}")
             
         except Exception as e:
             print(f"Error generating squad for team {team_id}: {e}")
             if conn:
                 conn.rollback()
 
-    def generate_all_teams_squads(self):
-        print("Starting squad generation...")  # Debug print
+    def generate_all_teams_squads(self) -> Dict[str, Any]:
+        """Generate squads for every team in one pass and one transaction.
+
+        Teams are read once, every squad is drawn in one vectorized
+        PlayerCreator.generate_batch call, and all players are written with
+        one executemany, then rated in the same transaction. Returns a timing
+        report (also logged) so New Game latency can be tracked.
+        """
+        logging.info("Starting squad generation")
+        conn = None
+        report = None
         try:
+            start = time.perf_counter()
             conn = self.connect()
             cursor = conn.cursor()
-            cursor.execute("SELECT id FROM teams")
+            cursor.execute("SELECT id, reputation FROM teams")
             teams = cursor.fetchall()
             
-            print(f"Found {len(teams)} teams to generate squads for")  # Debug print
+            logging.info(f"Found {len(teams)} teams to generate squads for")
             
-            # Clear all existing players first
-            cursor.execute("DELETE FROM players")
-            conn.commit()
-            
-            for team in teams:
-                print(f"Generating squad for team {team[0]}")  # Debug print
-                self.generate_squad_for_team(team[0])
-            
-            conn.commit()
-            print("Squad generation complete")  # Debug print
+            creator = PlayerCreator()
+            loaded = time.perf_counter()
+
+            batch = creator.generate_batch(
+                creator.squad_specs((team['id'], team['reputation']) for team in teams))
+            rows = [row + (0,) for row in creator.batch_rows(batch)]
+            generated = time.perf_counter()
+
+            # Replace all existing players in a single transaction
+            with conn:
+                cursor.execute("DELETE FROM players")
+                cursor.executemany(self.INSERT_PLAYER_SQL, rows)
+                self._refresh_ratings(cursor)
+            written = time.perf_counter()
+            self.invalidate_player_store()
+
+            report = {
+                'teams': len(teams),
+                'players': len(rows),
+                'setup_ms': (loaded - start) * 1000,
+                'generate_ms': (generated - loaded) * 1000,
+                'insert_ms': (written - generated) * 1000,
+                'total_ms': (written - start) * 1000,
+            }
+            summary = (f"Squad generation complete: {report['players']} players for "
+                       f"{report['teams']} teams in {report['total_ms']:.1f} ms "
+                       f"(setup {report['setup_ms']:.1f} ms, generate {report['generate_ms']:.1f} ms, "
+                       f"insert {report['insert_ms']:.1f} ms)")
+            logging.info(summary)
         except sqlite3.Error as e:
             logging.error(f"Error generating squads: {e}")
             print(f"Error generating squads: {e}")  # Debug print
             if conn:
                 conn.rollback()
+        return report
 
     def clear_all_players(self):
         with self.connect() as conn:
             cursor = conn.cursor()
+            # History rows point at player ids, which the next squads reuse
+            cursor.execute("DELETE FROM lineups")
+            cursor.execute("DELETE FROM transfers")
             cursor.execute("DELETE FROM players")
+        self.invalidate_player_store()
 
     def get_teams_in_division(self, division_id: int) -> List[Dict[str, Any]]:
-        with self.connect() as conn:
+        with self.connect_readonly() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM teams 
-                WHERE division_id = ?
-                ORDER BY name
-            """, (division_id,))
+            cursor.execute(self.TEAMS_IN_DIVISION_SQL, (division_id,))
             return [dict(row) for row in cursor.fetchall()]
 
     def get_player_details(self, player_id: int) -> Dict[str, Any]:
-        with self.connect() as conn:
+        with self.connect_readonly() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT * FROM players WHERE id = ?", (player_id,))
             result = cursor.fetchone()
@@ -338,14 +504,10 @@ class FootballDB:
 
     def get_team_players(self, team_id: int) -> List[Dict[str, Any]]:
         try:
-            conn = self.connect()
+            conn = self.connect_readonly()
             cursor = conn.cursor()
             
-            cursor.execute("""
-                SELECT * FROM players 
-                WHERE team_id = ?
-                ORDER BY position, last_name
-            """, (team_id,))
+            cursor.execute(self.TEAM_PLAYERS_SQL, (team_id,))
             
             players = [dict(row) for row in cursor.fetchall()]
             return players
@@ -355,29 +517,60 @@ class FootballDB:
             print(f"Database error: {e}")
             return []
 
-    def save_team_selection(self, team_id: int, selected_player_ids: list):
+    # Flips only the rows whose flag differs from the new XI; {ids} is one ? per selected player
+    SAVE_SELECTION_SQL = """
+        UPDATE players
+        SET is_selected = id IN ({ids})
+        WHERE team_id = ? AND is_selected IS NOT (id IN ({ids}))
+    """
+
+    @classmethod
+    def save_selection_sql(cls, count: int) -> str:
+        return cls.SAVE_SELECTION_SQL.format(ids=', '.join('?' * count))
+
+    def save_team_selection(self, team_id: int, selected_player_ids: list) -> int:
+        """Store a team's XI, writing only the players whose flag changed.
+
+        Returns the number of players updated.
+        """
         try:
+            ids = list(selected_player_ids)
             with self.connect() as conn:
-                cursor = conn.cursor()
-                # First reset all players for this team
-                cursor.execute("""
-                    UPDATE players 
-                    SET is_selected = 0 
-                    WHERE team_id = ?
-                """, (team_id,))
-                
-                # Then set the selected players
-                for player_id in selected_player_ids:
-                    cursor.execute("""
-                        UPDATE players 
-                        SET is_selected = 1 
-                        WHERE id = ? AND team_id = ?
-                    """, (player_id, team_id))
-                conn.commit()
-                print(f"Saved selection for team {team_id}: {selected_player_ids}")
+                changed = conn.execute(self.save_selection_sql(len(ids)), ids + [team_id] + ids).rowcount
+            # Keep the in-memory store in step without re-writing what was just saved
+            if self._player_store is not None and self._player_store.loaded:
+                self._player_store.set_selection(team_id, ids, dirty=False)
+            logging.debug(f"Saved selection for team {team_id}: {changed} players changed")
+            return changed
         except sqlite3.Error as e:
             print(f"Error saving team selection: {e}")
             logging.error(f"Error saving team selection: {e}")
+            return 0
+
+    def save_team_selections(self, selections: Dict[int, List[int]]) -> int:
+        """Store many teams' XIs in one transaction; {team_id: player ids}.
+
+        Teams are grouped by XI size so each group is one executemany of
+        the diffing statement. Returns the number of players updated.
+        """
+        by_size = {}
+        for team_id, ids in selections.items():
+            ids = list(ids)
+            by_size.setdefault(len(ids), []).append(ids + [team_id] + ids)
+        try:
+            changed = 0
+            with self.connect() as conn:
+                for size, params in by_size.items():
+                    changed += conn.executemany(self.save_selection_sql(size), params).rowcount
+        except sqlite3.Error as e:
+            print(f"Error saving team selections: {e}")
+            logging.error(f"Error saving team selections: {e}")
+            return 0
+        if self._player_store is not None and self._player_store.loaded:
+            for team_id, ids in selections.items():
+                self._player_store.set_selection(team_id, ids, dirty=False)
+        logging.info(f"Saved selections for {len(selections)} teams ({changed} players changed)")
+        return changed
 
     def update_league_table(self, team_id: int, division_id: int, 
                           played: int, won: int, drawn: int, lost: int,
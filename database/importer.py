@@ -0,0 +1,399 @@
+# database/importer.py
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import time
+from collections import namedtuple
+from typing import Any, Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from controllers.player_rating import ATTRIBUTES, POSITIONS, RATING_COLUMNS, rate
+
+# How to read one column of an imported row; default REQUIRED rejects rows without it
+Field = namedtuple('Field', 'convert default low high')
+REQUIRED = object()
+
+
+def _int(value) -> int:
+    # Spreadsheet exports often write whole numbers as "72.0"
+    return value if isinstance(value, int) else int(float(value))
+
+
+def _text(value) -> str:
+    value = str(value).strip()
+    if not value:
+        raise ValueError("empty text")
+    return value
+
+
+def _position(value) -> str:
+    position = str(value).strip().upper()
+    if position not in POSITIONS:
+        raise ValueError(f"expected one of {', '.join(POSITIONS)}")
+    return position
+
+
+# Columns of each importable table, in INSERT order. The id column is optional
+# everywhere: rows without one get a new id, rows with one replace that row.
+FIELDS = {
+    'divisions': {
+        'id': Field(_int, None, 1, None),
+        'name': Field(_text, REQUIRED, None, None),
+        'level': Field(_int, REQUIRED, 1, None),
+    },
+    'teams': {
+        'id': Field(_int, None, 1, None),
+        'name': Field(_text, REQUIRED, None, None),
+        'division_id': Field(_int, REQUIRED, 1, None),
+        'reputation': Field(_int, 50, 1, 100),
+        'finances': Field(_int, 0, 0, None),
+    },
+    'players': dict(
+        id=Field(_int, None, 1, None),
+        first_name=Field(_text, REQUIRED, None, None),
+        last_name=Field(_text, REQUIRED, None, None),
+        team_id=Field(_int, None, 1, None),  # None for free agents
+        age=Field(_int, REQUIRED, 14, 50),
+        position=Field(_position, REQUIRED, None, None),
+        **{attribute: Field(_int, REQUIRED, 1, 99) for attribute in ATTRIBUTES},
+        morale=Field(_int, 70, 1, 99),
+        value=Field(_int, 0, 0, None),
+        wages=Field(_int, 0, 0, None),
+        contract_years=Field(_int, 1, 0, 10),
+        is_selected=Field(_int, 0, 0, 1),
+    ),
+}
+
+# Name columns community files use instead of ids: column -> (id column, lookup table)
+NAME_COLUMNS = {'division': ('division_id', 'divisions'), 'team': ('team_id', 'teams')}
+
+
+def iter_csv(file) -> Iterator[Dict[str, Any]]:
+    """One dict per CSV row, keyed by the header row"""
+    yield from csv.DictReader(file)
+
+
+def iter_ndjson(file) -> Iterator[Dict[str, Any]]:
+    """One object per line; blank lines are skipped.
+
+    A line that isn't valid JSON is yielded as its ValueError so the
+    importer can reject that row and carry on.
+    """
+    for line in file:
+        if line.strip():
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                yield ValueError(f"invalid JSON: {e}")
+
+
+def iter_json_array(file, chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """Stream the elements of a top-level JSON array without loading the file.
+
+    The file is read chunk_size characters at a time and each element is
+    parsed with raw_decode as soon as it is complete, so memory stays at
+    about one chunk plus one element however long the array is.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buffer, position, eof
+        chunk = file.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        buffer = buffer[position:] + chunk
+        position = 0
+        return True
+
+    def skip(characters: str):
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in characters:
+                position += 1
+            if position < len(buffer) or not fill():
+                return
+
+    skip(" \t\r\n")
+    if buffer[position:position + 1] != "[":
+        raise ValueError("expected a JSON array of objects")
+    position += 1
+    while True:
+        skip(" \t\r\n,")
+        if position >= len(buffer):
+            raise ValueError("unterminated JSON array")
+        if buffer[position] == "]":
+            return
+        while True:
+            try:
+                element, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                # Most likely cut off at the end of the buffer: read on and retry
+                if eof or not fill():
+                    raise
+                continue
+            if end == len(buffer) and not eof and fill():
+                continue  # A number may continue in the next chunk
+            break
+        position = end
+        yield element
+
+
+READERS = {'.csv': iter_csv, '.ndjson': iter_ndjson, '.jsonl': iter_ndjson, '.json': iter_json_array}
+
+
+class DatabaseImporter:
+    """Streams divisions, teams and players from CSV, JSON or NDJSON files.
+
+    Rows are read one at a time, validated against FIELDS and written with
+    executemany in chunks of CHUNK_SIZE, each chunk in its own transaction
+    with its players rated on the way in. Memory stays flat whatever
+    the file size. Rows that fail validation are counted and logged, not
+    imported. Teams and divisions may be given by name ("team",
+    "division") instead of id. Imported teams join the current season's
+    league tables (see enter_teams).
+    """
+    CHUNK_SIZE = 5000
+    MAX_LOGGED_ERRORS = 20
+
+    def __init__(self, db, chunk_size: int = None):
+        self.db = db
+        self.chunk_size = chunk_size or self.CHUNK_SIZE
+
+    @staticmethod
+    def table_for(path: str) -> str:
+        """Guess the table from the file name, e.g. players.csv or teams_2024.json"""
+        name = os.path.basename(path).lower()
+        for table in FIELDS:
+            if name.startswith(table) or name.startswith(table[:-1]):
+                return table
+        raise ValueError(f"Can't tell which table {path} holds; pass the table explicitly")
+
+    @staticmethod
+    def insert_sql(table: str) -> str:
+        columns = list(FIELDS[table])
+        if table == 'players':
+            columns += RATING_COLUMNS  # Rated before the insert, see with_ratings()
+        return f"""
+            INSERT OR REPLACE INTO {table} ({', '.join(columns)})
+            VALUES ({', '.join('?' for _ in columns)})
+        """
+
+    @staticmethod
+    def with_ratings(rows: List[tuple]) -> List[tuple]:
+        """Append the cached rating columns to a chunk of validated player rows.
+
+        Rating the chunk in one vectorized pass before inserting saves
+        refresh_ratings() a second read and UPDATE of every imported row.
+        """
+        columns = list(FIELDS['players'])
+        position = columns.index('position')
+        attribute_indexes = [columns.index(attribute) for attribute in ATTRIBUTES]
+        rating, slots = rate([[row[i] for i in attribute_indexes] for row in rows],
+                             [row[position] for row in rows])
+        return [row + ratings for row, ratings
+                in zip(rows, map(tuple, np.column_stack((rating, slots)).tolist()))]
+
+    def known_ids(self, conn, table: str) -> Tuple[set, Dict[str, int]]:
+        """Existing ids of a table and a lowercase name -> id map (first id wins)"""
+        ids = set()
+        names = {}
+        for row_id, name in conn.execute(f"SELECT id, name FROM {table} ORDER BY id"):
+            ids.add(row_id)
+            names.setdefault(name.lower(), row_id)
+        return ids, names
+
+    @staticmethod
+    def column_plan(table: str, keys) -> List[tuple]:
+        """How to read each column from records with these keys.
+
+        One (record key, column, field, name key, lookup) entry per column,
+        where name key/lookup resolve a team or division given by name.
+        Keys are matched case-insensitively. Built once per distinct key set
+        rather than normalising every row.
+        """
+        by_name = {str(key).strip().lower(): key for key in keys}
+        references = {id_column: (by_name.get(name_column), lookup)
+                      for name_column, (id_column, lookup) in NAME_COLUMNS.items()}
+        return [(by_name.get(column), column, field) + references.get(column, (None, None))
+                for column, field in FIELDS[table].items()]
+
+    @staticmethod
+    def validate(record: Dict[str, Any], plan: List[tuple], lookups: Dict[str, Tuple[set, Dict]]) -> tuple:
+        """Turn one raw record into an INSERT parameter tuple, or raise ValueError"""
+        values = []
+        for key, column, field, name_key, lookup in plan:
+            raw = record.get(key) if key is not None else None
+            if raw is None or raw == "":
+                name = record.get(name_key) if name_key is not None else None
+                if name is not None and name != "":
+                    row_id = lookups[lookup][1].get(str(name).strip().lower())
+                    if row_id is None:
+                        raise ValueError(f"unknown {lookup[:-1]} {name!r}")
+                    values.append(row_id)
+                    continue
+                if field.default is REQUIRED:
+                    raise ValueError(f"missing {column}")
+                values.append(field.default)
+                continue
+            try:
+                value = field.convert(raw)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"bad {column} {raw!r}: {e}") from None
+            if field.low is not None and value < field.low or field.high is not None and value > field.high:
+                raise ValueError(f"{column} {value} out of range")
+            # References must exist: import divisions, then teams, then players
+            if lookup is not None and value not in lookups[lookup][0]:
+                raise ValueError(f"{column} {value} does not exist")
+            values.append(value)
+        return tuple(values)
+
+    def import_records(self, table: str, records: Iterator[Any]) -> Dict[str, Any]:
+        """Validate and insert a stream of records; returns counts and throughput"""
+        start = time.perf_counter()
+        conn = self.db.connect()
+        cursor = conn.cursor()
+        lookups = {lookup: self.known_ids(conn, lookup) for lookup in ('divisions', 'teams')}
+        sql = self.insert_sql(table)
+        imported = rejected = 0
+        errors = []
+        chunk = []
+
+        def write(rows):
+            if table == 'players':
+                rows = self.with_ratings(rows)
+            with conn:
+                cursor.executemany(sql, rows)
+
+        plan_keys = plan = None
+        for number, record in enumerate(records, start=1):
+            try:
+                if isinstance(record, ValueError):
+                    raise record
+                if not isinstance(record, dict):
+                    raise ValueError("row is not an object")
+                if record.keys() != plan_keys:
+                    plan_keys = set(record)
+                    plan = self.column_plan(table, plan_keys)
+                row = self.validate(record, plan, lookups)
+            except ValueError as e:
+                rejected += 1
+                if len(errors) < self.MAX_LOGGED_ERRORS:
+                    errors.append(f"row {number}: {e}")
+                continue
+            chunk.append(row)
+            if len(chunk) >= self.chunk_size:
+                write(chunk)
+                imported += len(chunk)
+                chunk = []
+        if chunk:
+            write(chunk)
+            imported += len(chunk)
+
+        if table == 'players':
+            self.db.invalidate_player_store()
+        seconds = time.perf_counter() - start
+        report = {'table': table, 'imported': imported, 'rejected': rejected, 'errors': errors,
+                  'seconds': seconds, 'rows_per_second': imported / seconds if seconds else 0.0}
+        if table == 'teams' and imported:
+            report.update(self.enter_teams())
+        for error in errors:
+            logging.warning(f"Import into {table} skipped {error}")
+        logging.info(f"Imported {imported} rows into {table} ({rejected} rejected) "
+                     f"in {seconds:.2f} s, {report['rows_per_second']:.0f} rows/s")
+        return report
+
+    def enter_teams(self) -> Dict[str, Any]:
+        """Give every team a league table row and fixtures for the current season.
+
+        Existing rows are kept. The season is rescheduled only while none of
+        its fixtures have been played; otherwise new teams get fixtures at
+        the next rollover.
+        """
+        from controllers.fixtures import FixtureList  # Only needed once teams are imported
+
+        fixtures = FixtureList(self.db)
+        season = fixtures.current_season()
+        with self.db.connect() as conn:
+            league_rows = conn.execute("""
+                INSERT OR IGNORE INTO league_tables (team_id, division_id, season)
+                SELECT id, division_id, ? FROM teams WHERE division_id IS NOT NULL
+            """, (season,)).rowcount
+            played = conn.execute("SELECT 1 FROM fixtures WHERE season = ? AND home_goals IS NOT NULL LIMIT 1",
+                                  (season,)).fetchone()
+        if played:
+            logging.warning(f"Season {season} is under way; imported teams get fixtures from season {season + 1}")
+            return {'league_rows': league_rows, 'fixtures': 0}
+        return {'league_rows': league_rows, 'fixtures': fixtures.generate_season(season)}
+
+    def import_file(self, path: str, table: str = None) -> Dict[str, Any]:
+        """Stream one CSV, JSON array or NDJSON file into a table"""
+        table = table or self.table_for(path)
+        if table not in FIELDS:
+            raise ValueError(f"Can't import into {table}; expected one of {', '.join(FIELDS)}")
+        extension = os.path.splitext(path)[1].lower()
+        reader = READERS.get(extension)
+        if reader is None:
+            raise ValueError(f"Unsupported file type {extension}; expected {', '.join(READERS)}")
+        with open(path, 'r', encoding='utf-8-sig', newline='') as file:
+            report = self.import_records(table, reader(file))
+        report['path'] = path
+        report['mb'] = os.path.getsize(path) / (1024 * 1024)
+        return report
+
+    def clear(self, tables: List[str]):
+        """Delete the given tables' rows plus everything that depends on them"""
+        dependents = {
+            'divisions': ('lineups', 'transfers', 'season_history', 'fixtures', 'league_tables', 'players',
+                          'teams', 'divisions'),
+            'teams': ('lineups', 'transfers', 'season_history', 'fixtures', 'league_tables', 'players', 'teams'),
+            'players': ('lineups', 'transfers', 'players'),
+        }
+        doomed = []
+        for table in tables:
+            doomed += [name for name in dependents[table] if name not in doomed]
+        with self.db.connect() as conn:
+            for table in doomed:
+                conn.execute(f"DELETE FROM {table}")
+        self.db.invalidate_player_store()
+
+
+def main(argv=None):
+    """Import community databases: python -m database.importer teams.csv players.ndjson"""
+    parser = argparse.ArgumentParser(description="Stream CSV/JSON/NDJSON files into the game database")
+    parser.add_argument('files', nargs='+', help="files named after their table (divisions*, teams*, players*)")
+    parser.add_argument('--table', choices=list(FIELDS), help="table for every file, instead of guessing")
+    parser.add_argument('--db', help="database to import into (default database/football.db)")
+    parser.add_argument('--replace', action='store_true',
+                        help="empty the imported tables (and what depends on them) first")
+    parser.add_argument('--chunk-size', type=int, help=f"rows per transaction (default {DatabaseImporter.CHUNK_SIZE})")
+    args = parser.parse_args(argv)
+
+    from database.database import FootballDB
+
+    db = FootballDB(args.db) if args.db else FootballDB.shared()
+    importer = DatabaseImporter(db, args.chunk_size)
+    if args.replace:
+        importer.clear([args.table or importer.table_for(path) for path in args.files])
+    for path in args.files:
+        report = importer.import_file(path, args.table)
+        print(f"{report['path']}: {report['imported']} {report['table']} imported, "
+              f"{report['rejected']} rejected in {report['seconds']:.2f} s "
+              f"({report['rows_per_second']:.0f} rows/s, {report['mb'] / max(report['seconds'], 1e-9):.1f} MB/s)")
+        if 'league_rows' in report:
+            print(f"  {report['league_rows']} league table rows and {report['fixtures']} fixtures added")
+        for error in report['errors']:
+            print(f"  skipped {error}")
+    db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+# database/migrations.py
+import logging
+import sqlite3
+from typing import List
+
+# Ordered schema migrations: (version, description, steps).
+# A step is either an SQL string or a callable taking the connection.
+# Never edit a released migration - append a new one instead.
+MIGRATIONS = [
+    (1, "Base schema", [
+        '''
+        CREATE TABLE IF NOT EXISTS divisions (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            level INTEGER NOT NULL
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS teams (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            division_id INTEGER,
+            reputation INTEGER,
+            finances INTEGER,
+            FOREIGN KEY (division_id) REFERENCES divisions(id)
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS players (
+            id INTEGER PRIMARY KEY,
+            first_name TEXT NOT NULL,
+            last_name TEXT NOT NULL,
+            team_id INTEGER,
+            age INTEGER,
+            position TEXT,
+            attacking INTEGER,
+            defending INTEGER,
+            goalkeeping INTEGER,
+            stamina INTEGER,
+            speed INTEGER,
+            morale INTEGER,
+            value INTEGER,
+            wages INTEGER,
+            contract_years INTEGER,
+            is_selected INTEGER DEFAULT 0,
+            FOREIGN KEY (team_id) REFERENCES teams(id)
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS league_tables (
+            id INTEGER PRIMARY KEY,
+            team_id INTEGER,
+            division_id INTEGER,
+            played INTEGER DEFAULT 0,
+            won INTEGER DEFAULT 0,
+            drawn INTEGER DEFAULT 0,
+            lost INTEGER DEFAULT 0,
+            goals_for INTEGER DEFAULT 0,
+            goals_against INTEGER DEFAULT 0,
+            points INTEGER DEFAULT 0,
+            season INTEGER,
+            FOREIGN KEY (team_id) REFERENCES teams(id),
+            FOREIGN KEY (division_id) REFERENCES divisions(id)
+        )
+        ''',
+    ]),
+    (2, "Indexes for squad, division and league table lookups", [
+        # get_team_players: WHERE team_id ORDER BY position, last_name
+        "CREATE INDEX IF NOT EXISTS idx_players_team_position ON players (team_id, position, last_name)",
+        # get_teams_in_division: WHERE division_id ORDER BY name
+        "CREATE INDEX IF NOT EXISTS idx_teams_division_name ON teams (division_id, name)",
+        # get_league_table: WHERE division_id (AND season) ORDER BY points
+        "CREATE INDEX IF NOT EXISTS idx_league_tables_division ON league_tables (division_id, season, points)",
+    ]),
+    (3, "One league table row per team and season", [
+        # Drop duplicate rows left behind by older builds before enforcing uniqueness
+        '''
+        DELETE FROM league_tables
+        WHERE id NOT IN (
+            SELECT MIN(id) FROM league_tables GROUP BY team_id, season
+        )
+        ''',
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_league_tables_team_season ON league_tables (team_id, season)",
+    ]),
+    (4, "Cached player ratings, cleared whenever rated attributes change", [
+        "ALTER TABLE players ADD COLUMN rating REAL",
+        "ALTER TABLE players ADD COLUMN rating_gk REAL",
+        "ALTER TABLE players ADD COLUMN rating_def REAL",
+        "ALTER TABLE players ADD COLUMN rating_mid REAL",
+        "ALTER TABLE players ADD COLUMN rating_att REAL",
+        # FootballDB.refresh_ratings recomputes exactly these rows
+        "CREATE INDEX IF NOT EXISTS idx_players_rating_stale ON players (id) WHERE rating IS NULL",
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_players_rating_stale
+        AFTER UPDATE OF position, attacking, defending, goalkeeping, stamina, speed ON players
+        BEGIN
+            UPDATE players
+            SET rating = NULL, rating_gk = NULL, rating_def = NULL, rating_mid = NULL, rating_att = NULL
+            WHERE id = NEW.id;
+        END
+        ''',
+    ]),
+    (5, "Fixture list", [
+        '''
+        CREATE TABLE IF NOT EXISTS fixtures (
+            id INTEGER PRIMARY KEY,
+            season INTEGER NOT NULL,
+            division_id INTEGER NOT NULL,
+            matchday INTEGER NOT NULL,
+            match_date TEXT NOT NULL,
+            home_team_id INTEGER NOT NULL,
+            away_team_id INTEGER NOT NULL,
+            home_goals INTEGER,
+            away_goals INTEGER,
+            FOREIGN KEY (division_id) REFERENCES divisions(id),
+            FOREIGN KEY (home_team_id) REFERENCES teams(id),
+            FOREIGN KEY (away_team_id) REFERENCES teams(id)
+        )
+        ''',
+        # fixtures_on_matchday: WHERE season AND matchday (AND division_id)
+        "CREATE INDEX IF NOT EXISTS idx_fixtures_season_matchday ON fixtures (season, matchday, division_id)",
+        # next_fixture / team_fixtures: one index per side, both in matchday order
+        "CREATE INDEX IF NOT EXISTS idx_fixtures_home_team ON fixtures (home_team_id, season, matchday)",
+        "CREATE INDEX IF NOT EXISTS idx_fixtures_away_team ON fixtures (away_team_id, season, matchday)",
+    ]),
+    (6, "Final standings of past seasons", [
+        '''
+        CREATE TABLE IF NOT EXISTS season_history (
+            season INTEGER NOT NULL,
+            division_id INTEGER NOT NULL,
+            position INTEGER NOT NULL,
+            team_id INTEGER NOT NULL,
+            played INTEGER,
+            won INTEGER,
+            drawn INTEGER,
+            lost INTEGER,
+            goals_for INTEGER,
+            goals_against INTEGER,
+            points INTEGER,
+            PRIMARY KEY (season, division_id, position),
+            FOREIGN KEY (team_id) REFERENCES teams(id),
+            FOREIGN KEY (division_id) REFERENCES divisions(id)
+        )
+        ''',
+        # A club's record season by season
+        "CREATE INDEX IF NOT EXISTS idx_season_history_team ON season_history (team_id, season)",
+    ]),
+    (7, "Transfer market: transfer history and player search index", [
+        '''
+        CREATE TABLE IF NOT EXISTS transfers (
+            id INTEGER PRIMARY KEY,
+            season INTEGER NOT NULL,
+            player_id INTEGER NOT NULL,
+            from_team_id INTEGER,
+            to_team_id INTEGER NOT NULL,
+            fee INTEGER NOT NULL,
+            FOREIGN KEY (player_id) REFERENCES players(id),
+            FOREIGN KEY (from_team_id) REFERENCES teams(id),
+            FOREIGN KEY (to_team_id) REFERENCES teams(id)
+        )
+        ''',
+        "CREATE INDEX IF NOT EXISTS idx_transfers_season ON transfers (season, to_team_id)",
+        # Market search: WHERE position = ? AND rating BETWEEN ... ORDER BY rating DESC
+        "CREATE INDEX IF NOT EXISTS idx_players_position_rating ON players (position, rating)",
+    ]),
+    (8, "Player search: sort indexes for keyset pagination", [
+        # ORDER BY <column>, id walks these without a sort (the rowid is the id).
+        # The other attributes are left unindexed to keep squad writes cheap.
+        "CREATE INDEX IF NOT EXISTS idx_players_rating ON players (rating)",
+        "CREATE INDEX IF NOT EXISTS idx_players_value ON players (value)",
+        "CREATE INDEX IF NOT EXISTS idx_players_age ON players (age)",
+        "CREATE INDEX IF NOT EXISTS idx_players_name ON players (last_name)",
+    ]),
+    (9, "Line-ups fielded in each played fixture", [
+        # One row per side and fixture; player_ids is a JSON array of the XI
+        # (expand it with json_each), so a season adds ~4k rows, not ~45k
+        '''
+        CREATE TABLE IF NOT EXISTS lineups (
+            team_id INTEGER NOT NULL,
+            fixture_id INTEGER NOT NULL,
+            player_ids TEXT NOT NULL,
+            PRIMARY KEY (team_id, fixture_id),
+            FOREIGN KEY (team_id) REFERENCES teams(id),
+            FOREIGN KEY (fixture_id) REFERENCES fixtures(id)
+        )
+        ''',
+    ]),
+    (10, "Drop the stale-ratings index now served by idx_players_rating", [
+        # refresh_ratings' WHERE rating IS NULL seeks idx_players_rating (migration 8),
+        # so the partial index was only extra work on every player write
+        "DROP INDEX IF EXISTS idx_players_rating_stale",
+    ]),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def ensure_version_table(conn: sqlite3.Connection):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            description TEXT NOT NULL,
+            applied_at TEXT DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Return the highest applied migration version, 0 for an unversioned database"""
+    ensure_version_table(conn)
+    row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+    return row[0] or 0
+
+
+def migrate(conn: sqlite3.Connection, target: int = None) -> List[int]:
+    """Apply every pending migration up to target, each in its own transaction.
+
+    Returns the list of versions that were applied.
+    """
+    target = LATEST_VERSION if target is None else target
+    current = get_schema_version(conn)
+    applied = []
+    for version, description, steps in MIGRATIONS:
+        if version <= current or version > target:
+            continue
+        try:
+            conn.execute("BEGIN")
+            for step in steps:
+                if callable(step):
+                    step(conn)
+                else:
+                    conn.execute(step)
+            conn.execute("INSERT INTO schema_version (version, description) VALUES (?, ?)",
+                         (version, description))
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            logging.exception(f"Migration {version} ({description}) failed")
+            raise
+        logging.info(f"Applied migration {version}: {description}")
+        applied.append(version)
+    return applied
@@ -0,0 +1,169 @@
+# database/name_pool.py
+"""Player name pools, parsed once per process and cached in compiled form.
+
+The CSV holds first_name,last_name rows with an optional third column
+naming the nationality pool (rows without one go to DEFAULT_NATIONALITY).
+First and last names are deduplicated per pool, pickled next to the CSV
+and interned when loaded. The pickle is keyed by the CSV's mtime and
+size, so later runs skip parsing until the CSV changes.
+"""
+import csv
+import logging
+import os
+import pickle
+import random
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+NAMES_PATH = os.path.join('database', 'playernames.csv')
+DEFAULT_NATIONALITY = 'default'
+CACHE_FORMAT = 1  # Bump when the pickled layout changes
+
+# (path, source_key) -> NamePool, so every PlayerCreator shares one load
+_pools = {}
+
+
+class NamePool:
+    """Deduplicated first and last names per nationality.
+
+    Names are held in NumPy object arrays, so drawing a name is one random
+    index per player. Nationalities are picked by weight, by default each
+    pool's share of all last names.
+    """
+
+    def __init__(self, pools: Dict[str, Tuple[List[str], List[str]]]):
+        self.nationalities = sorted(nationality for nationality, (firsts, lasts) in pools.items()
+                                    if firsts and lasts)
+        if not self.nationalities:
+            raise ValueError("No player names to draw from")
+        # Interned, so every player drawn with a name shares one string object
+        self.first_names = {n: np.array([sys.intern(name) for name in pools[n][0]], dtype=object)
+                            for n in self.nationalities}
+        self.last_names = {n: np.array([sys.intern(name) for name in pools[n][1]], dtype=object)
+                           for n in self.nationalities}
+        self.default_weights = self.normalise({n: len(pools[n][1]) for n in self.nationalities})
+
+    def __len__(self):
+        return sum(len(names) for names in self.last_names.values())
+
+    def normalise(self, weights: Dict[str, float]) -> np.ndarray:
+        """Weights per nationality as probabilities in self.nationalities order"""
+        unknown = set(weights) - set(self.nationalities)
+        if unknown:
+            raise ValueError(f"Unknown nationalities: {', '.join(sorted(unknown))}")
+        p = np.array([float(weights.get(n, 0.0)) for n in self.nationalities])
+        if p.sum() <= 0:
+            raise ValueError("Nationality weights must add up to more than zero")
+        return p / p.sum()
+
+    def draw(self, size: int, rng=None, weights: Optional[Dict[str, float]] = None
+             ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Draw size (first names, last names, nationalities) as NumPy arrays.
+
+        rng may be an int seed or a numpy Generator; weights maps
+        nationality to relative weight (default: pool sizes).
+        """
+        rng = rng if isinstance(rng, np.random.Generator) else np.random.default_rng(rng)
+        p = self.default_weights if weights is None else self.normalise(weights)
+        first = np.empty(size, dtype=object)
+        last = np.empty(size, dtype=object)
+        if len(self.nationalities) == 1:
+            pick = np.zeros(size, dtype=np.int64)
+        else:
+            pick = rng.choice(len(self.nationalities), size=size, p=p)
+        for index, nationality in enumerate(self.nationalities):
+            mask = pick == index
+            count = int(mask.sum())
+            if count:
+                firsts, lasts = self.first_names[nationality], self.last_names[nationality]
+                first[mask] = firsts[rng.integers(0, len(firsts), size=count)]
+                last[mask] = lasts[rng.integers(0, len(lasts), size=count)]
+        return first, last, np.array(self.nationalities, dtype=object)[pick]
+
+    def choice(self, rng=None, weights: Optional[Dict[str, float]] = None) -> Tuple[str, str]:
+        """One (first, last) name; rng is a random.Random-like object (default: random)"""
+        rng = rng or random
+        p = self.default_weights if weights is None else self.normalise(weights)
+        nationality = rng.choices(self.nationalities, weights=p.tolist())[0]
+        firsts, lasts = self.first_names[nationality], self.last_names[nationality]
+        return firsts[rng.randrange(len(firsts))], lasts[rng.randrange(len(lasts))]
+
+
+def parse_names(lines: Iterable[str]) -> Dict[str, Tuple[List[str], List[str]]]:
+    """nationality -> (first names, last names), deduplicated in first-seen order"""
+    seen = {}  # nationality -> (first name set, last name set)
+    pools = {}
+    for row in csv.reader(lines):
+        if len(row) < 2:
+            continue
+        first, last = row[0].strip(), row[1].strip()
+        nationality = row[2].strip() if len(row) > 2 and row[2].strip() else DEFAULT_NATIONALITY
+        if nationality not in pools:
+            pools[nationality] = ([], [])
+            seen[nationality] = (set(), set())
+        for name, names, known in ((first, pools[nationality][0], seen[nationality][0]),
+                                   (last, pools[nationality][1], seen[nationality][1])):
+            if name and name not in known:
+                known.add(name)
+                names.append(name)
+    return pools
+
+
+def read_names(path: str) -> Dict[str, Tuple[List[str], List[str]]]:
+    """Parse a names CSV, falling back to latin-1 if it isn't UTF-8"""
+    with open(path, 'rb') as file:
+        data = file.read()
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError:
+        text = data.decode('latin-1')
+    return parse_names(text.splitlines())
+
+
+def cache_path(path: str) -> str:
+    return os.path.splitext(path)[0] + '.pickle'
+
+
+def source_key(path: str) -> tuple:
+    stat = os.stat(path)
+    return (CACHE_FORMAT, stat.st_mtime_ns, stat.st_size)
+
+
+def load_cached(path: str, key: tuple):
+    """Pools from the compiled cache, or None if it is missing or stale"""
+    try:
+        with open(cache_path(path), 'rb') as file:
+            cached_key, pools = pickle.load(file)
+    except FileNotFoundError:
+        return None
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError) as e:
+        logging.warning(f"Ignoring unreadable name cache {cache_path(path)}: {e}")
+        return None
+    return pools if cached_key == key else None
+
+
+def write_cache(path: str, key: tuple, pools):
+    temp_path = cache_path(path) + '.tmp'
+    try:
+        with open(temp_path, 'wb') as file:
+            pickle.dump((key, pools), file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path(path))
+    except OSError as e:
+        # Only a cache: the CSV is parsed again next time
+        logging.error(f"Could not write the name cache: {e}")
+
+
+def load_name_pool(path: str = NAMES_PATH) -> NamePool:
+    """The NamePool for a names CSV, loaded at most once per process per CSV version"""
+    key = source_key(path)
+    pool = _pools.get((path, key))
+    if pool is not None:
+        return pool
+    pools = load_cached(path, key)
+    if pools is None:
+        pools = read_names(path)
+        write_cache(path, key, pools)
+    pool = _pools[(path, key)] = NamePool(pools)
+    return pool
@@ -0,0 +1,238 @@
+# database/player_store.py
+import logging
+import sys
+import threading
+import time
+from array import array
+from collections import namedtuple
+from typing import Dict, Iterator, List
+
+from controllers import player_rating
+
+# One complete load of the players table. Swapped in as a whole, so a reader
+# on another thread sees either the old load or the new one, never half of each
+StoreData = namedtuple('StoreData', 'columns row_by_id rows_by_team rows_by_position')
+EMPTY = StoreData({}, {}, {}, {})
+
+
+class PlayerRow:
+    """Read-only view of one player in a PlayerStore.
+
+    Supports the same `player['position']` access as the dicts the
+    database methods return, but holds only the store and the player id.
+    Rows are looked up by id on every read, so a proxy stays valid across
+    reloads and never reads another player's row.
+    """
+    __slots__ = ('_store', '_id')
+
+    def __init__(self, store, player_id):
+        self._store = store
+        self._id = player_id
+
+    def __getitem__(self, key):
+        return self._store.value(self._id, key)
+
+    def get(self, key, default=None):
+        return self[key] if key in self._store.column_index else default
+
+    def keys(self):
+        return self._store.COLUMNS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.COLUMNS)
+
+    def __contains__(self, key):
+        return key in self._store.column_index
+
+    def __eq__(self, other):
+        return isinstance(other, PlayerRow) and other._store is self._store and other._id == self._id
+
+    def __hash__(self):
+        return hash(self._id)
+
+    def to_dict(self) -> Dict:
+        return {key: self[key] for key in self._store.COLUMNS}
+
+    def __repr__(self):
+        return f"PlayerRow({self.to_dict()})"
+
+
+class PlayerStore:
+    """Columnar in-memory copy of the players table.
+
+    Loaded once with a single query into one compact array per numeric
+    column and interned string lists, indexed by id, team and position.
+    Views get PlayerRow proxies instead of per-query dict copies. set()
+    changes values in memory and flush() writes back only the changed
+    fields.
+
+    The UI reads the store while the job worker may invalidate it. A load
+    is built off to the side and published with one assignment to data,
+    and invalidate() only marks the store stale, so readers keep using the
+    previous load until the next read reloads it.
+    """
+    COLUMNS = (
+        'id', 'first_name', 'last_name', 'team_id', 'age', 'position',
+        'attacking', 'defending', 'goalkeeping', 'stamina', 'speed',
+        'morale', 'value', 'wages', 'contract_years', 'is_selected'
+    ) + player_rating.RATING_COLUMNS
+    TEXT_COLUMNS = ('first_name', 'last_name', 'position')
+    REAL_COLUMNS = player_rating.RATING_COLUMNS
+    # array typecodes: money needs 64 bits, everything else fits in 32
+    WIDE_COLUMNS = ('id', 'value', 'wages')
+    NULL = -1  # Stored in integer columns for SQL NULL (e.g. free agents' team_id)
+
+    def __init__(self, db):
+        self.db = db
+        self.column_index = {column: i for i, column in enumerate(self.COLUMNS)}
+        self.version = 0  # Bumped on every change so views can tell when they are stale
+        self.generation = 0  # Bumped by invalidate(); a load started before it is stale
+        self.lock = threading.Lock()  # One load at a time
+        self.data = EMPTY
+        self.dirty = set()  # (player_id, column) pairs with unsaved changes
+        self.loaded = False
+
+    def invalidate(self):
+        """Mark the store stale; the next read reloads from the database"""
+        self.generation += 1
+        self.loaded = False
+        self.dirty = set()
+        self.version += 1
+
+    def load(self):
+        with self.lock:
+            self._load()
+
+    def _load(self):
+        start = time.perf_counter()
+        generation = self.generation
+        columns = {
+            column: [] if column in self.TEXT_COLUMNS
+            else array('d' if column in self.REAL_COLUMNS else 'q' if column in self.WIDE_COLUMNS else 'i')
+            for column in self.COLUMNS
+        }
+        text_columns = [(i, columns[column]) for i, column in enumerate(self.COLUMNS)
+                        if column in self.TEXT_COLUMNS]
+        int_columns = [(i, columns[column]) for i, column in enumerate(self.COLUMNS)
+                       if column not in self.TEXT_COLUMNS]
+        intern = sys.intern
+        self.db.refresh_ratings()  # Views read ratings straight from the store
+        with self.db.connect_readonly() as conn:
+            # Same order as get_team_players so per-team lists need no sorting
+            cursor = conn.execute(f"""
+                SELECT {', '.join(self.COLUMNS)} FROM players
+                ORDER BY team_id, position, last_name
+            """)
+            for record in cursor:
+                for i, values in text_columns:
+                    values.append(intern(record[i] or ''))
+                for i, values in int_columns:
+                    value = record[i]
+                    values.append(self.NULL if value is None else value)
+
+        row_by_id, rows_by_team, rows_by_position = {}, {}, {}
+        team_ids = columns['team_id']
+        positions = columns['position']
+        for row, player_id in enumerate(columns['id']):
+            row_by_id[player_id] = row
+            rows_by_team.setdefault(team_ids[row], []).append(row)
+            rows_by_position.setdefault(positions[row], []).append(row)
+        self.data = StoreData(columns, row_by_id, rows_by_team, rows_by_position)
+        self.dirty = set()
+        self.version += 1
+        # Invalidated while loading: serve this load, but read again next time
+        self.loaded = generation == self.generation
+        logging.info(f"Loaded {len(row_by_id)} players into the player store "
+                     f"in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    def ensure_loaded(self) -> StoreData:
+        """The current load, reloading first if the store was invalidated"""
+        if not self.loaded:
+            with self.lock:
+                if not self.loaded:  # Another thread may have loaded while we waited
+                    self._load()
+        return self.data
+
+    def value(self, player_id: int, column: str):
+        """One field of a player, reloading first if the store was invalidated"""
+        data = self.ensure_loaded()
+        row = data.row_by_id.get(player_id)
+        if row is None:
+            raise KeyError(f"Player {player_id} is no longer in the player store")
+        return self.row_value(data, row, column)
+
+    def row_value(self, data: StoreData, row: int, column: str):
+        value = data.columns[column][row]
+        if value == self.NULL and column not in self.TEXT_COLUMNS:
+            return None
+        return value
+
+    def get(self, player_id: int) -> PlayerRow:
+        data = self.ensure_loaded()
+        return PlayerRow(self, player_id) if player_id in data.row_by_id else None
+
+    def team_players(self, team_id: int) -> List[PlayerRow]:
+        """Players for a team ordered by position then last name (no SQL)"""
+        data = self.ensure_loaded()
+        ids = data.columns['id']
+        return [PlayerRow(self, ids[row]) for row in data.rows_by_team.get(team_id, [])]
+
+    def position_players(self, position: str) -> List[PlayerRow]:
+        data = self.ensure_loaded()
+        ids = data.columns['id']
+        return [PlayerRow(self, ids[row]) for row in data.rows_by_position.get(position, [])]
+
+    def __len__(self):
+        return len(self.ensure_loaded().row_by_id)
+
+    def set(self, player_id: int, column: str, value, dirty: bool = True):
+        """Change one field in memory, remembering it for flush() if it differs.
+
+        Pass dirty=False when the database already holds the new value.
+        """
+        data = self.ensure_loaded()
+        if column in ('id', 'team_id', 'position'):
+            raise ValueError(f"{column} is an index key; reload the store after changing it in SQL")
+        row = data.row_by_id[player_id]
+        stored = self.NULL if value is None and column not in self.TEXT_COLUMNS else value
+        if data.columns[column][row] != stored:
+            data.columns[column][row] = stored
+            self.version += 1
+            if dirty:
+                self.dirty.add((player_id, column))
+            if column in player_rating.ATTRIBUTES:
+                self.rerate(data, row)
+
+    def rerate(self, data: StoreData, row: int):
+        """Recompute one row's cached ratings after an attribute change.
+
+        Not marked dirty: the database trigger clears the stored ratings when
+        the attribute is flushed, and refresh_ratings recomputes them.
+        """
+        attributes = [data.columns[attribute][row] for attribute in player_rating.ATTRIBUTES]
+        rating, slots = player_rating.rate([attributes], [data.columns['position'][row]])
+        for column, value in zip(player_rating.RATING_COLUMNS, [rating[0]] + slots[0].tolist()):
+            data.columns[column][row] = float(value)
+
+    def set_selection(self, team_id: int, selected_ids, dirty: bool = True):
+        """Mark exactly selected_ids as the team's selected players"""
+        selected = set(selected_ids)
+        for player in self.team_players(team_id):
+            self.set(player['id'], 'is_selected', 1 if player['id'] in selected else 0, dirty)
+
+    def flush(self) -> int:
+        """Write changed fields back in one transaction; returns the number written"""
+        dirty = set(self.dirty)
+        if not dirty:
+            return 0
+        data = self.data
+        by_column = {}
+        for player_id, column in dirty:
+            row = data.row_by_id.get(player_id)
+            if row is not None:
+                by_column.setdefault(column, []).append((self.row_value(data, row, column), player_id))
+        with self.db.connect() as conn:
+            for column, updates in by_column.items():
+                conn.executemany(f"UPDATE players SET {column} = ? WHERE id = ?", updates)
+        self.dirty -= dirty
+        return len(dirty)
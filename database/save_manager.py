@@ -0,0 +1,188 @@
+# database/save_manager.py
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from database import migrations
+
+ProgressCallback = Callable[[float], None]
+
+
+class SaveManager:
+    """Named save slots as standalone SQLite files under saves/.
+
+    A first save copies the live database with SQLite's online backup API,
+    a few pages per step so the game keeps writing meanwhile. Later saves
+    to the same slot are incremental: the slot is attached and only rows
+    that differ from the live database are deleted or inserted. Loading
+    backs the slot up into the live database, so no initialize_database()
+    run is needed. The game runs saves and loads as JobScheduler jobs, so
+    none of this happens on the UI thread.
+    """
+    SAVE_DIR = 'saves'
+    SLOT_COUNT = 5
+    BACKUP_PAGES_PER_STEP = 256
+    _SLOT_NAME = re.compile(r'^[A-Za-z0-9_-]+$')
+
+    def __init__(self, db, save_dir: str = None):
+        self.db = db
+        self.save_dir = save_dir or self.SAVE_DIR
+        os.makedirs(self.save_dir, exist_ok=True)
+        self.lock = threading.Lock()  # One save or load at a time
+
+    def slot_path(self, slot: str) -> str:
+        slot = str(slot)
+        if not self._SLOT_NAME.match(slot):
+            raise ValueError(f"Invalid save slot name: {slot!r}")
+        return os.path.join(self.save_dir, f"{slot}.db")
+
+    def slot_info(self, slot: str) -> Optional[Dict[str, Any]]:
+        """Season, schema version and save time of a slot, or None when empty"""
+        path = self.slot_path(slot)
+        if not os.path.exists(path):
+            return None
+        info = {'slot': str(slot), 'path': path, 'saved_at': os.path.getmtime(path),
+                'size_kb': os.path.getsize(path) / 1024}
+        try:
+            conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+            try:
+                info['season'] = conn.execute("SELECT MAX(season) FROM league_tables").fetchone()[0]
+                info['version'] = migrations.get_schema_version(conn)
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logging.error(f"Unreadable save slot {slot}: {e}")
+            info['error'] = str(e)
+        return info
+
+    def list_slots(self) -> List[Optional[Dict[str, Any]]]:
+        """slot_info for slots 1..SLOT_COUNT (None for empty ones)"""
+        return [self.slot_info(str(slot)) for slot in range(1, self.SLOT_COUNT + 1)]
+
+    def _source(self) -> sqlite3.Connection:
+        # A private connection so saving never shares a cursor with the UI thread
+        conn = sqlite3.connect(self.db.db_path, timeout=30)
+        conn.execute("PRAGMA busy_timeout=30000")
+        return conn
+
+    def snapshot(self, slot: str, progress: ProgressCallback = None) -> Dict[str, Any]:
+        """Full copy of the live database into the slot with the backup API"""
+        path = self.slot_path(slot)
+        temp_path = path + '.tmp'
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        source = self._source()
+        target = sqlite3.connect(temp_path)
+        try:
+            def report(status, remaining, total):
+                if progress and total:
+                    progress(1 - remaining / total)
+            source.backup(target, pages=self.BACKUP_PAGES_PER_STEP, progress=report)
+            # A slot is a single self-contained file, not a WAL database
+            target.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            target.close()
+            source.close()
+        # Swap in the finished copy so a crash mid-save never corrupts the slot
+        os.replace(temp_path, path)
+        return {'slot': str(slot), 'mode': 'full', 'rows': None}
+
+    @staticmethod
+    def _tables(conn: sqlite3.Connection, schema: str) -> Dict[str, List[str]]:
+        tables = {}
+        for (name,) in conn.execute(f"""
+            SELECT name FROM {schema}.sqlite_master
+            WHERE type = 'table' AND name NOT LIKE 'sqlite_%'
+        """).fetchall():
+            tables[name] = [row[1] for row in conn.execute(f"PRAGMA {schema}.table_info('{name}')")]
+        return tables
+
+    def incremental(self, slot: str, progress: ProgressCallback = None) -> Dict[str, Any]:
+        """Bring an existing slot up to date by writing only the rows that changed.
+
+        Falls back to snapshot() when the slot is missing or its schema
+        differs from the live database.
+        """
+        path = self.slot_path(slot)
+        if not os.path.exists(path):
+            return self.snapshot(slot, progress)
+        conn = self._source()
+        try:
+            conn.execute("ATTACH DATABASE ? AS slot", (path,))
+            tables = self._tables(conn, 'main')
+            if tables != self._tables(conn, 'slot'):
+                conn.execute("DETACH DATABASE slot")
+                conn.close()
+                conn = None
+                return self.snapshot(slot, progress)
+
+            changed = 0
+            with conn:
+                for done, (table, columns) in enumerate(tables.items(), start=1):
+                    column_list = ", ".join(columns)
+                    # Rows that were changed or removed since the last save
+                    changed += conn.execute(f"""
+                        DELETE FROM slot.{table} WHERE rowid IN (
+                            SELECT rowid FROM (
+                                SELECT rowid, {column_list} FROM slot.{table}
+                                EXCEPT
+                                SELECT rowid, {column_list} FROM main.{table}
+                            )
+                        )
+                    """).rowcount
+                    # Rows that were changed or added
+                    changed += conn.execute(f"""
+                        INSERT INTO slot.{table} (rowid, {column_list})
+                        SELECT rowid, {column_list} FROM main.{table}
+                        EXCEPT
+                        SELECT rowid, {column_list} FROM slot.{table}
+                    """).rowcount
+                    if progress:
+                        progress(done / len(tables))
+            conn.execute("DETACH DATABASE slot")
+        finally:
+            if conn is not None:
+                conn.close()
+        return {'slot': str(slot), 'mode': 'incremental', 'rows': changed}
+
+    def save(self, slot: str, incremental: bool = True, progress: ProgressCallback = None) -> Dict[str, Any]:
+        """Save the live game into a slot; returns what was written and how long it took"""
+        start = time.perf_counter()
+        with self.lock:
+            # Pending in-memory changes belong in the save
+            self.db.player_store().flush()
+            result = self.incremental(slot, progress) if incremental else self.snapshot(slot, progress)
+        result['ms'] = (time.perf_counter() - start) * 1000
+        logging.info(f"Saved slot {slot}: {result}")
+        return result
+
+    def load(self, slot: str, progress: ProgressCallback = None) -> Dict[str, Any]:
+        """Replace the live database with a slot's contents.
+
+        The slot is backed up into the live connection, then migrated in case
+        it was saved by an older build. Callers must drop their own caches
+        (league tables, views); the player store is invalidated here.
+        """
+        path = self.slot_path(slot)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Save slot {slot} is empty")
+        start = time.perf_counter()
+        with self.lock:
+            source = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+            def report(status, remaining, total):
+                if progress and total:
+                    progress(1 - remaining / total)
+            try:
+                source.backup(self.db.connect(), pages=self.BACKUP_PAGES_PER_STEP, progress=report)
+            finally:
+                source.close()
+            applied = self.db.migrate()
+            self.db.invalidate_player_store()
+        result = {'slot': str(slot), 'migrated': applied, 'ms': (time.perf_counter() - start) * 1000}
+        logging.info(f"Loaded slot {slot}: {result}")
+        return result
@@ -1,22 +1,30 @@
 # main.py
+import time
+STARTED = time.perf_counter()  # Time to first frame is measured from here
+
+import logging
 import pygame
 import sys
 import os
-from views.menu_view import MenuView
-from views.division_select_view import DivisionSelectView
-from views.team_select_view import TeamSelectView
-from views.game_menu_view import GameMenuView
-from views.team_submenu_view import TeamSubmenuView  # Add this import
-from views.team_view import TeamView  # Add this import
-from views.player_view import PlayerView
-from database.database import FootballDB  # Fix this import line
-from views.player_selection_view import PlayerSelectionView
-from views.league_table_view import LeagueTableView
-from controllers.league_table import LeagueTable  # Add this import
+import argparse
+import cProfile
+from functools import cached_property
+import views  # View modules are imported on first use, see views/__init__.py
+from views.text_cache import load_font
+from views.view_router import ViewRouter
+from controllers.job_scheduler import JobScheduler
+from controllers.instrumentation import instrumentation
 
 class Game:
+    FPS = 60            # Frame cap while the player is interacting
+    IDLE_FPS = 15       # Frame cap once nothing has changed for a while
+    IDLE_AFTER_MS = 1000
+    OVERLAY_REFRESH_MS = 500  # Hot spot overlay text refresh interval
+
     def __init__(self):
-        pygame.init()
+        # Only what the game uses; pygame.init() would also start audio and joysticks
+        pygame.display.init()
+        pygame.font.init()
         self.screen_width = 1024
         self.screen_height = 768
         self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
@@ -25,112 +33,414 @@ class Game:
         # Load C64 font
         font_path = os.path.join('assets', 'fonts', 'C64_Pro-STYLE.ttf')
         self.font_size = 12
-        self.font = pygame.font.Font(font_path, self.font_size)
+        self.font = load_font(font_path, self.font_size)
         
         # Initialize menu
-        self.menu = MenuView(self.screen, self.font)
+        self.menu = views.MenuView(self.screen, self.font)
         self.current_view = self.menu
         
-        self.db = FootballDB()
+        self.jobs = JobScheduler()  # Long tasks run here, off the render loop
+        # What to do with each view's handle_input result, by view class name
+        self.handlers = {
+            'MenuView': self.on_menu,
+            'SaveSlotView': self.on_save_slot,
+            'DivisionSelectView': self.on_division_select,
+            'TeamSelectView': self.on_team_select,
+            'GameMenuView': self.on_game_menu,
+            'LeagueTableView': self.on_league_table,
+            'FixturesView': self.on_back_to_game_menu,
+            'TransferView': self.on_back_to_game_menu,
+            'PlayerSearchView': self.on_player_search,
+            'ProgressView': self.on_progress,
+            'TeamSubmenuView': self.on_team_submenu,
+            'TeamView': self.on_team_view,
+            'PlayerView': self.on_player_view,
+            'PlayerSelectionView': self.on_player_selection,
+        }
         self.game_started = False
+        self.clock = pygame.time.Clock()
+        self.needs_redraw = True
+        self.show_overlay = False
+        self.overlay_lines = []
+        self.overlay_updated = 0
+        self.quit_after_first_frame = False
         print("Game initialized")  # Debug print
+
+    # The database and everything built on it open on first use, so the main
+    # menu is on screen before any of it is imported or migrated
+
+    @cached_property
+    def db(self):
+        """One shared database connection manager, injected into every view"""
+        from database.database import FootballDB
+        return FootballDB.shared()
+
+    @cached_property
+    def league_table(self):
+        """Standings shared by every view"""
+        from controllers.league_table import LeagueTable
+        return LeagueTable(self.db)
+
+    @cached_property
+    def save_manager(self):
+        from database.save_manager import SaveManager
+        return SaveManager(self.db)
+
+    @cached_property
+    def router(self):
+        """Views cached per (class, team/division id), rebuilt only when data changes"""
+        return ViewRouter(self.db, {
+            'DivisionSelectView': lambda key: views.DivisionSelectView(self.screen, self.font, self.db),
+            'TeamSelectView': lambda division_id: views.TeamSelectView(self.screen, self.font, division_id, self.db),
+            'GameMenuView': lambda team_id: views.GameMenuView(self.screen, self.font, team_id),
+            'TeamSubmenuView': lambda team_id: views.TeamSubmenuView(self.screen, self.font, team_id),
+            'TeamView': lambda team_id: views.TeamView(self.screen, self.font, team_id, self.db),
+            'FixturesView': lambda team_id: views.FixturesView(self.screen, self.font, team_id, self.db),
+            'TransferView': lambda team_id: views.TransferView(self.screen, self.font, team_id, self.db),
+            'PlayerSearchView': lambda team_id: views.PlayerSearchView(self.screen, self.font, team_id, self.db),
+            'LeagueTableView': self.league_table_view,
+        }, static=('GameMenuView', 'TeamSubmenuView'))
         
-    def start_new_game(self):
+    def run_job(self, title, func, on_success, return_view=None):
+        """Run func(progress) on the job worker behind a progress screen.
+
+        on_success(result) runs on this thread once the job's DONE event
+        arrives; if the job fails the progress screen shows the error and
+        goes back to return_view.
+        """
+        self.current_view = views.ProgressView(self.screen, self.font, title, return_view or self.current_view)
+
+        def done(job):
+            if job.error:
+                if isinstance(self.current_view, views.ProgressView):
+                    self.current_view.fail(job.error)
+            else:
+                on_success(job.result)
+        self.jobs.submit(title, func, done)
+
+    def show(self, view_name, key=None):
+        """Switch to the router's (possibly cached) view"""
+        self.current_view = self.router.show(view_name, key)
+
+    def league_table_view(self, team_id):
+        # Division looked up on every build: a rollover may have moved the team
+        team = self.db.get_team_details(team_id)
+        return views.LeagueTableView(self.screen, self.font, team['division_id'], self.db, self.league_table, team_id)
+
+    def start_new_game(self, keep_players=False):
         if self.game_started:  # Add this check to prevent recursion
+            self.show('DivisionSelectView')
             return
-            
-        print("Starting new game - generating players...")
-        try:
-            self.db.clear_all_players()
-            self.db.generate_all_teams_squads()
-            # Initialize league tables for all divisions
-            for division_id in range(1, 5):
-                league_table = LeagueTable(self.db)
-                league_table.initialize_league_table(division_id)
+
+        def started(report):
             self.game_started = True
+            self.router.clear()
             print("Game initialization complete")
-        except Exception as e:
-            print(f"Error starting new game: {e}")
-            self.game_started = False  # Reset if there was an error
+            self.show('DivisionSelectView')
+        self.run_job("STARTING NEW GAME", lambda progress: self.new_game(progress, keep_players), started)
+
+    def new_game(self, progress, keep_players=False):
+        """Job: generate squads, league tables and fixtures for a fresh game.
+
+        With keep_players the squads already in the database (e.g. from
+        database.importer) are used instead of generating new ones.
+        """
+        with self.db.connect_readonly() as conn:
+            has_players = conn.execute("SELECT 1 FROM players LIMIT 1").fetchone() is not None
+        if keep_players and has_players:
+            progress(0.0, "Using imported squads")
+            report = None
+        else:
+            print("Starting new game - generating players...")
+            progress(0.0, "Generating squads")
+            self.db.clear_all_players()
+            report = self.db.generate_all_teams_squads()
+        progress(0.6, "Setting up league tables")
+        # Initialize league tables for every division, imported ones included
+        with self.db.connect_readonly() as conn:
+            division_ids = [row[0] for row in conn.execute("SELECT id FROM divisions ORDER BY id")]
+        for division_id in division_ids:
+            self.league_table.initialize_league_table(division_id)
+        progress(0.8, "Scheduling fixtures")
+        from controllers.fixtures import FixtureList
+        from controllers.team_selection import TeamSelection
+        FixtureList(self.db).generate_season(1)
+        progress(0.9, "Picking line-ups")
+        TeamSelection(self.db).auto_select_teams()
+        progress(1.0, "Done")
+        return report
+
+    def play_matchday(self, progress, team_id=None):
+        """Job: play the next matchday, rolling the season over after the last one.
+
+        The close season also runs the AI transfer window and has the AI
+        clubs pick new XIs; team_id, the manager's club, is left out of both.
+        """
+        from controllers.match_engine import MatchEngine
+        from controllers.season_manager import SeasonManager
+        from controllers.team_selection import TeamSelection
+        from controllers.transfer_market import TransferMarket
+
+        progress(0.0, "Playing matchday")
+        engine = MatchEngine(self.db, league_table=self.league_table)
+        results = engine.simulate_matchday()
+        if not engine.fixtures.unplayed():
+            progress(0.5, "Season complete - promotions, relegations and new fixtures")
+            SeasonManager(self.db, self.league_table).rollover()
+            progress(0.8, "Transfer window")
+            TransferMarket(self.db).ai_window(exclude_team_ids=[team_id] if team_id else ())
+            with self.db.connect_readonly() as conn:
+                ai_teams = [row[0] for row in conn.execute("SELECT id FROM teams WHERE id IS NOT ?", (team_id,))]
+            TeamSelection(self.db).auto_select_teams(ai_teams)
+        progress(1.0, "Done")
+        return results
+
+    def save_game(self, slot, progress):
+        """Job: write the live game into a save slot"""
+        progress(0.0, f"Saving slot {slot}")
+        return self.save_manager.save(slot, progress=progress)
+
+    def load_game(self, slot, progress):
+        """Job: replace the live game with a save slot"""
+        from controllers.fixtures import FixtureList
+
+        progress(0.0, f"Loading slot {slot}")
+        report = self.save_manager.load(slot, progress=progress)
+        FixtureList(self.db).ensure_season()  # Saves from before the fixture list have none
+        return report
+
+    def update_overlay(self):
+        """Refresh the hot spot overlay text at most every OVERLAY_REFRESH_MS"""
+        now = pygame.time.get_ticks()
+        if self.overlay_lines and now - self.overlay_updated < self.OVERLAY_REFRESH_MS:
+            return
+        self.overlay_updated = now
+        lines = [f"FPS {self.clock.get_fps():5.1f}  views {self.router.hits} reused {self.router.builds} built"]
+        for name, calls, total, rows in instrumentation.hot_spots(3, prefix='frame.'):
+            lines.append(f"{name[6:]:6} {total * 1000 / calls:6.2f} ms/frame")
+        for name, calls, total, rows in [e for e in instrumentation.hot_spots(20)
+                                         if not e[0].startswith('frame.')][:8]:
+            lines.append(f"{total * 1000:8.1f} ms {calls:6}x {name[:48]}")
+        self.overlay_lines = lines
+
+    def draw_overlay(self):
+        if not instrumentation.enabled:
+            self.overlay_lines = ["Instrumentation off - run with --instrument"]
+        else:
+            self.update_overlay()
+        line_height = self.font_size + 4
+        panel = pygame.Surface((self.screen_width, line_height * len(self.overlay_lines) + 8), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 190))
+        for i, line in enumerate(self.overlay_lines):
+            # Rendered directly: changing numbers would only churn the text cache
+            panel.blit(self.font.render(line, True, (0, 255, 0)), (8, 4 + i * line_height))
+        self.screen.blit(panel, (0, 0))
 
     def run(self):
         running = True
+        first_frame = True
+        idle_ms = 0
         while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.KEYDOWN:
-                    result = self.current_view.handle_input(event.key)
-                    
-                    if isinstance(self.current_view, MenuView):
-                        if result == "START_GAME":
-                            self.start_new_game()  # This will now definitely generate players
-                            self.current_view = DivisionSelectView(self.screen, self.font)
-                    
-                    elif isinstance(self.current_view, DivisionSelectView):
-                        if result is not None:  # Division ID was returned
-                            self.current_view = TeamSelectView(self.screen, self.font, result)
-                    
-                    elif isinstance(self.current_view, TeamSelectView):
-                        if result == -1:  # Back button pressed
-                            self.current_view = DivisionSelectView(self.screen, self.font)
-                        elif result is not None:  # Team was selected
-                            self.current_view = GameMenuView(self.screen, self.font, result)
-                    
-                    elif isinstance(self.current_view, GameMenuView):
-                        if result == "TEAM":
-                            self.current_view = TeamSubmenuView(self.screen, self.font, self.current_view.team_id)
-                        elif result == "VIEW_TABLE":
-                            team = self.db.get_team_details(self.current_view.team_id)
-                            self.current_view = LeagueTableView(self.screen, self.font, team['division_id'], self.db)
-                        elif result == "EXIT_GAME":
-                            self.current_view = self.menu
-                        elif result == "SHOW_PLAYER_SELECTION":
-                            self.current_view = PlayerSelectionView(self.screen, self.font, self.current_view.team_id)
-                        elif result == "VIEW_TEAM":
-                            self.current_view = TeamView(self.screen, self.font, self.current_view.team_id)
-                        elif result is not None:
-                            print(f"Selected menu option: {result}")
-                    
-                    elif isinstance(self.current_view, LeagueTableView):
-                        if result == "BACK":
-                            team_id = self.current_view.team_id  # Store team_id before switching view
-                            self.current_view = GameMenuView(self.screen, self.font, team_id)
-
-                    elif isinstance(self.current_view, TeamSubmenuView):
-                        if result == "BACK":
-                            self.current_view = GameMenuView(self.screen, self.font, self.current_view.team_id)
-                        elif result == "SHOW_PLAYER_SELECTION":
-                            self.current_view = PlayerSelectionView(self.screen, self.font, self.current_view.team_id)
-                        elif result == "VIEW_TEAM":
-                            self.current_view = TeamView(self.screen, self.font, self.current_view.team_id)
-                    
-                    elif isinstance(self.current_view, TeamView):
-                        if result == "BACK":
-                            self.current_view = TeamSubmenuView(self.screen, self.font, self.current_view.team_id)
-                        elif isinstance(result, tuple) and result[0] == "SHOW_PLAYER":
-                            self.current_view = PlayerView(self.screen, self.font, result[1])
-                    
-                    elif isinstance(self.current_view, PlayerView):
-                        if result == "BACK":
-                            # Go back to team view
-                            self.current_view = TeamView(self.screen, self.font, self.current_view.player['team_id'])
-                    
-                    elif isinstance(self.current_view, PlayerSelectionView):
-                        if result == "BACK":
-                            self.current_view = TeamSubmenuView(self.screen, self.font, self.current_view.team_id)
-                        elif result == "SELECTION_COMPLETE":
-                            # TODO: Save the selected team
-                            self.current_view = TeamView(self.screen, self.font, self.current_view.team_id)
-            
-            self.screen.fill((0, 0, 128))  # Navy blue background
-            self.current_view.draw()
-            pygame.display.flip()
+            with instrumentation.timed('frame.input'):
+                running = self.handle_events()
+
+            # Only redraw when input arrived or the view reports changed state
+            if self.needs_redraw or self.show_overlay or getattr(self.current_view, 'dirty', False):
+                with instrumentation.timed('frame.draw'):
+                    self.screen.fill((0, 0, 128))  # Navy blue background
+                    self.current_view.draw()
+                    if self.show_overlay:
+                        self.draw_overlay()
+                with instrumentation.timed('frame.flip'):
+                    pygame.display.flip()
+                if first_frame:
+                    first_frame = False
+                    message = f"First frame after {(time.perf_counter() - STARTED) * 1000:.1f} ms"
+                    if self.quit_after_first_frame:
+                        print(message)  # The startup benchmark's report
+                        running = False
+                    else:
+                        logging.debug(message)
+                self.needs_redraw = False
+                idle_ms = 0
+
+            # Drop to a low frame rate on static screens (the overlay keeps it awake)
+            idle_ms += self.clock.tick(self.FPS if idle_ms < self.IDLE_AFTER_MS else self.IDLE_FPS)
         
         pygame.quit()
         sys.exit()
-            
+
+    def handle_events(self) -> bool:
+        """Process pending events; returns False once the window is closed"""
+        running = True
+        for event in pygame.event.get():
+            # Any event (input, expose, focus, resize) may change what is on screen
+            self.needs_redraw = True
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.show_overlay = not self.show_overlay
+            elif event.type == JobScheduler.PROGRESS_EVENT:
+                if isinstance(self.current_view, views.ProgressView):
+                    self.current_view.update(event.fraction, event.message)
+            elif event.type == JobScheduler.DONE_EVENT:
+                self.jobs.handle_event(event)
+            elif event.type == pygame.KEYDOWN:
+                result = self.current_view.handle_input(event.key)
+                handler = self.handlers.get(type(self.current_view).__name__)
+                if handler is not None:
+                    handler(self.current_view, result)
+        return running
+
+    def on_menu(self, view, result):
+        if result == "START_GAME":
+            self.start_new_game()  # Generates players in the background
+        elif result == "START_IMPORTED":
+            self.start_new_game(keep_players=True)
+        elif result == "LOAD_GAME":
+            self.current_view = views.SaveSlotView(self.screen, self.font, self.db, 'load',
+                                             save_manager=self.save_manager)
+
+    def on_save_slot(self, view, result):
+        if isinstance(result, tuple) and result[0] == "SAVE":
+            def saved(report, team_id=view.team_id):
+                self.show('GameMenuView', team_id)
+            self.run_job("SAVING GAME", lambda progress, slot=result[1]: self.save_game(slot, progress), saved)
+        elif isinstance(result, tuple) and result[0] == "LOAD":
+            def loaded(report):
+                # Standings and views cached in memory belong to the game that was replaced
+                self.league_table.invalidate()
+                self.router.clear()
+                self.game_started = True
+                self.show('DivisionSelectView')
+            self.run_job("LOADING GAME", lambda progress, slot=result[1]: self.load_game(slot, progress), loaded)
+        elif result == "BACK" and view.team_id is not None:
+            self.show('GameMenuView', view.team_id)
+        elif result == "BACK":
+            self.current_view = self.menu
+
+    def on_division_select(self, view, result):
+        if result is not None:  # Division ID was returned
+            self.show('TeamSelectView', result)
+
+    def on_team_select(self, view, result):
+        if result == -1:  # Back button pressed
+            self.show('DivisionSelectView')
+        elif result is not None:  # Team was selected
+            self.show('GameMenuView', result)
+
+    def on_game_menu(self, view, result):
+        team_id = view.team_id
+        if result == "TEAM":
+            self.show('TeamSubmenuView', team_id)
+        elif result == "VIEW_TABLE":
+            self.show('LeagueTableView', team_id)
+        elif result == "PLAY_MATCHDAY":
+            self.run_job("PLAYING MATCHDAY", lambda progress: self.play_matchday(progress, team_id),
+                         lambda results: self.show('LeagueTableView', team_id))
+        elif result == "FIXTURES":
+            self.show('FixturesView', team_id)
+        elif result == "TRANSFERS":
+            self.show('TransferView', team_id)
+        elif result == "STATISTICS":
+            self.show('PlayerSearchView', team_id)
+        elif result == "SAVE_GAME":
+            self.current_view = views.SaveSlotView(self.screen, self.font, self.db, 'save', team_id, self.save_manager)
+        elif result == "EXIT_GAME":
+            self.current_view = self.menu
+        elif result == "SHOW_PLAYER_SELECTION":
+            self.current_view = views.PlayerSelectionView(self.screen, self.font, team_id, self.db)
+        elif result == "VIEW_TEAM":
+            self.show('TeamView', team_id)
+        elif result is not None:
+            print(f"Selected menu option: {result}")
+
+    def on_league_table(self, view, result):
+        if result == "PROJECT":
+            # Odds take a few hundred ms, so they fill in when the job is done
+            # instead of freezing the table
+            self.jobs.submit("SEASON ODDS", view.project, view.projection_done)
+        else:
+            self.on_back_to_game_menu(view, result)
+
+    def on_back_to_game_menu(self, view, result):
+        if result == "BACK":
+            self.show('GameMenuView', view.team_id)
+
+    def on_progress(self, view, result):
+        if result == "BACK":
+            self.current_view = view.return_view
+
+    def on_team_submenu(self, view, result):
+        if result == "BACK":
+            self.show('GameMenuView', view.team_id)
+        elif result == "SHOW_PLAYER_SELECTION":
+            # Not cached: it holds an unsaved selection in progress
+            self.current_view = views.PlayerSelectionView(self.screen, self.font, view.team_id, self.db)
+        elif result == "VIEW_TEAM":
+            self.show('TeamView', view.team_id)
+
+    def on_team_view(self, view, result):
+        if result == "BACK":
+            self.show('TeamSubmenuView', view.team_id)
+        elif isinstance(result, tuple) and result[0] == "SHOW_PLAYER":
+            self.current_view = views.PlayerView(self.screen, self.font, result[1])
+
+    def on_player_view(self, view, result):
+        if result == "BACK" and view.return_to is not None:
+            self.show(*view.return_to)
+        elif result == "BACK":
+            # Go back to team view
+            self.show('TeamView', view.player['team_id'])
+
+    def on_player_search(self, view, result):
+        if result == "BACK":
+            self.show('GameMenuView', view.team_id)
+        elif isinstance(result, tuple) and result[0] == "SHOW_PLAYER":
+            self.current_view = views.PlayerView(self.screen, self.font, result[1],
+                                                 return_to=('PlayerSearchView', view.team_id))
+
+    def on_player_selection(self, view, result):
+        if result == "BACK":
+            self.show('TeamSubmenuView', view.team_id)
+        elif result == "SELECTION_COMPLETE":
+            self.show('TeamView', view.team_id)  # Rebuilt: the saved selection changed the data version
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Football Manager")
+    parser.add_argument('--instrument', action='store_true',
+                        help="record call counts and timings (F3 shows the overlay)")
+    parser.add_argument('--profile', nargs='?', const=os.path.join('logs', 'profile.prof'),
+                        help="run under cProfile and dump stats to this file (default logs/profile.prof)")
+    parser.add_argument('--first-frame', action='store_true',
+                        help="quit once the first frame is drawn (startup benchmark)")
+    return parser.parse_args(argv)
+
 
 if __name__ == "__main__": 
-    game = Game()
-    game.run()
\ No newline at end of file
+    args = parse_args()
+    if args.instrument:
+        instrumentation.enable()
+    if args.profile:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            game = Game()
+            game.quit_after_first_frame = args.first_frame
+            game.run()
+        finally:
+            profiler.disable()
+            os.makedirs(os.path.dirname(args.profile) or '.', exist_ok=True)
+            profiler.dump_stats(args.profile)
+            print(f"Profile written to {args.profile}")
+            if instrumentation.enabled:
+                print(instrumentation.report())
+    else:
+        game = Game()
+        game.quit_after_first_frame = args.first_frame
+        try:
+            game.run()
+        finally:
+            if instrumentation.enabled:
+                print(instrumentation.report())
\ No newline at end of file
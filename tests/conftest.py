@@ -0,0 +1,40 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from database.database import FootballDB  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def project_root(monkeypatch):
+    # Fonts, player names and the seed template are read relative to the project root
+    monkeypatch.chdir(ROOT)
+
+
+@pytest.fixture
+def db(tmp_path):
+    """A fresh database with the seeded divisions and teams but no players"""
+    database = FootballDB(str(tmp_path / 'football.db'))
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def game_db(db):
+    """A new game: squads, season 1 league tables and fixtures"""
+    from controllers.fixtures import FixtureList
+    from controllers.league_table import LeagueTable
+
+    db.generate_all_teams_squads()
+    league_table = LeagueTable(db)
+    with db.connect_readonly() as conn:
+        division_ids = [row[0] for row in conn.execute("SELECT id FROM divisions ORDER BY id")]
+    for division_id in division_ids:
+        league_table.initialize_league_table(division_id)
+    FixtureList(db).generate_season(1, seed=1)
+    return db
@@ -0,0 +1,22 @@
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame  # noqa: E402
+
+from views.division_select_view import DivisionSelectView  # noqa: E402
+
+
+def test_lists_divisions_from_the_database_and_returns_their_ids(db):
+    with db.connect() as conn:
+        conn.execute("DELETE FROM teams")
+        conn.execute("DELETE FROM divisions")
+        conn.executemany("INSERT INTO divisions (id, name, level) VALUES (?, ?, ?)",
+                         [(10, "Regional North", 2), (7, "National League", 1), (12, "Regional South", 2)])
+    view = DivisionSelectView(pygame.Surface((800, 600)), None, db)
+
+    assert [name for division_id, name in view.divisions] == ["National League", "Regional North", "Regional South"]
+    assert view.handle_input(pygame.K_RETURN) == 7
+    view.handle_input(pygame.K_DOWN)
+    view.handle_input(pygame.K_DOWN)
+    assert view.handle_input(pygame.K_RETURN) == 12
@@ -0,0 +1,52 @@
+from collections import Counter
+
+import pytest
+
+from controllers.fixtures import FixtureList, matchday_dates, round_robin
+
+
+@pytest.mark.parametrize('teams', [2, 7, 20, 24])
+def test_round_robin_plays_every_pairing_home_and_away(teams):
+    team_ids = list(range(1, teams + 1))
+    schedule = round_robin(team_ids)
+    assert len(schedule) == 2 * (teams - 1 + teams % 2)
+
+    games = [game for matchday in schedule for game in matchday]
+    assert Counter(games) == {(home, away): 1 for home in team_ids for away in team_ids if home != away}
+    for matchday in schedule:
+        playing = [team for game in matchday for team in game]
+        assert len(playing) == len(set(playing))  # Nobody plays twice on a matchday
+        assert len(matchday) == teams // 2
+
+
+def test_round_robin_alternates_venues():
+    schedule = round_robin(list(range(1, 21)))
+    for team in range(1, 21):
+        venues = [next(home == team for home, away in matchday if team in (home, away))
+                  for matchday in schedule]
+        longest = run = 1
+        for previous, venue in zip(venues, venues[1:]):
+            run = run + 1 if venue == previous else 1
+            longest = max(longest, run)
+        assert longest <= 3
+
+
+def test_matchday_dates_are_saturdays_with_midweek_rounds():
+    dates = matchday_dates(1, 10)
+    assert dates[0] == '2024-08-03'
+    assert dates[4] == '2024-08-27'  # Tuesday after the fourth Saturday
+    assert dates == sorted(dates)
+
+
+def test_generate_season_schedules_every_division(game_db):
+    fixtures = FixtureList(game_db)
+    with game_db.connect_readonly() as conn:
+        teams = FixtureList.teams_by_division(conn)
+        written = conn.execute("SELECT COUNT(*) FROM fixtures WHERE season = 1").fetchone()[0]
+    assert written == sum(len(ids) * (len(ids) - 1) for ids in teams.values())
+
+    # Regenerating replaces the season instead of adding to it
+    assert fixtures.generate_season(1, seed=2) == written
+    assert fixtures.ensure_season(1) == 1
+    with game_db.connect_readonly() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM fixtures WHERE season = 1").fetchone()[0] == written
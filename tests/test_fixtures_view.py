@@ -0,0 +1,22 @@
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame  # noqa: E402
+
+from views.fixtures_view import FixturesView  # noqa: E402
+
+
+def test_opening_the_view_does_not_schedule_fixtures(db):
+    view = FixturesView(pygame.Surface((1024, 768)), None, 1, db)
+
+    assert view.rows == []
+    with db.connect_readonly() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM fixtures").fetchone()[0] == 0
+
+
+def test_lists_the_current_seasons_fixtures(game_db):
+    view = FixturesView(pygame.Surface((1024, 768)), None, 1, game_db)
+
+    assert view.rows
+    assert view.next_index == 0
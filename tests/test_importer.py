@@ -0,0 +1,54 @@
+import io
+
+from database.importer import DatabaseImporter, iter_csv, iter_json_array, iter_ndjson
+
+PLAYER = dict(first_name="Ann", last_name="Keeper", age=24, position="gk",
+              attacking=30, defending=40, goalkeeping=80, stamina=60, speed=50)
+
+
+def count(db, sql, *params):
+    with db.connect_readonly() as conn:
+        return conn.execute(sql, params).fetchone()[0]
+
+
+def test_rejected_rows_are_counted_and_the_rest_imported(db):
+    records = [
+        dict(PLAYER, team="Arsenal"),
+        dict(PLAYER, age="23.0", position="ATT", team_id=1),
+        dict(PLAYER, age=5),
+        dict(PLAYER, position="winger"),
+        dict(PLAYER, first_name=""),
+        dict(PLAYER, team="No Such Club"),
+        dict(PLAYER, team_id=99999),
+        "not a row",
+    ]
+    report = DatabaseImporter(db, chunk_size=1).import_records('players', iter(records))
+
+    assert (report['imported'], report['rejected']) == (2, 6)
+    assert [error.split(':')[0] for error in report['errors']] == [f"row {n}" for n in range(3, 9)]
+    assert "age 5 out of range" in report['errors'][0]
+    assert "unknown team 'No Such Club'" in report['errors'][3]
+    assert count(db, "SELECT COUNT(*) FROM players") == 2
+    # Players are rated on the way in and positions normalised
+    assert count(db, "SELECT COUNT(*) FROM players WHERE rating IS NULL") == 0
+    assert count(db, "SELECT COUNT(*) FROM players WHERE position = 'GK'") == 1
+
+
+def test_imported_teams_enter_the_league_and_the_schedule(db):
+    before = count(db, "SELECT COUNT(*) FROM teams WHERE division_id = 1")
+    division = count(db, "SELECT name FROM divisions WHERE id = 1")
+    records = iter_csv(io.StringIO(f"Name,Division,Reputation\nNew Town,{division},40\nBad Rep,{division},500\n"))
+    report = DatabaseImporter(db).import_records('teams', records)
+
+    assert (report['imported'], report['rejected']) == (1, 1)
+    team_id = count(db, "SELECT id FROM teams WHERE name = 'New Town'")
+    assert count(db, "SELECT COUNT(*) FROM league_tables WHERE team_id = ?", team_id) == 1
+    # Double round robin: home and away against every other club in the division
+    assert count(db, "SELECT COUNT(*) FROM fixtures WHERE home_team_id = ? OR away_team_id = ?",
+                 team_id, team_id) == 2 * before
+
+
+def test_readers_stream_json_and_ndjson():
+    assert list(iter_json_array(io.StringIO('[{"a": 1}, {"b": [2, 3]}]'), chunk_size=4)) == [{"a": 1}, {"b": [2, 3]}]
+    rows = list(iter_ndjson(io.StringIO('{"a": 1}\n\n{broken\n')))
+    assert rows[0] == {"a": 1} and isinstance(rows[1], ValueError)
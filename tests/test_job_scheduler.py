@@ -0,0 +1,32 @@
+import logging
+
+from controllers.job_scheduler import Job, JobScheduler
+
+
+def run(func, on_done=None):
+    """Run one job on this thread, then handle its DONE_EVENT as the game loop would"""
+    posted = []
+    scheduler = JobScheduler(post=posted.append)
+    job = Job("test", func, on_done)
+    scheduler.jobs[job.id] = job
+    scheduler._run(job)
+    assert posted[-1].type == JobScheduler.DONE_EVENT
+    assert scheduler.handle_event(posted[-1]) is job
+    return job
+
+
+def test_finished_job_keeps_its_result():
+    done = []
+    job = run(lambda progress: 1 + 2, on_done=done.append)
+    assert job.result == 3 and job.error is None and done == [job]
+
+
+def test_failed_job_logs_the_traceback_and_keeps_the_error(caplog):
+    def fail(progress):
+        raise ValueError("no fixtures")
+
+    with caplog.at_level(logging.ERROR):
+        job = run(fail)
+
+    assert job.error == "no fixtures"
+    assert [record.exc_info[0] for record in caplog.records] == [ValueError]
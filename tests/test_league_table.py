@@ -0,0 +1,53 @@
+import random
+
+from controllers.league_table import LeagueTable, movement_places
+
+
+def table_order(rows):
+    return [row['team_id'] for row in rows]
+
+
+def test_incremental_ranking_matches_a_fresh_load(game_db):
+    league_table = LeagueTable(game_db)
+    rows = league_table.get_league_table(1)
+    team_ids = table_order(rows)
+    rng = random.Random(7)
+    for _ in range(200):
+        home, away = rng.sample(team_ids, 2)
+        league_table.apply_result(1, home, away, rng.randint(0, 4), rng.randint(0, 4))
+
+    in_memory = league_table.get_league_table(1)
+    assert in_memory == sorted(in_memory, key=LeagueTable.sort_key)
+    league_table.flush()
+
+    fresh = LeagueTable(game_db).get_league_table(1)
+    assert table_order(fresh) == table_order(in_memory)
+    assert [{key: row[key] for key in LeagueTable.STAT_KEYS} for row in fresh] == \
+           [{key: row[key] for key in LeagueTable.STAT_KEYS} for row in in_memory]
+
+
+def test_results_bump_the_version_and_only_dirty_rows(game_db):
+    league_table = LeagueTable(game_db)
+    home, away = table_order(league_table.get_league_table(1))[:2]
+    version = league_table.version(1)
+
+    league_table.apply_result(1, home, away, 0, 2)
+    assert league_table.version(1) > version
+    assert league_table.dirty == {home, away}
+    assert table_order(league_table.get_league_table(1))[0] == away
+    league_table.flush()
+    assert not league_table.dirty
+
+
+def test_invalidate_drops_unsaved_changes(game_db):
+    league_table = LeagueTable(game_db)
+    home, away = table_order(league_table.get_league_table(1))[:2]
+    league_table.apply_result(1, home, away, 3, 0)
+    league_table.invalidate(1)
+    assert all(row['played'] == 0 for row in league_table.get_league_table(1))
+
+
+def test_movement_places_skip_missing_levels():
+    assert movement_places(1, {1, 2, 3, 4}) == (0, 3)
+    assert movement_places(4, {1, 2, 3, 4}) == (4, 0)
+    assert movement_places(2, {1, 2}) == (3, 0)
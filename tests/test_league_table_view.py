@@ -0,0 +1,41 @@
+import os
+from types import SimpleNamespace
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame  # noqa: E402
+import pytest  # noqa: E402
+
+from controllers.league_table import LeagueTable  # noqa: E402
+from controllers.match_engine import MatchEngine  # noqa: E402
+from views.league_table_view import LeagueTableView  # noqa: E402
+
+
+@pytest.fixture
+def view(game_db):
+    pygame.font.init()
+    view = LeagueTableView(pygame.Surface((1024, 768)), pygame.font.Font(None, 12), 1, game_db, LeagueTable(game_db))
+    view.PROJECTION_SIMULATIONS = 100
+    return view
+
+
+def run_projection(view):
+    assert view.handle_input(pygame.K_p) == "PROJECT"
+    view.projection_done(SimpleNamespace(error=None, result=view.project(None)))
+
+
+def test_projection_is_shown_until_the_standings_change(view, game_db):
+    view.draw()
+    run_projection(view)
+    view.draw()
+    assert view.show_projection and view.projection
+
+    MatchEngine(game_db, seed=1, league_table=view.league_table).simulate_matchday()
+    view.draw()
+    assert view.projection is None
+    assert not view.show_projection
+    assert view.projection_stale
+
+    run_projection(view)
+    view.draw()
+    assert view.show_projection and view.projection
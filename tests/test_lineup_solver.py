@@ -0,0 +1,60 @@
+import itertools
+import random
+
+import pytest
+
+from controllers import lineup_solver
+from controllers.player_rating import slot_ratings
+
+
+def test_solve_assignment_matches_brute_force():
+    rng = random.Random(3)
+    for _ in range(20):
+        cost = [[rng.randint(0, 50) for _ in range(6)] for _ in range(4)]
+        best = min(sum(cost[row][column] for row, column in enumerate(columns))
+                   for columns in itertools.permutations(range(6), 4))
+        assignment = lineup_solver.solve_assignment(cost)
+        assert len(set(assignment)) == 4
+        assert sum(cost[row][column] for row, column in enumerate(assignment)) == best
+
+
+def test_solve_assignment_needs_enough_columns():
+    with pytest.raises(ValueError):
+        lineup_solver.solve_assignment([[1], [2]])
+
+
+@pytest.mark.parametrize('formation', sorted(lineup_solver.FORMATIONS))
+def test_formation_slots_have_one_keeper_and_ten_outfielders(formation):
+    slots = lineup_solver.formation_slots(formation)
+    assert len(slots) == 11
+    assert slots[0] == 'GK' and slots.count('GK') == 1
+
+
+def player(player_id, position, skill):
+    return {'id': player_id, 'position': position, 'attacking': skill, 'defending': skill,
+            'goalkeeping': skill if position == 'GK' else 20, 'stamina': 70, 'speed': 70}
+
+
+def test_best_lineup_fills_every_slot_with_distinct_players():
+    squad = ([player(1, 'GK', 80), player(2, 'GK', 60)]
+             + [player(10 + i, position, 50 + i) for i, position in enumerate(['DEF'] * 6 + ['MID'] * 6 + ['ATT'] * 4)])
+    lineup = lineup_solver.best_lineup(squad)
+
+    assert [slot for slot, p in lineup] == lineup_solver.formation_slots(lineup_solver.DEFAULT_FORMATION)
+    assert len({p['id'] for slot, p in lineup}) == 11
+    assert lineup[0][1]['id'] == 1  # The better keeper
+    total = sum(slot_ratings(p)[slot] for slot, p in lineup)
+    swapped = [('GK', squad[1])] + lineup[1:]
+    assert total >= sum(slot_ratings(p)[slot] for slot, p in swapped)
+
+
+def test_best_lineup_plays_an_outfielder_in_goal_without_a_keeper():
+    squad = [player(i, position, 60) for i, position in enumerate(['DEF'] * 5 + ['MID'] * 5 + ['ATT'] * 3)]
+    lineup = lineup_solver.best_lineup(squad)
+
+    assert len(lineup) == 11
+    assert lineup[0][0] == 'GK' and lineup[0][1]['position'] != 'GK'
+
+
+def test_best_lineup_is_empty_for_a_short_squad():
+    assert lineup_solver.best_lineup([player(1, 'GK', 60)]) == []
@@ -0,0 +1,67 @@
+import sqlite3
+
+import pytest
+
+from database import migrations
+
+
+def indexes(conn):
+    return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+
+def test_migrate_applies_every_version_once():
+    conn = sqlite3.connect(':memory:')
+    assert migrations.migrate(conn) == [version for version, description, steps in migrations.MIGRATIONS]
+    assert migrations.get_schema_version(conn) == migrations.LATEST_VERSION
+    assert migrations.migrate(conn) == []
+
+
+def test_migrate_stops_at_target_and_resumes():
+    conn = sqlite3.connect(':memory:')
+    assert migrations.migrate(conn, target=4) == [1, 2, 3, 4]
+    assert 'idx_players_rating_stale' in indexes(conn)
+
+    applied = migrations.migrate(conn)
+    assert applied[0] == 5 and applied[-1] == migrations.LATEST_VERSION
+    assert 'idx_players_rating_stale' not in indexes(conn)
+    assert 'idx_players_rating' in indexes(conn)
+
+
+def test_duplicate_league_rows_are_removed_before_the_unique_index():
+    conn = sqlite3.connect(':memory:')
+    migrations.migrate(conn, target=2)
+    conn.executemany("INSERT INTO league_tables (team_id, division_id, season, points) VALUES (?, ?, ?, ?)",
+                     [(1, 1, 1, 3), (1, 1, 1, 6), (2, 1, 1, 0)])
+    conn.commit()
+
+    migrations.migrate(conn)
+    assert conn.execute("SELECT team_id, points FROM league_tables ORDER BY team_id").fetchall() == [(1, 3), (2, 0)]
+
+
+def test_rating_trigger_marks_changed_players_stale():
+    conn = sqlite3.connect(':memory:')
+    migrations.migrate(conn)
+    conn.execute("""
+        INSERT INTO players (id, first_name, last_name, position, attacking, rating)
+        VALUES (1, 'A', 'B', 'ATT', 50, 60.0)
+    """)
+    conn.execute("UPDATE players SET morale = 90 WHERE id = 1")
+    assert conn.execute("SELECT rating FROM players").fetchone()[0] == 60.0
+    conn.execute("UPDATE players SET attacking = 70 WHERE id = 1")
+    assert conn.execute("SELECT rating FROM players").fetchone()[0] is None
+
+
+def test_failed_migration_rolls_back_and_raises(monkeypatch, caplog):
+    conn = sqlite3.connect(':memory:')
+    migrations.migrate(conn)
+    broken = (migrations.LATEST_VERSION + 1, "Broken", [
+        "CREATE TABLE half_done (id INTEGER)",
+        "INSERT INTO no_such_table VALUES (1)",
+    ])
+    monkeypatch.setattr(migrations, 'MIGRATIONS', migrations.MIGRATIONS + [broken])
+
+    with pytest.raises(sqlite3.OperationalError):
+        migrations.migrate(conn, target=broken[0])
+    assert migrations.get_schema_version(conn) == migrations.LATEST_VERSION
+    assert conn.execute("SELECT name FROM sqlite_master WHERE name = 'half_done'").fetchone() is None
+    assert any(record.exc_info for record in caplog.records)
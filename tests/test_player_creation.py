@@ -0,0 +1,24 @@
+import pytest
+
+from controllers.player_creation import PlayerCreator
+
+
+@pytest.fixture(scope='module')
+def creator():
+    return PlayerCreator()
+
+
+@pytest.mark.parametrize('reputation', [1, 30, 41, 50, 100])
+def test_generate_batch_handles_any_importable_reputation(creator, reputation):
+    batch = creator.generate_batch(creator.squad_specs([(1, reputation)]), seed=1)
+    assert len(batch['value']) == sum(PlayerCreator.SQUAD_POSITIONS.values())
+    assert (batch['value'] > 0).all()
+    assert (batch['wages'] >= 0).all()
+    assert (batch['stamina'] >= 50).all()
+
+
+@pytest.mark.parametrize('reputation', [1, 30, 100])
+def test_generate_squad_handles_any_importable_reputation(creator, reputation):
+    squad = creator.generate_squad(1, reputation)
+    assert len(squad) == sum(PlayerCreator.SQUAD_POSITIONS.values())
+    assert all(50 <= player['stamina'] <= 99 for player in squad)
@@ -0,0 +1,51 @@
+import threading
+
+from controllers.transfer_market import TransferMarket
+
+
+def test_proxies_keep_their_player_across_reloads(game_db):
+    store = game_db.player_store()
+    players = store.team_players(50)
+    ids = [player['id'] for player in players]
+
+    TransferMarket(game_db).ai_window()
+    store.ensure_loaded()
+
+    assert [player['id'] for player in players] == ids
+
+
+def test_flush_writes_changed_fields(game_db):
+    store = game_db.player_store()
+    player = store.team_players(1)[0]
+    store.set(player['id'], 'morale', 1)
+
+    assert store.flush() == 1
+    with game_db.connect_readonly() as conn:
+        assert conn.execute("SELECT morale FROM players WHERE id = ?", (player['id'],)).fetchone()[0] == 1
+
+
+def test_reads_survive_reloads_on_another_thread(game_db):
+    store = game_db.player_store()
+    expected = {player['id']: player['last_name'] for player in store.team_players(1)}
+    errors = []
+    done = threading.Event()
+
+    def reload():
+        try:
+            for _ in range(30):
+                game_db.invalidate_player_store()
+                store.load()
+        except Exception as e:  # Reported by the assertion below
+            errors.append(e)
+        finally:
+            done.set()
+
+    worker = threading.Thread(target=reload)
+    worker.start()
+    try:
+        while not done.is_set():
+            squad = store.team_players(1)
+            assert {player['id']: player['last_name'] for player in squad} == expected
+    finally:
+        worker.join()
+    assert not errors
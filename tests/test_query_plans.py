@@ -0,0 +1,45 @@
+"""EXPLAIN QUERY PLAN checks proving the hot queries use their indexes"""
+import pytest
+
+from controllers.fixtures import FixtureList
+from controllers.league_table import LeagueTable
+from controllers.player_search import PlayerSearch
+from controllers.transfer_market import TransferMarket
+from database.database import FootballDB
+
+# name -> (sql, params, index the plan must use)
+HOT_QUERIES = {
+    'get_team_players': (FootballDB.TEAM_PLAYERS_SQL, (1,), 'idx_players_team_position'),
+    'get_teams_in_division': (FootballDB.TEAMS_IN_DIVISION_SQL, (1,), 'idx_teams_division_name'),
+    'get_league_table': (LeagueTable.TABLE_SQL, (1,), 'idx_league_tables_division'),
+    'save_team_selection': (FootballDB.save_selection_sql(11), tuple(range(1, 12)) + (1,) + tuple(range(1, 12)),
+                            'idx_players_team_position'),
+    'league_table_row': ("SELECT * FROM league_tables WHERE team_id = ? AND season = ?", (1, 1),
+                         'idx_league_tables_team_season'),
+    # idx_players_rating (migration 8) serves rating IS NULL; migration 10 dropped the partial index
+    'refresh_ratings': (FootballDB.STALE_RATINGS_SQL, (), 'idx_players_rating'),
+    'fixtures_on_matchday': (FixtureList.MATCHDAY_SQL, (1, 1), 'idx_fixtures_season_matchday'),
+    'next_fixture_home': (FixtureList.NEXT_FIXTURE_SQL, (1, 1, 1, 1), 'idx_fixtures_home_team'),
+    'next_fixture_away': (FixtureList.NEXT_FIXTURE_SQL, (1, 1, 1, 1), 'idx_fixtures_away_team'),
+    'transfer_search': (TransferMarket.SEARCH_COLUMNS + """
+        WHERE p.position = ? AND p.rating >= ? AND p.age <= ? ORDER BY p.rating DESC LIMIT 50
+    """, ('ATT', 60, 30), 'idx_players_position_rating'),
+    'player_search_next_page': (PlayerSearch.COLUMNS + """
+        WHERE (p.value, p.id) < (?, ?) ORDER BY p.value DESC, p.id DESC LIMIT 15
+    """, (1000000, 100), 'idx_players_value'),
+    'player_search_name_prefix': (PlayerSearch.COLUMNS + """
+        WHERE p.last_name >= ? AND p.last_name < ? ORDER BY p.last_name, p.id LIMIT 15
+    """, ('Sm', 'Sm\uffff'), 'idx_players_name'),
+}
+
+
+def explain(conn, sql, params=()):
+    """The EXPLAIN QUERY PLAN detail lines for a statement"""
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+@pytest.mark.parametrize('name', sorted(HOT_QUERIES))
+def test_hot_query_uses_its_index(game_db, name):
+    sql, params, index = HOT_QUERIES[name]
+    plan = explain(game_db.connect(), sql, params)
+    assert any(index in line for line in plan), f"{name} misses {index}: {' | '.join(plan)}"
@@ -0,0 +1,53 @@
+import pytest
+
+from database.save_manager import SaveManager
+
+
+def snapshot(db):
+    with db.connect_readonly() as conn:
+        return {table: conn.execute(f"SELECT * FROM {table} ORDER BY rowid").fetchall()
+                for table in ('teams', 'players', 'league_tables', 'fixtures')}
+
+
+@pytest.fixture
+def saves(game_db, tmp_path):
+    return SaveManager(game_db, save_dir=str(tmp_path / 'saves'))
+
+
+def test_save_and_load_round_trip(game_db, saves):
+    saved = snapshot(game_db)
+    assert saves.save('1')['mode'] == 'full'
+
+    with game_db.connect() as conn:
+        conn.execute("UPDATE teams SET finances = 0")
+        conn.execute("DELETE FROM players WHERE team_id = 1")
+    assert snapshot(game_db) != saved
+
+    saves.load('1')
+    assert snapshot(game_db) == saved
+    assert saves.slot_info('1')['season'] == 1
+
+
+def test_incremental_save_writes_only_changed_rows(game_db, saves):
+    saves.save('2')
+    store = game_db.player_store()
+    player = store.team_players(1)[0]
+    store.set(player['id'], 'morale', 1 if player['morale'] != 1 else 2)  # Flushed by save()
+
+    result = saves.save('2')
+    assert result['mode'] == 'incremental'
+    assert result['rows'] == 2  # The player's old row out, the new one in
+    expected = snapshot(game_db)
+
+    with game_db.connect() as conn:
+        conn.execute("UPDATE players SET morale = 50")
+    saves.load('2')
+    assert snapshot(game_db) == expected
+
+
+def test_bad_and_empty_slots(saves):
+    with pytest.raises(ValueError):
+        saves.slot_path('../escape')
+    with pytest.raises(FileNotFoundError):
+        saves.load('3')
+    assert saves.list_slots() == [None] * SaveManager.SLOT_COUNT
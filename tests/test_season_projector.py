@@ -0,0 +1,29 @@
+from controllers.season_projector import SeasonProjector
+
+
+def project(db):
+    return SeasonProjector(db, simulations=200, workers=1, seed=1).project()
+
+
+def test_movement_odds_follow_division_level_not_id(game_db):
+    # Turn the pyramid upside down: division 4 becomes the top flight
+    with game_db.connect() as conn:
+        conn.execute("UPDATE divisions SET level = 5 - level")
+    odds = project(game_db)
+
+    top = [team for team in odds.values() if team['division_id'] == 4]
+    bottom = [team for team in odds.values() if team['division_id'] == 1]
+    assert all(team['promotion'] == 0.0 for team in top)
+    assert sum(team['relegation'] for team in top) > 0
+    assert all(team['relegation'] == 0.0 for team in bottom)
+    assert sum(team['promotion'] for team in bottom) > 0
+
+
+def test_projection_does_not_write_fixtures(game_db):
+    with game_db.connect() as conn:
+        conn.execute("DELETE FROM fixtures")
+    odds = project(game_db)
+
+    assert odds
+    with game_db.connect_readonly() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM fixtures").fetchone()[0] == 0
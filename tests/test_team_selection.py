@@ -0,0 +1,53 @@
+from controllers.team_selection import TeamSelection
+
+
+def remove_keepers(db, team_id):
+    with db.connect() as conn:
+        conn.execute("UPDATE players SET team_id = NULL WHERE team_id = ? AND position = 'GK'", (team_id,))
+    db.invalidate_player_store()
+
+
+def selected_ids(db, team_id):
+    with db.connect_readonly() as conn:
+        return {row[0] for row in conn.execute("SELECT id FROM players WHERE team_id = ? AND is_selected", (team_id,))}
+
+
+def test_auto_selection_without_a_keeper_is_saved_and_stays_valid(game_db):
+    remove_keepers(game_db, 7)
+    selection = TeamSelection(game_db)
+
+    assert selection.auto_select_team(7)
+    assert len(selected_ids(game_db, 7)) == 11
+
+    # As PlayerSelectionView does: reload the saved XI and save it again
+    reloaded = TeamSelection(game_db)
+    reloaded.load_selection(7)
+    assert reloaded.is_valid_selection()
+
+
+def test_bulk_auto_selection_saves_every_club(game_db):
+    remove_keepers(game_db, 8)
+    assert TeamSelection(game_db).auto_select_teams([7, 8]) == 2
+    assert len(selected_ids(game_db, 8)) == 11
+
+
+def test_manual_selection_allows_one_natural_keeper(game_db):
+    squad = game_db.player_store().team_players(1)
+    keepers = [p for p in squad if p['position'] == 'GK']
+    outfield = [p for p in squad if p['position'] != 'GK']
+    selection = TeamSelection(game_db)
+
+    assert selection.toggle_player(keepers[0])
+    assert not selection.toggle_player(keepers[1])
+    for p in outfield[:10]:
+        assert selection.toggle_player(p)
+    assert selection.is_valid_selection()
+    assert not selection.toggle_player(outfield[10])
+
+
+def test_manual_selection_needs_someone_in_goal(game_db):
+    outfield = [p for p in game_db.player_store().team_players(1) if p['position'] != 'GK']
+    selection = TeamSelection(game_db)
+    for p in outfield[:11]:
+        selection.toggle_player(p)
+    assert not selection.is_valid_selection()
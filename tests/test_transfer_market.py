@@ -0,0 +1,53 @@
+import pytest
+
+from controllers.transfer_market import TransferMarket
+
+
+def squad_size(db, team_id):
+    with db.connect_readonly() as conn:
+        return conn.execute("SELECT COUNT(*) FROM players WHERE team_id = ?", (team_id,)).fetchone()[0]
+
+
+def signable(db, team_id, count):
+    """Players from other clubs, cheapest first"""
+    with db.connect_readonly() as conn:
+        return [row[0] for row in conn.execute(
+            "SELECT id FROM players WHERE team_id IS NOT ? ORDER BY value, id LIMIT ?", (team_id, count))]
+
+
+@pytest.fixture
+def rich_team(game_db):
+    with game_db.connect() as conn:
+        conn.execute("UPDATE teams SET finances = ? WHERE id = 1", (10 ** 12,))
+    return 1
+
+
+def test_buy_moves_the_player_and_the_fee(game_db, rich_team):
+    market = TransferMarket(game_db)
+    player_id = signable(game_db, rich_team, 1)[0]
+    before = squad_size(game_db, rich_team)
+
+    transfer = market.buy(player_id, rich_team)
+    assert transfer['to_team_id'] == rich_team
+    assert squad_size(game_db, rich_team) == before + 1
+    with pytest.raises(ValueError, match="That player already plays for you"):
+        market.buy(player_id, rich_team)
+
+
+def test_buy_stops_at_a_full_squad(game_db, rich_team):
+    market = TransferMarket(game_db)
+    room = market.MAX_SQUAD_SIZE - squad_size(game_db, rich_team)
+    targets = signable(game_db, rich_team, room + 1)
+    for player_id in targets[:room]:
+        market.buy(player_id, rich_team)
+
+    with pytest.raises(ValueError, match="squad is full"):
+        market.buy(targets[room], rich_team)
+    assert squad_size(game_db, rich_team) == market.MAX_SQUAD_SIZE
+
+
+def test_buy_refuses_what_the_club_cannot_afford(game_db):
+    with game_db.connect() as conn:
+        conn.execute("UPDATE teams SET finances = 0 WHERE id = 1")
+    with pytest.raises(ValueError, match="Not enough money"):
+        TransferMarket(game_db).buy(signable(game_db, 1, 1)[0], 1)
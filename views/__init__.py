@@ -1 +1,29 @@
-# This file can be empty
+# Views are imported on first use (views.TeamView etc.), so starting the
+# game only loads the modules the main menu needs.
+import importlib
+
+VIEW_MODULES = {
+    'MenuView': 'views.menu_view',
+    'DivisionSelectView': 'views.division_select_view',
+    'TeamSelectView': 'views.team_select_view',
+    'GameMenuView': 'views.game_menu_view',
+    'TeamSubmenuView': 'views.team_submenu_view',
+    'TeamView': 'views.team_view',
+    'PlayerView': 'views.player_view',
+    'PlayerSelectionView': 'views.player_selection_view',
+    'LeagueTableView': 'views.league_table_view',
+    'FixturesView': 'views.fixtures_view',
+    'TransferView': 'views.transfer_view',
+    'PlayerSearchView': 'views.player_search_view',
+    'SaveSlotView': 'views.save_slot_view',
+    'ProgressView': 'views.progress_view',
+}
+
+
+def __getattr__(name):
+    module = VIEW_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module 'views' has no attribute {name!r}")
+    view_class = getattr(importlib.import_module(module), name)
+    globals()[name] = view_class  # Later lookups skip this function
+    return view_class
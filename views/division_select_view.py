@@ -1,41 +1,43 @@
 import pygame
+from views.text_cache import render_text
 from database.database import FootballDB
 
 class DivisionSelectView:
-    def __init__(self, screen, font):
+    def __init__(self, screen, font, db=None):
         self.screen = screen
         self.font = font
-        self.db = FootballDB()
+        self.db = db or FootballDB.shared()
         self.selected_index = 0
-        self.divisions = [
-            "Premier League",
-            "Championship",
-            "League One",
-            "League Two"
-        ]
+        # (id, name) of every division, top flight first; imported leagues bring their own
+        with self.db.connect_readonly() as conn:
+            self.divisions = [(row['id'], row['name'])
+                              for row in conn.execute("SELECT id, name FROM divisions ORDER BY level, id")]
 
     def handle_input(self, key):
+        if not self.divisions:
+            return None
         if key == pygame.K_UP:
             self.selected_index = (self.selected_index - 1) % len(self.divisions)
         elif key == pygame.K_DOWN:
             self.selected_index = (self.selected_index + 1) % len(self.divisions)
-        elif key == pygame.K_RETURN:
-            return self.selected_index + 1  # Division IDs start from 1
+        elif key == pygame.K_RETURN and self.divisions:
+            return self.divisions[self.selected_index][0]
         return None
 
     def draw(self):
         center_x = self.screen.get_width() // 2
         center_y = self.screen.get_height() // 2
-        spacing = 50
+        # Closer together when an imported league has more divisions than fit
+        spacing = min(50, (self.screen.get_height() - center_y + 20) // max(len(self.divisions), 1))
 
         # Draw title
-        title = self.font.render("SELECT DIVISION", True, (255, 255, 255))
+        title = render_text(self.font, "SELECT DIVISION", (255, 255, 255))
         title_rect = title.get_rect(center=(center_x, center_y - 150))
         self.screen.blit(title, title_rect)
 
         # Draw divisions
-        for i, division in enumerate(self.divisions):
+        for i, (division_id, name) in enumerate(self.divisions):
             color = (255, 255, 0) if i == self.selected_index else (255, 255, 255)
-            text = self.font.render(division, True, color)
+            text = render_text(self.font, name, color)
             text_rect = text.get_rect(center=(center_x, center_y - 50 + i * spacing))
             self.screen.blit(text, text_rect)
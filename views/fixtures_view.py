@@ -0,0 +1,73 @@
+import pygame
+from views.text_cache import render_text
+from controllers.fixtures import FixtureList
+from database.database import FootballDB
+
+class FixturesView:
+    VISIBLE_ROWS = 14
+
+    def __init__(self, screen, font, team_id, db=None):
+        self.screen = screen
+        self.font = font
+        self.team_id = team_id
+        self.db = db or FootballDB.shared()
+        # Read only: fixtures are scheduled by the new-game, load and rollover jobs
+        fixture_list = FixtureList(self.db)
+        self.fixtures = fixture_list.team_fixtures(team_id, fixture_list.current_season())
+        # Row text never changes while the view is open, so build it once
+        self.rows = [self.format_row(fixture) for fixture in self.fixtures]
+        # Start scrolled to the next unplayed fixture
+        upcoming = [i for i, fixture in enumerate(self.fixtures) if fixture['home_goals'] is None]
+        self.next_index = upcoming[0] if upcoming else None
+        self.scroll_offset = max(0, min(self.next_index or 0, len(self.rows) - self.VISIBLE_ROWS))
+        self.headers = ["MD", "Date", "", "Opponent", "Score"]
+        self.column_x = [50, 120, 300, 360, 820]
+
+    def format_row(self, fixture):
+        home = fixture['home_team_id'] == self.team_id
+        opponent = fixture['away_team'] if home else fixture['home_team']
+        if fixture['home_goals'] is None:
+            score = "-"
+        elif home:
+            score = f"{fixture['home_goals']}-{fixture['away_goals']}"
+        else:
+            score = f"{fixture['away_goals']}-{fixture['home_goals']}"
+        return [str(fixture['matchday']), fixture['match_date'], "H" if home else "A", opponent, score]
+
+    def handle_input(self, key):
+        if key == pygame.K_ESCAPE:
+            return "BACK"
+        elif key == pygame.K_UP:
+            self.scroll_offset = max(0, self.scroll_offset - 1)
+        elif key == pygame.K_DOWN:
+            self.scroll_offset = max(0, min(self.scroll_offset + 1, len(self.rows) - self.VISIBLE_ROWS))
+        return None
+
+    def draw(self):
+        # Draw title
+        title = render_text(self.font, "FIXTURES", (255, 255, 255))
+        title_rect = title.get_rect(center=(self.screen.get_width() // 2, 50))
+        self.screen.blit(title, title_rect)
+
+        if not self.rows:
+            text = render_text(self.font, "No fixtures scheduled", (255, 255, 255))
+            self.screen.blit(text, text.get_rect(center=(self.screen.get_width() // 2, 200)))
+            return
+
+        # Draw headers
+        for header, x in zip(self.headers, self.column_x):
+            text = render_text(self.font, header, (255, 255, 0))
+            self.screen.blit(text, (x, 100))
+
+        # Draw visible fixtures; the next one to play is highlighted
+        y = 140
+        for i in range(self.scroll_offset, min(self.scroll_offset + self.VISIBLE_ROWS, len(self.rows))):
+            color = (255, 255, 0) if i == self.next_index else (255, 255, 255)
+            for value, x in zip(self.rows[i], self.column_x):
+                text = render_text(self.font, value, color)
+                self.screen.blit(text, (x, y))
+            y += 40
+
+        # Draw instructions
+        instructions = render_text(self.font, "UP/DOWN to scroll, ESC to return", (255, 255, 255))
+        self.screen.blit(instructions, instructions.get_rect(center=(self.screen.get_width() // 2, 730)))
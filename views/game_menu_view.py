@@ -1,4 +1,5 @@
 import pygame
+from views.text_cache import render_text
 
 class GameMenuView:
     def __init__(self, screen, font, team_id):
@@ -8,6 +9,7 @@ class GameMenuView:
         self.selected_index = 0
         self.menu_items = [
             "Team",
+            "Play Matchday",
             "Tactics",
             "Fixtures",
             "Transfers",
@@ -34,7 +36,7 @@ class GameMenuView:
     def draw(self):
         # Draw title
         center_x = self.screen.get_width() // 2
-        title = self.font.render("GAME MENU", True, (255, 255, 255))
+        title = render_text(self.font, "GAME MENU", (255, 255, 255))
         title_rect = title.get_rect(center=(center_x, 50))
         self.screen.blit(title, title_rect)
 
@@ -43,6 +45,6 @@ class GameMenuView:
         spacing = 40
         for i, item in enumerate(self.menu_items):
             color = (255, 255, 0) if i == self.selected_index else (255, 255, 255)
-            text = self.font.render(item, True, color)
+            text = render_text(self.font, item, color)
             text_rect = text.get_rect(center=(center_x, start_y + i * spacing))
             self.screen.blit(text, text_rect)
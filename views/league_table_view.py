@@ -1,33 +1,82 @@
 import pygame
+from views.text_cache import render_text
 from controllers.league_table import LeagueTable
 
 class LeagueTableView:
-    def __init__(self, screen, font, division_id, db):
+    PROJECTION_SIMULATIONS = 2000  # Run on the job worker; kept small so the odds appear quickly
+
+    def __init__(self, screen, font, division_id, db, league_table=None, team_id=None):
         self.screen = screen
         self.font = font
         self.division_id = division_id
-        self.league_table = LeagueTable(db)
-        # Get any team from this division to store team_id
-        with db.connect() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT id FROM teams WHERE division_id = ? LIMIT 1", (division_id,))
-            result = cursor.fetchone()
-            self.team_id = result[0] if result else None
+        self.db = db
+        self.league_table = league_table or LeagueTable(db)
+        # Rows are re-read only when the league table's version changes
+        self.table_data = []
+        self.table_version = None
+        self.projection = None  # team_id -> odds, computed on demand by a background job
+        self.projection_version = None  # Standings version the odds were asked for at
+        self.projecting = False  # True while that job is queued or running
+        self.projection_stale = False
+        self.projection_error = None
+        self.show_projection = False
+        # The managed team, so BACK returns to its menu
+        self.team_id = team_id
         # Header for the table columns
         self.headers = ["Pos", "Club", "P", "W", "D", "L", "GF", "GA", "GD", "Pts"]
         self.column_widths = [50, 300, 40, 40, 40, 40, 50, 50, 50, 50]  # Widths for each column
+        self.projection_headers = ["Title", "Up", "Down"]
+        self.projection_width = 70
+
+    @property
+    def dirty(self):
+        """True when the standings changed since the rows were last drawn"""
+        return self.league_table.version(self.division_id) != self.table_version
 
     def handle_input(self, key):
         if key == pygame.K_ESCAPE:
             return "BACK"
+        elif key == pygame.K_p:
+            self.show_projection = not self.show_projection
+            if self.show_projection and self.projection is None and not self.projecting:
+                # The game runs project() on the job worker, then calls projection_done()
+                self.projecting = True
+                self.projection_error = None
+                self.projection_stale = False
+                self.projection_version = self.league_table.version(self.division_id)
+                return "PROJECT"
         return None
 
+    def project(self, progress):
+        """Job body: simulate the rest of the season (runs on the job worker)"""
+        from controllers.season_projector import SeasonProjector  # Only needed for the odds
+        projector = SeasonProjector(self.db, simulations=self.PROJECTION_SIMULATIONS, workers=1)
+        return projector.project()
+
+    def projection_done(self, job):
+        """Job callback on the UI thread: keep the odds, or the error"""
+        self.projecting = False
+        if job.error:
+            self.projection_error = job.error
+            self.show_projection = False
+        else:
+            self.projection = job.result
+
     def draw(self):
         # Get table data
-        table_data = self.league_table.get_league_table(self.division_id)
+        version = self.league_table.version(self.division_id)
+        if version != self.table_version or not self.table_data:
+            self.table_data = self.league_table.get_league_table(self.division_id)
+            self.table_version = self.league_table.version(self.division_id)
+        if self.projection is not None and self.projection_version != self.table_version:
+            # Results came in since the odds were worked out; P asks for new ones
+            self.projection = None
+            self.projection_stale = self.show_projection
+            self.show_projection = False
+        table_data = self.table_data
         
         # Draw title
-        title = self.font.render("LEAGUE TABLE", True, (255, 255, 255))
+        title = render_text(self.font, "LEAGUE TABLE", (255, 255, 255))
         title_rect = title.get_rect(center=(self.screen.get_width() // 2, 50))
         self.screen.blit(title, title_rect)
 
@@ -35,34 +84,55 @@ class LeagueTableView:
         y = 100
         x = 50
         for header, width in zip(self.headers, self.column_widths):
-            text = self.font.render(header, True, (255, 255, 0))
+            text = render_text(self.font, header, (255, 255, 0))
             self.screen.blit(text, (x, y))
             x += width
+        if self.show_projection:
+            for header in self.projection_headers:
+                text = render_text(self.font, header, (255, 255, 0))
+                self.screen.blit(text, (x, y))
+                x += self.projection_width
 
         # Draw table data
         y = 140
         for pos, row in enumerate(table_data, 1):
             x = 50
             # Position number
-            pos_text = self.font.render(str(pos), True, (255, 255, 255))
+            pos_text = render_text(self.font, str(pos), (255, 255, 255))
             self.screen.blit(pos_text, (x, y))
             x += self.column_widths[0]
             
             # Club name
-            club_text = self.font.render(row['club'], True, (255, 255, 255))
+            club_text = render_text(self.font, row['club'], (255, 255, 255))
             self.screen.blit(club_text, (x, y))
             x += self.column_widths[1]
             
             # Stats
             for stat, width in zip(['played', 'won', 'drawn', 'lost', 'gf', 'ga', 'gd', 'pts'], 
                                  self.column_widths[2:]):
-                stat_text = self.font.render(str(row[stat]), True, (255, 255, 255))
+                stat_text = render_text(self.font, str(row[stat]), (255, 255, 255))
                 self.screen.blit(stat_text, (x, y))
                 x += width
+
+            # Projected odds
+            if self.show_projection and self.projection:
+                odds = self.projection.get(row['team_id'], {})
+                for key in ('title', 'promotion', 'relegation'):
+                    odds_text = render_text(self.font, f"{odds.get(key, 0) * 100:.0f}%", (0, 255, 255))
+                    self.screen.blit(odds_text, (x, y))
+                    x += self.projection_width
             
             y += 25
 
         # Draw footer with instructions
-        footer = self.font.render("Press ESC to return", True, (255, 255, 255))
+        if self.show_projection and self.projecting:
+            footer_text = "Working out season odds..."
+        elif self.projection_error:
+            footer_text = f"Season odds failed: {self.projection_error}"
+        elif self.projection_stale:
+            footer_text = "Results are in - press P for new season odds, ESC to return"
+        else:
+            footer_text = "Press P to toggle season odds, ESC to return"
+        footer = render_text(self.font, footer_text, (255, 255, 255))
         footer_rect = footer.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() - 50))
         self.screen.blit(footer, footer_rect)
@@ -1,14 +1,13 @@
 # views/menu_view.py
 import pygame
+from views.text_cache import render_text
 import sys  # Add this import
-from .division_select_view import DivisionSelectView
-from .team_select_view import TeamSelectView
 
 class MenuView:
     def __init__(self, screen, font):
         self.screen = screen
         self.font = font
-        self.options = ["Start Game", "Load Game", "Settings", "Quit Game"]
+        self.options = ["Start Game", "Start Imported", "Load Game", "Settings", "Quit Game"]
         self.selected_option = 0
         
     def handle_input(self, key):
@@ -24,6 +23,10 @@ class MenuView:
         selected = self.options[self.selected_option]
         if selected == "Start Game":
             return "START_GAME"
+        elif selected == "Start Imported":
+            return "START_IMPORTED"  # Play with the squads already in the database
+        elif selected == "Load Game":
+            return "LOAD_GAME"
         elif selected == "Quit Game":
             pygame.quit()
             sys.exit()
@@ -36,13 +39,13 @@ class MenuView:
         spacing = 50
         
         # Draw title
-        title = self.font.render("FOOTBALL MANAGER", True, (255, 255, 255))
+        title = render_text(self.font, "FOOTBALL MANAGER", (255, 255, 255))
         title_rect = title.get_rect(center=(center_x, center_y - 150))
         self.screen.blit(title, title_rect)
         
         # Draw menu options
         for i, option in enumerate(self.options):
             color = (255, 255, 0) if i == self.selected_option else (255, 255, 255)
-            text = self.font.render(option, True, color)
+            text = render_text(self.font, option, color)
             text_rect = text.get_rect(center=(center_x, center_y - 50 + i * spacing))
             self.screen.blit(text, text_rect)
\ No newline at end of file
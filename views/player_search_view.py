@@ -0,0 +1,149 @@
+import pygame
+from views.text_cache import render_text
+from controllers.player_search import PlayerSearch
+from database.database import FootballDB
+
+class PlayerSearchView:
+    POSITION_FILTERS = [None, 'GK', 'DEF', 'MID', 'ATT']
+    SORT_ORDER = ['rating', 'value', 'age', 'name', 'attacking', 'defending', 'goalkeeping',
+                  'stamina', 'speed', 'morale', 'wages']
+
+    def __init__(self, screen, font, team_id, db=None):
+        self.screen = screen
+        self.font = font
+        self.team_id = team_id
+        self.db = db or FootballDB.shared()
+        self.search = PlayerSearch(self.db)
+        with self.db.connect_readonly() as conn:
+            self.division_filters = [None] + [row[0] for row in conn.execute("SELECT id FROM divisions ORDER BY id")]
+        self.sort_index = 0
+        self.descending = True
+        self.position_index = 0
+        self.division_index = 0
+        self.free_agents = False
+        self.spacing = 32
+        self.headers = ["Name", "Club", "Pos", "Age", "Rating", "Value"]
+        self.column_x = [40, 340, 580, 640, 710, 800]
+        self.new_search()
+
+    @property
+    def sort(self):
+        return self.SORT_ORDER[self.sort_index]
+
+    def filters(self):
+        return {
+            'position': self.POSITION_FILTERS[self.position_index],
+            'division_id': self.division_filters[self.division_index],
+            'free_agents': self.free_agents,
+        }
+
+    def new_search(self):
+        """Start again from the first page after the sort or a filter changed"""
+        self.page_starts = [None]  # Keyset start of every page visited, for paging back
+        self.total = self.search.count(**self.filters())
+        self.load_page(0)
+
+    def load_page(self, number, selected_index=0):
+        self.page_number = number
+        self.players = self.search.page(self.sort, self.descending, self.page_starts[number], **self.filters())
+        # Last column shows the sorted attribute when it isn't already on screen
+        self.extra = 'value' if self.sort in ('rating', 'age', 'name', 'value') else self.sort
+        self.rows = [self.format_row(player) for player in self.players]
+        self.selected_index = max(0, min(selected_index, len(self.rows) - 1))
+
+    def format_row(self, player):
+        extra = player[self.extra]
+        return [f"{player['first_name']} {player['last_name']}"[:24], (player['team'] or "Free agent")[:18],
+                player['position'], str(player['age']), str(int(round(player['rating'] or 0))),
+                f"{extra:,}" if self.extra == 'value' else str(extra)]
+
+    def next_page(self, selected_index=0):
+        if len(self.players) < PlayerSearch.PAGE_SIZE:
+            return
+        after = self.search.page_key(self.players[-1], self.sort)
+        if self.search.page(self.sort, self.descending, after, **self.filters()):
+            del self.page_starts[self.page_number + 1:]
+            self.page_starts.append(after)
+            self.load_page(self.page_number + 1, selected_index)
+
+    def previous_page(self, selected_index=0):
+        if self.page_number > 0:
+            self.load_page(self.page_number - 1, selected_index)
+
+    def handle_input(self, key):
+        if key == pygame.K_ESCAPE:
+            return "BACK"
+        elif key == pygame.K_UP:
+            if self.selected_index > 0:
+                self.selected_index -= 1
+            else:
+                self.previous_page(PlayerSearch.PAGE_SIZE - 1)
+        elif key == pygame.K_DOWN:
+            if self.selected_index < len(self.rows) - 1:
+                self.selected_index += 1
+            else:
+                self.next_page()
+        elif key == pygame.K_PAGEDOWN:
+            self.next_page(self.selected_index)
+        elif key == pygame.K_PAGEUP:
+            self.previous_page(self.selected_index)
+        elif key in (pygame.K_LEFT, pygame.K_RIGHT):
+            step = 1 if key == pygame.K_RIGHT else -1
+            self.sort_index = (self.sort_index + step) % len(self.SORT_ORDER)
+            self.descending = self.sort != 'name'
+            self.new_search()
+        elif key == pygame.K_s:
+            self.descending = not self.descending
+            self.new_search()
+        elif key == pygame.K_p:
+            self.position_index = (self.position_index + 1) % len(self.POSITION_FILTERS)
+            self.new_search()
+        elif key == pygame.K_d:
+            self.division_index = (self.division_index + 1) % len(self.division_filters)
+            self.free_agents = False
+            self.new_search()
+        elif key == pygame.K_f:
+            self.free_agents = not self.free_agents
+            self.division_index = 0
+            self.new_search()
+        elif key == pygame.K_RETURN and self.players:
+            return ("SHOW_PLAYER", self.players[self.selected_index])
+        return None
+
+    def draw(self):
+        # Draw title
+        title = render_text(self.font, "PLAYER SEARCH", (255, 255, 255))
+        title_rect = title.get_rect(center=(self.screen.get_width() // 2, 30))
+        self.screen.blit(title, title_rect)
+
+        # Sort, filters and where we are in the results
+        position = self.POSITION_FILTERS[self.position_index] or "ALL"
+        division = self.division_filters[self.division_index]
+        scope = "Free agents" if self.free_agents else f"Division {division}" if division else "All divisions"
+        order = "high-low" if self.descending else "low-high"
+        first = self.page_number * PlayerSearch.PAGE_SIZE + 1 if self.rows else 0
+        status = (f"Sort: {self.sort} {order}   Position: {position}   {scope}   "
+                  f"{first}-{first + len(self.rows) - 1 if self.rows else 0} of {self.total:,}")
+        self.screen.blit(render_text(self.font, status, (255, 255, 0)), (40, 70))
+
+        headers = self.headers[:-1] + [self.extra.capitalize()]
+        for header, x in zip(headers, self.column_x):
+            self.screen.blit(render_text(self.font, header, (255, 255, 255)), (x, 110))
+
+        if not self.rows:
+            text = render_text(self.font, "No players match", (255, 255, 255))
+            self.screen.blit(text, text.get_rect(center=(self.screen.get_width() // 2, 200)))
+
+        for i, row in enumerate(self.rows):
+            color = (255, 255, 0) if i == self.selected_index else (255, 255, 255)
+            y = 150 + i * self.spacing
+            for value, x in zip(row, self.column_x):
+                self.screen.blit(render_text(self.font, value, color), (x, y))
+
+        hints = ["LEFT/RIGHT sort  S order  P position  D division  F free agents",
+                 "PGUP/PGDN page  RETURN details  ESC back"]
+        y = self.screen.get_height() - 60
+        for hint in hints:
+            text = render_text(self.font, hint, (255, 255, 255))
+            self.screen.blit(text, text.get_rect(center=(self.screen.get_width() // 2, y)))
+            y += 30
@@ -1,21 +1,26 @@
 import pygame
+from views.text_cache import render_text
+from views.virtual_list import VirtualList
 from controllers.team_selection import TeamSelection
+from controllers.player_rating import display_rating
 from database.database import FootballDB  # Add this import
 
 class PlayerSelectionView:
-    def __init__(self, screen, font, team_id):
+    def __init__(self, screen, font, team_id, db=None):
         self.screen = screen
         self.font = font
         self.team_id = team_id
-        self.selected_index = 0
-        self.scroll_offset = 0
         self.visible_players = 8
         self.spacing = 50
-        self.db = FootballDB()
-        self.players = self.db.get_team_players(team_id)
+        self.db = db or FootballDB.shared()
+        self.players = self.db.player_store().team_players(team_id)
         self.players.sort(key=lambda x: self.POSITION_PRIORITY.get(x['position'], 999))
-        self.team_selection = TeamSelection()
+        # Ratings come precomputed from the rating engine; format them once
+        self.rating_labels = {p['id']: str(display_rating(p)) for p in self.players}
+        self.team_selection = TeamSelection(self.db)
         self.team_selection.load_selection(team_id)  # Load existing selection
+        self.list = VirtualList(self.players, self.visible_players, font, self.format_row,
+                                columns=(0, 20, 570, 770), label=self.player_name)
 
     POSITION_PRIORITY = {
         'GK': 0,
@@ -24,20 +29,26 @@ class PlayerSelectionView:
         'ATT': 3
     }
 
+    @staticmethod
+    def player_name(player):
+        return f"{player['first_name']} {player['last_name']}"
+
+    def format_row(self, player):
+        marker = "*" if self.team_selection.is_selected(player['id']) else ""
+        return [marker, self.player_name(player), player['position'], self.rating_labels[player['id']]]
+
+    @property
+    def selected_index(self):
+        return self.list.selected_index
+
     def handle_input(self, key):
-        if key == pygame.K_UP:
-            if self.selected_index > 0:
-                self.selected_index -= 1
-                if self.selected_index < self.scroll_offset:
-                    self.scroll_offset = self.selected_index
-        elif key == pygame.K_DOWN:
-            if self.selected_index < len(self.players) - 1:
-                self.selected_index += 1
-                if self.selected_index >= self.scroll_offset + self.visible_players:
-                    self.scroll_offset = self.selected_index - self.visible_players + 1
+        if self.list.handle_key(key):
+            pass
         elif key == pygame.K_SPACE:
-            if self.players and len(self.players) > self.selected_index:
-                self.team_selection.toggle_player(self.players[self.selected_index])
+            if self.players:
+                self.team_selection.toggle_player(self.list.selected)
+                # The selection marker is part of the cached row
+                self.list.invalidate_row(self.list.selected_index)
         elif key == pygame.K_RETURN:
             if self.team_selection.is_valid_selection():
                 self.team_selection.save_selection(self.team_id)  # Save selection
@@ -48,72 +59,42 @@ class PlayerSelectionView:
 
     def draw(self):
         # Draw title
-        title = self.font.render("SELECT STARTING 11", True, (255, 255, 255))
+        title = render_text(self.font, "SELECT STARTING 11", (255, 255, 255))
         title_rect = title.get_rect(center=(self.screen.get_width() // 2, 30))
         self.screen.blit(title, title_rect)
 
         # Draw selection status
         selected_count = len(self.team_selection.selected_players)
         status = f"Selected: {selected_count}/11"
-        status_text = self.font.render(status, True, (255, 255, 255))
+        status_text = render_text(self.font, status, (255, 255, 255))
         self.screen.blit(status_text, (50, 80))
 
         # Draw column headers
         headers = ["", "Name", "Pos", "Rating"]
         header_positions = [30, 50, 600, 800]
         for header, x_pos in zip(headers, header_positions):
-            text = self.font.render(header, True, (255, 255, 255))
+            text = render_text(self.font, header, (255, 255, 255))
             self.screen.blit(text, (x_pos, 120))
 
         # Draw players
         start_y = 160
-        end_index = min(self.scroll_offset + self.visible_players, len(self.players))
-        
-        for i in range(self.scroll_offset, end_index):
-            player = self.players[i]
-            y = start_y + ((i - self.scroll_offset) * self.spacing)
-            
+        for i, index in enumerate(self.list.visible()):
             # Determine text color
-            if i == self.selected_index:
+            if index == self.list.selected_index:
                 color = (255, 255, 0)  # Yellow for cursor
-            elif self.team_selection.is_selected(player['id']):
+            elif self.team_selection.is_selected(self.players[index]['id']):
                 color = (0, 255, 0)    # Green for selected
             else:
                 color = (255, 255, 255) # White for unselected
-
-            # Draw selection marker
-            if self.team_selection.is_selected(player['id']):
-                star = self.font.render("*", True, color)
-                self.screen.blit(star, (30, y))
-
-            # Draw player info
-            name = f"{player['first_name']} {player['last_name']}"
-            text = self.font.render(name, True, color)
-            self.screen.blit(text, (50, y))
-
-            text = self.font.render(player['position'], True, color)
-            self.screen.blit(text, (600, y))
-
-            rating = self.calculate_rating(player)
-            text = self.font.render(str(rating), True, color)
-            self.screen.blit(text, (800, y))
+            self.screen.blit(self.list.row_surface(index, color), (30, start_y + i * self.spacing))
 
         # Draw navigation hints
-        hints = ["SPACE - Select/Deselect", "RETURN - Confirm (when 11 selected)", "ESC - Back"]
+        hints = ["SPACE - Select/Deselect", "RETURN - Confirm (when 11 selected)", "ESC - Back",
+                 "PGUP/PGDN - Page  A-Z - Jump to name"]
         y = self.screen.get_height() - 30
         for hint in hints:
-            text = self.font.render(hint, True, (255, 255, 255))
+            text = render_text(self.font, hint, (255, 255, 255))
             text_rect = text.get_rect(bottom=y)
             text_rect.x = 20
             self.screen.blit(text, text_rect)
             y -= 30
-
-    def calculate_rating(self, player):
-        if player['position'] == 'GK':
-            return player['goalkeeping']
-        elif player['position'] == 'DEF':
-            return (player['defending'] * 2 + player['speed']) // 3
-        elif player['position'] == 'MID':
-            return (player['attacking'] + player['defending'] + player['speed']) // 3
-        else:  # ATT
-            return (player['attacking'] * 2 + player['speed']) // 3
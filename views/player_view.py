@@ -1,10 +1,12 @@
 import pygame
+from views.text_cache import render_text
 
 class PlayerView:
-    def __init__(self, screen, font, player_data):
+    def __init__(self, screen, font, player_data, return_to=None):
         self.screen = screen
         self.font = font
         self.player = player_data
+        self.return_to = return_to  # (view name, key) to go back to; the player's team by default
 
     def handle_input(self, key):
         if key == pygame.K_ESCAPE:
@@ -14,7 +16,7 @@ class PlayerView:
     def draw(self):
         # Draw title
         name = f"{self.player['first_name']} {self.player['last_name']}"
-        title = self.font.render(name, True, (255, 255, 255))
+        title = render_text(self.font, name, (255, 255, 255))
         title_rect = title.get_rect(center=(self.screen.get_width() // 2, 30))
         self.screen.blit(title, title_rect)
 
@@ -39,17 +41,17 @@ class PlayerView:
         
         for label, value in stats:
             # Label (right-aligned)
-            text = self.font.render(f"{label}:", True, (200, 200, 200))
+            text = render_text(self.font, f"{label}:", (200, 200, 200))
             text_rect = text.get_rect(right=label_x, y=y)  # Right-align the label
             self.screen.blit(text, text_rect)
             
             # Value (left-aligned)
-            text = self.font.render(value, True, (255, 255, 255))
+            text = render_text(self.font, value, (255, 255, 255))
             self.screen.blit(text, (value_x, y))
             y += 40
 
         # Draw navigation hint
-        hint = self.font.render("ESC - Back", True, (255, 255, 255))
+        hint = render_text(self.font, "ESC - Back", (255, 255, 255))
         hint_rect = hint.get_rect(bottomright=(self.screen.get_width() - 20, 
                                              self.screen.get_height() - 20))
         self.screen.blit(hint, hint_rect)
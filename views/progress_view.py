@@ -0,0 +1,61 @@
+import pygame
+from views.text_cache import render_text
+
+class ProgressView:
+    """Shown while a background job runs; keeps animating at frame rate"""
+    BAR_WIDTH = 600
+    BAR_HEIGHT = 24
+
+    def __init__(self, screen, font, title, return_view=None):
+        self.screen = screen
+        self.font = font
+        self.title = title
+        self.return_view = return_view  # Where to go back to if the job fails
+        self.fraction = 0.0
+        self.message = ""
+        self.error = None
+
+    @property
+    def dirty(self):
+        # The spinner moves every frame while the job runs
+        return self.error is None
+
+    def update(self, fraction, message=None):
+        self.fraction = max(0.0, min(1.0, fraction))
+        if message:
+            self.message = message
+
+    def fail(self, error):
+        self.error = error
+
+    def handle_input(self, key):
+        # Input is ignored until the job ends; after a failure any key goes back
+        if self.error is not None:
+            return "BACK"
+        return None
+
+    def draw(self):
+        center_x = self.screen.get_width() // 2
+        center_y = self.screen.get_height() // 2
+        title = render_text(self.font, self.title, (255, 255, 255))
+        self.screen.blit(title, title.get_rect(center=(center_x, center_y - 80)))
+
+        if self.error is not None:
+            text = render_text(self.font, f"Failed: {self.error}", (255, 0, 0))
+            self.screen.blit(text, text.get_rect(center=(center_x, center_y)))
+            hint = render_text(self.font, "Press any key to return", (255, 255, 255))
+            self.screen.blit(hint, hint.get_rect(center=(center_x, center_y + 60)))
+            return
+
+        # Progress bar
+        bar = pygame.Rect(0, 0, self.BAR_WIDTH, self.BAR_HEIGHT)
+        bar.center = (center_x, center_y)
+        pygame.draw.rect(self.screen, (255, 255, 255), bar, 2)
+        filled = bar.inflate(-6, -6)
+        filled.width = int(filled.width * self.fraction)
+        if filled.width > 0:
+            pygame.draw.rect(self.screen, (0, 255, 0), filled)
+
+        spinner = "|/-\\"[(pygame.time.get_ticks() // 120) % 4]
+        message = render_text(self.font, f"{self.message} {spinner}", (255, 255, 0))
+        self.screen.blit(message, message.get_rect(center=(center_x, center_y + 50)))
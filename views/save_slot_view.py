@@ -0,0 +1,71 @@
+import time
+import pygame
+from views.text_cache import render_text
+from database.save_manager import SaveManager
+
+class SaveSlotView:
+    """Pick a save slot to save into (mode 'save') or load from (mode 'load').
+
+    Returns ("SAVE", slot) or ("LOAD", slot); the game runs the actual save
+    or load as a background job.
+    """
+
+    def __init__(self, screen, font, db, mode='save', team_id=None, save_manager=None):
+        self.screen = screen
+        self.font = font
+        self.db = db
+        self.mode = mode
+        self.team_id = team_id
+        self.save_manager = save_manager or SaveManager(db)
+        self.selected_index = 0
+        self.message = ""
+        self.refresh_slots()
+
+    def refresh_slots(self):
+        self.slots = self.save_manager.list_slots()
+        self.labels = [self.slot_label(i + 1, info) for i, info in enumerate(self.slots)]
+
+    @staticmethod
+    def slot_label(number, info):
+        if info is None:
+            return f"Slot {number} - empty"
+        if 'error' in info:
+            return f"Slot {number} - unreadable"
+        saved_at = time.strftime('%Y-%m-%d %H:%M', time.localtime(info['saved_at']))
+        return f"Slot {number} - Season {info['season'] or 1} - {saved_at}"
+
+    def handle_input(self, key):
+        if key == pygame.K_UP:
+            self.selected_index = (self.selected_index - 1) % len(self.slots)
+        elif key == pygame.K_DOWN:
+            self.selected_index = (self.selected_index + 1) % len(self.slots)
+        elif key == pygame.K_ESCAPE:
+            return "BACK"
+        elif key == pygame.K_RETURN:
+            slot = str(self.selected_index + 1)
+            if self.mode == 'save':
+                return ("SAVE", slot)
+            elif self.slots[self.selected_index] is None:
+                self.message = "That slot is empty"
+            else:
+                return ("LOAD", slot)
+        return None
+
+    def draw(self):
+        center_x = self.screen.get_width() // 2
+        title = render_text(self.font, "SAVE GAME" if self.mode == 'save' else "LOAD GAME", (255, 255, 255))
+        self.screen.blit(title, title.get_rect(center=(center_x, 50)))
+
+        start_y = 150
+        spacing = 50
+        for i, label in enumerate(self.labels):
+            color = (255, 255, 0) if i == self.selected_index else (255, 255, 255)
+            text = render_text(self.font, label, color)
+            self.screen.blit(text, text.get_rect(center=(center_x, start_y + i * spacing)))
+
+        if self.message:
+            text = render_text(self.font, self.message, (0, 255, 0))
+            self.screen.blit(text, text.get_rect(center=(center_x, start_y + len(self.labels) * spacing + 40)))
+
+        instructions = render_text(self.font, "RETURN to choose a slot, ESC to return", (255, 255, 255))
+        self.screen.blit(instructions, instructions.get_rect(center=(center_x, 730)))
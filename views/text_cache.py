@@ -0,0 +1,57 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (text, color, font).
+
+    Menus, headers and player rows are the same few strings every frame,
+    so each is rendered once and blitted from the cache afterwards.
+    """
+
+    def __init__(self, max_size=2048):
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (text, tuple(color), font, antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+# Shared by every view
+text_cache = TextCache()
+
+
+def render_text(font, text, color):
+    """Render antialiased text through the shared cache"""
+    return text_cache.render(font, text, color)
+
+
+# (path, size) -> pygame Font, so every caller shares one loaded font
+_fonts = {}
+
+
+def load_font(path, size):
+    """Load a font file once per size; only the font module is initialised"""
+    font = _fonts.get((path, size))
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = _fonts[(path, size)] = pygame.font.Font(path, size)
+    return font
@@ -0,0 +1,116 @@
+import pygame
+from views.text_cache import render_text
+from controllers.transfer_market import TransferMarket
+from database.database import FootballDB
+
+class TransferView:
+    VISIBLE_ROWS = 14
+    RESULT_LIMIT = 100
+    POSITION_FILTERS = [None, 'GK', 'DEF', 'MID', 'ATT']
+
+    def __init__(self, screen, font, team_id, db=None):
+        self.screen = screen
+        self.font = font
+        self.team_id = team_id
+        self.db = db or FootballDB.shared()
+        self.market = TransferMarket(self.db)
+        self.position_index = 0
+        self.free_agents = False
+        self.affordable = True
+        self.message = ""
+        self.headers = ["Name", "Pos", "Age", "Club", "Rating", "Fee"]
+        self.column_x = [50, 400, 470, 540, 800, 880]
+        self.refresh()
+
+    def refresh(self):
+        """Re-run the search for the current filters"""
+        with self.db.connect_readonly() as conn:
+            self.finances = conn.execute("SELECT finances FROM teams WHERE id = ?", (self.team_id,)).fetchone()[0]
+        self.players = self.market.search(
+            limit=self.RESULT_LIMIT, free_agents=self.free_agents,
+            position=self.POSITION_FILTERS[self.position_index],
+            max_value=self.finances if self.affordable and not self.free_agents else None,
+            exclude_team_id=self.team_id)
+        # Row text only changes with the search, so build it once per search
+        self.rows = [self.format_row(player) for player in self.players]
+        self.selected_index = 0
+        self.scroll_offset = 0
+
+    def format_row(self, player):
+        fee = TransferMarket.asking_price(player['value'], player['team_id'])
+        return [f"{player['first_name']} {player['last_name']}", player['position'], str(player['age']),
+                (player['team'] or "Free agent")[:20], str(int(round(player['rating'] or 0))), f"{fee:,}"]
+
+    def handle_input(self, key):
+        if key == pygame.K_ESCAPE:
+            return "BACK"
+        elif key == pygame.K_UP:
+            if self.selected_index > 0:
+                self.selected_index -= 1
+                if self.selected_index < self.scroll_offset:
+                    self.scroll_offset = self.selected_index
+        elif key == pygame.K_DOWN:
+            if self.selected_index < len(self.rows) - 1:
+                self.selected_index += 1
+                if self.selected_index >= self.scroll_offset + self.VISIBLE_ROWS:
+                    self.scroll_offset = self.selected_index - self.VISIBLE_ROWS + 1
+        elif key in (pygame.K_LEFT, pygame.K_RIGHT):
+            step = 1 if key == pygame.K_RIGHT else -1
+            self.position_index = (self.position_index + step) % len(self.POSITION_FILTERS)
+            self.message = ""
+            self.refresh()
+        elif key == pygame.K_f:
+            self.free_agents = not self.free_agents
+            self.message = ""
+            self.refresh()
+        elif key == pygame.K_a:
+            self.affordable = not self.affordable
+            self.message = ""
+            self.refresh()
+        elif key == pygame.K_RETURN and self.players:
+            player = self.players[self.selected_index]
+            try:
+                transfer = self.market.buy(player['id'], self.team_id)
+                self.message = f"Signed {player['first_name']} {player['last_name']} for {transfer['fee']:,}"
+            except ValueError as e:
+                self.message = str(e)
+            selected = self.selected_index
+            self.refresh()
+            self.selected_index = min(selected, max(0, len(self.rows) - 1))
+            self.scroll_offset = max(0, min(self.scroll_offset, self.selected_index))
+        return None
+
+    def draw(self):
+        # Draw title
+        title = render_text(self.font, "TRANSFER MARKET", (255, 255, 255))
+        title_rect = title.get_rect(center=(self.screen.get_width() // 2, 30))
+        self.screen.blit(title, title_rect)
+
+        # Budget and filters
+        position = self.POSITION_FILTERS[self.position_index] or "ALL"
+        status = (f"Budget: {self.finances:,}   Position: {position}   "
+                  f"{'Free agents' if self.free_agents else 'Affordable only' if self.affordable else 'All clubs'}")
+        self.screen.blit(render_text(self.font, status, (255, 255, 0)), (50, 70))
+
+        for header, x in zip(self.headers, self.column_x):
+            self.screen.blit(render_text(self.font, header, (255, 255, 255)), (x, 110))
+
+        if not self.rows:
+            text = render_text(self.font, "No players match", (255, 255, 255))
+            self.screen.blit(text, text.get_rect(center=(self.screen.get_width() // 2, 200)))
+
+        spacing = 36
+        visible = self.rows[self.scroll_offset:self.scroll_offset + self.VISIBLE_ROWS]
+        for i, row in enumerate(visible):
+            color = (255, 255, 0) if self.scroll_offset + i == self.selected_index else (255, 255, 255)
+            y = 150 + i * spacing
+            for value, x in zip(row, self.column_x):
+                self.screen.blit(render_text(self.font, value, color), (x, y))
+
+        if self.message:
+            text = render_text(self.font, self.message, (0, 255, 0))
+            self.screen.blit(text, text.get_rect(center=(self.screen.get_width() // 2, 675)))
+
+        hints = render_text(self.font, "LEFT/RIGHT position  A affordable  F free agents  RETURN buy  ESC back",
+                            (255, 255, 255))
+        self.screen.blit(hints, hints.get_rect(center=(self.screen.get_width() // 2, 730)))
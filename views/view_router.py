@@ -0,0 +1,43 @@
+from typing import Any, Callable, Dict, Hashable, Iterable
+
+
+class ViewRouter:
+    """Builds views on demand and keeps them for when the player comes back.
+
+    Views are cached per (view class name, key), where the key is the team
+    or division id the view shows. Naming views rather than passing classes
+    lets a view module stay unimported until it is first shown. A cached view is reused until the
+    database's data version moves on (a commit from any connection or a
+    change to the in-memory player store); the next request then rebuilds
+    it. Static views such as menus hold no game data and are never rebuilt,
+    so they also keep their cursor position.
+    """
+
+    def __init__(self, db, factories: Dict[str, Callable[[Any], Any]], static: Iterable[str] = ()):
+        self.db = db
+        self.factories = factories  # view class name -> factory(key)
+        self.static = set(static)
+        self.views = {}  # (view class name, key) -> (view, data version it was built at)
+        self.hits = 0
+        self.builds = 0
+
+    def show(self, view_name: str, key: Hashable = None):
+        """Return the cached view for (view_name, key), rebuilding it if stale"""
+        cache_key = (view_name, key)
+        entry = self.views.get(cache_key)
+        if entry is not None and view_name in self.static:
+            self.hits += 1
+            return entry[0]
+        version = self.db.data_version()
+        if entry is not None and entry[1] == version:
+            self.hits += 1
+            return entry[0]
+        view = self.factories[view_name](key)
+        # Read again: building may itself load the player store or refresh ratings
+        self.views[cache_key] = (view, self.db.data_version())
+        self.builds += 1
+        return view
+
+    def clear(self):
+        """Forget every cached view, e.g. after a different game was loaded"""
+        self.views.clear()
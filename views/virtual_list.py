@@ -0,0 +1,138 @@
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import pygame
+from views.text_cache import render_text
+
+
+class VirtualList:
+    """Cursor, scrolling and row rendering for lists of any length.
+
+    Items are split into sections (start, stop, visible rows), each with its
+    own scroll offset, and one cursor moves through them in order. Only the
+    visible rows of a section are drawn, each from one surface that is
+    composed the first time the row is shown in a given color; the view
+    calls invalidate_row when an item's text changes. UP/DOWN, PAGEUP/
+    PAGEDOWN and HOME/END move the cursor, and typing letters jumps to the
+    next item whose label starts with them.
+    """
+    JUMP_TIMEOUT = 1.0  # Seconds before typed letters start a new prefix
+
+    def __init__(self, items: Sequence, visible_rows: int, font,
+                 format_row: Callable[[object], Sequence[str]],
+                 columns: Sequence[int] = (0,), label: Optional[Callable[[object], str]] = None,
+                 sections: Optional[List[Tuple[int, int, int]]] = None):
+        self.items = items
+        self.font = font
+        self.format_row = format_row
+        self.columns = columns  # x offset of each formatted column within the row
+        self.sections = sections or [(0, len(items), visible_rows)]
+        self.scroll_offsets = [start for start, _, _ in self.sections]
+        self.selected_index = 0
+        self.rows = {}  # (index, color) -> composed row surface
+        # Lowercased labels for type-to-jump, and the indexes starting with each letter
+        label = label or (lambda item: format_row(item)[0])
+        self.labels = [label(item).lower() for item in items]
+        self.initials = {}
+        for index, text in enumerate(self.labels):
+            self.initials.setdefault(text[:1], []).append(index)
+        self.typed = ""
+        self.typed_at = 0.0
+
+    def __len__(self):
+        return len(self.items)
+
+    @property
+    def selected(self):
+        """The item under the cursor, or None for an empty list"""
+        return self.items[self.selected_index] if self.items else None
+
+    def section_of(self, index: int) -> int:
+        for number, (start, stop, _) in enumerate(self.sections):
+            if start <= index < stop:
+                return number
+        return 0
+
+    def select(self, index: int):
+        """Move the cursor to index and scroll its section to show it"""
+        if not self.items:
+            return
+        self.selected_index = max(0, min(index, len(self.items) - 1))
+        number = self.section_of(self.selected_index)
+        start, stop, rows = self.sections[number]
+        offset = self.scroll_offsets[number]
+        if self.selected_index < offset:
+            offset = self.selected_index
+        elif self.selected_index >= offset + rows:
+            offset = self.selected_index - rows + 1
+        self.scroll_offsets[number] = max(start, min(offset, stop - rows))
+
+    def handle_key(self, key) -> bool:
+        """Apply a navigation or type-to-jump key; returns True if it was one"""
+        page = self.sections[self.section_of(self.selected_index)][2]
+        if key == pygame.K_UP:
+            self.select(self.selected_index - 1)
+        elif key == pygame.K_DOWN:
+            self.select(self.selected_index + 1)
+        elif key == pygame.K_PAGEUP:
+            self.select(self.selected_index - page)
+        elif key == pygame.K_PAGEDOWN:
+            self.select(self.selected_index + page)
+        elif key == pygame.K_HOME:
+            self.select(0)
+        elif key == pygame.K_END:
+            self.select(len(self.items) - 1)
+        elif pygame.K_a <= key <= pygame.K_z or pygame.K_0 <= key <= pygame.K_9:
+            self.jump(chr(key))
+        else:
+            return False
+        return True
+
+    def jump(self, char: str):
+        """Extend the typed prefix and select the next item whose label matches"""
+        now = time.monotonic()
+        if now - self.typed_at > self.JUMP_TIMEOUT:
+            self.typed = ""
+        self.typed_at = now
+        # Typing the same letter again cycles through items starting with it
+        cycling = self.typed == char
+        self.typed = char if cycling else self.typed + char
+        candidates = self.initials.get(self.typed[0], ())
+        if not candidates:
+            return
+        first = self.selected_index + 1 if cycling else self.selected_index
+        matches = [i for i in candidates if self.labels[i].startswith(self.typed)]
+        if matches:
+            self.select(next((i for i in matches if i >= first), matches[0]))
+
+    def visible(self, section: int = 0) -> range:
+        """Indexes of the rows currently shown in a section"""
+        start, stop, rows = self.sections[section]
+        offset = self.scroll_offsets[section]
+        return range(offset, min(offset + rows, stop))
+
+    def can_scroll_up(self, section: int = 0) -> bool:
+        return self.scroll_offsets[section] > self.sections[section][0]
+
+    def can_scroll_down(self, section: int = 0) -> bool:
+        start, stop, rows = self.sections[section]
+        return self.scroll_offsets[section] + rows < stop
+
+    def row_surface(self, index: int, color) -> pygame.Surface:
+        """The row for items[index] in color, composed once and then reused"""
+        key = (index, tuple(color))
+        surface = self.rows.get(key)
+        if surface is None:
+            texts = [render_text(self.font, value, color) for value in self.format_row(self.items[index])]
+            width = max((x + text.get_width() for x, text in zip(self.columns, texts)), default=0)
+            height = max((text.get_height() for text in texts), default=0)
+            surface = pygame.Surface((max(width, 1), max(height, 1)), pygame.SRCALPHA)
+            for x, text in zip(self.columns, texts):
+                surface.blit(text, (x, 0))
+            self.rows[key] = surface
+        return surface
+
+    def invalidate_row(self, index: int):
+        """Forget the composed surfaces of a row whose text has changed"""
+        for key in [key for key in self.rows if key[0] == index]:
+            del self.rows[key]